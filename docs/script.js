@@ -19,13 +19,12 @@ document.addEventListener('DOMContentLoaded', async () => {
     // Animate hero stats
     animateHeroStats();
 
-    // Render initial content
+    // Render content available from the index; the challenges and matrix
+    // tabs fetch their shards the first time they are opened.
     renderLeaderboard();
-    renderChallenges();
     renderTools();
-    renderMatrix();
 
-    // Compute breakdown data client-side and render
+    // Breakdown is precomputed in the index (computed client-side for older data)
     computeMetricsBreakdown();
     renderMetricsBreakdown();
 
@@ -57,9 +56,9 @@ function animateHeroStats() {
     const toolCount = benchmarkData.tools.length;
     const stats = [
         { selector: '#tools-count', target: toolCount, duration: 800 },
-        { selector: '#challenges-count', target: benchmarkData.metadata.challenges_count || benchmarkData.challenges?.length || 10, duration: 1000 },
+        { selector: '#challenges-count', target: benchmarkData.metadata.challenges_count || 10, duration: 1000 },
         { selector: '#runs-count', target: (benchmarkData.metadata.total_runs || 1) * toolCount * (benchmarkData.metadata.challenges_count || 10), duration: 1200 },
-        { selector: '#issues-count', target: benchmarkData.challenges?.reduce((sum, ch) => sum + (ch.ground_truth_issues || 0), 0) || 41, duration: 1400 }
+        { selector: '#issues-count', target: benchmarkData.metadata.ground_truth_issues_count || 41, duration: 1400 }
     ];
 
     stats.forEach(stat => {
@@ -80,32 +79,69 @@ function animateHeroStats() {
 }
 
 // ===== Data Loading =====
+// The dashboard data is split into a small index (leaderboard, tool metadata,
+// precomputed breakdowns) and content-hashed shards fetched on demand.
+const shardCache = {};
+
+function fetchJson(url) {
+    // Try fetch first (works on HTTP servers, GitHub Pages, etc.)
+    return fetch(url)
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .catch(() => new Promise((resolve, reject) => {
+            // Fallback for file:// protocol (CORS blocks fetch for local files)
+            const xhr = new XMLHttpRequest();
+            xhr.open('GET', url, true);
+            xhr.onload = () => {
+                if (xhr.status === 0 || xhr.status === 200) {
+                    resolve(JSON.parse(xhr.responseText));
+                } else {
+                    reject(new Error(`HTTP ${xhr.status}`));
+                }
+            };
+            xhr.onerror = () => reject(new Error('XHR failed'));
+            xhr.send();
+        }));
+}
+
+function loadShard(path) {
+    // Shard names are content-hashed, so a cached copy never goes stale
+    if (!shardCache[path]) {
+        shardCache[path] = fetchJson(`data/${path}`);
+    }
+    return shardCache[path];
+}
+
 async function loadBenchmarkData() {
     try {
-        // Try fetch first (works on HTTP servers, GitHub Pages, etc.)
-        const response = await fetch('data/benchmark-results.json');
-        benchmarkData = await response.json();
-    } catch (fetchError) {
-        // Fallback for file:// protocol (CORS blocks fetch for local files)
-        try {
-            benchmarkData = await new Promise((resolve, reject) => {
-                const xhr = new XMLHttpRequest();
-                xhr.open('GET', 'data/benchmark-results.json', true);
-                xhr.onload = () => {
-                    if (xhr.status === 0 || xhr.status === 200) {
-                        resolve(JSON.parse(xhr.responseText));
-                    } else {
-                        reject(new Error(`HTTP ${xhr.status}`));
-                    }
-                };
-                xhr.onerror = () => reject(new Error('XHR failed'));
-                xhr.send();
-            });
-        } catch (xhrError) {
-            console.error('Failed to load benchmark data:', xhrError);
-            showError('Failed to load data. If opening locally, run: python3 -m http.server 8000 --directory docs');
-        }
+        benchmarkData = await fetchJson('data/index.json');
+        benchmarkData.challenges = null;
+        benchmarkData.results = null;
+    } catch (error) {
+        console.error('Failed to load benchmark data:', error);
+        showError('Failed to load data. If opening locally, run: python3 -m http.server 8000 --directory docs');
+    }
+}
+
+async function ensureChallenges() {
+    if (!benchmarkData.challenges) {
+        const shard = await loadShard(benchmarkData.shards.challenges);
+        benchmarkData.challenges = shard.challenges;
     }
+    return benchmarkData.challenges;
+}
+
+async function ensureResults() {
+    // Only the matrix view needs every tool × challenge result
+    if (!benchmarkData.results) {
+        const shards = await Promise.all(
+            Object.values(benchmarkData.shards.tools).map(path => loadShard(path))
+        );
+        benchmarkData.results = shards.flatMap(shard => shard.results);
+    }
+    return benchmarkData.results;
 }
 
 // ===== Tab Management =====
@@ -123,10 +159,32 @@ function initTabs() {
 
             button.classList.add('active');
             document.getElementById(targetTab).classList.add('active');
+
+            renderLazyTab(targetTab);
         });
     });
 }
 
+const renderedLazyTabs = new Set();
+
+async function renderLazyTab(tab) {
+    if (renderedLazyTabs.has(tab)) return;
+    try {
+        if (tab === 'challenges') {
+            await ensureChallenges();
+            renderChallenges();
+        } else if (tab === 'matrix') {
+            await Promise.all([ensureChallenges(), ensureResults()]);
+            renderMatrix();
+        } else {
+            return;
+        }
+        renderedLazyTabs.add(tab);
+    } catch (error) {
+        showError(`Failed to load ${tab} data: ${error}`);
+    }
+}
+
 // ===== Metric Selector =====
 function initMetricSelector() {
     const metricSelect = document.getElementById('metric-select');
@@ -267,12 +325,9 @@ function renderChallenges() {
     const container = document.getElementById('challenges-grid');
 
     container.innerHTML = benchmarkData.challenges.map(challenge => {
-        // Calculate average performance across all tools
-        const challengeResults = benchmarkData.results.filter(r => r.challenge === challenge.id);
-        const avgF1 = challengeResults.length > 0 ? challengeResults.reduce((sum, r) => sum + r.metrics.f1_score, 0) / challengeResults.length : 0;
-        const bestTool = challengeResults.length > 0 ? challengeResults.reduce((best, r) =>
-            r.metrics.f1_score > best.metrics.f1_score ? r : best
-        ) : { tool: 'N/A' };
+        // Average and best tool are precomputed per challenge in the shard
+        const avgF1 = challenge.avg_f1 || 0;
+        const bestTool = { tool: challenge.best_tool || 'N/A' };
 
         return `
             <div class="challenge-card" onclick="showChallengeDetails('${challenge.id}')">
@@ -469,9 +524,9 @@ function initModal() {
     });
 }
 
-function showChallengeDetails(challengeId) {
+async function showChallengeDetails(challengeId) {
     const challenge = benchmarkData.challenges.find(c => c.id === challengeId);
-    const results = benchmarkData.results.filter(r => r.challenge === challengeId);
+    const { results } = await loadShard(challenge.shard);
 
     let html = `
         <h2>${challenge.name}</h2>
@@ -1,139 +1,325 @@
 #!/usr/bin/env python3
-"""Process benchmark results to maintain historical data."""
-
-import json
+"""Process benchmark results to maintain historical data.
+
+History is kept as an append-only JSONL time-series of per-tool and
+per-challenge metrics (``docs/data/history/metrics.jsonl``) that is never
+truncated.  Alongside it, ``rollups.json`` holds running sums for weekly,
+monthly and quarterly buckets plus a small per-tool trend window, so adding a
+run touches only the buckets it falls into instead of rescanning the series.
+``historical.json`` is a downsampled export with just what the dashboard
+renders.
+
+Records are appended before ``rollups.json`` is saved. If processing stops
+in between, the next run finds the report's records already at the end of
+the store and appends only the missing ones, while the rollups (saved
+atomically, after the append) are updated exactly once.
+"""
+
+import os
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
+
+from code_review_benchmark.serialization import dumps, loads, read_json, write_json
+
+# Number of most recent runs per tool used for trend calculation
+TREND_WINDOW = 4
+
+# How many buckets of each rollup period to export for the dashboard
+EXPORT_BUCKETS = {'weekly': 26, 'monthly': 24, 'quarterly': 40}
+
+# Overall (all-challenge) metrics are stored under this challenge key
+OVERALL = '*'
 
-# Maximum number of historical entries to keep
-MAX_HISTORY_ENTRIES = 52  # One year of weekly runs
+_METRIC_KEYS = ('f1_score', 'precision', 'recall')
+
+_BLOCK = 64 * 1024
 
 
 def load_json_file(path: Path) -> Dict[str, Any]:
     """Load JSON file safely."""
     if path.exists():
-        with open(path, 'r') as f:
-            return json.load(f)
+        return read_json(path)
     return {}
 
 
 def save_json_file(path: Path, data: Dict[str, Any]) -> None:
-    """Save data to JSON file."""
+    """Save data to JSON file atomically."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    write_json(tmp, data)
+    tmp.replace(path)
+
+
+def extract_records(report: Dict[str, Any], timestamp: str) -> List[Dict[str, Any]]:
+    """Flatten an evaluator report.json into per-tool and per-challenge records."""
+    records: List[Dict[str, Any]] = []
+    date = timestamp[:10]
+
+    for tool_score in report.get('tools', []):
+        tool = tool_score['tool']
+        summaries = challenge_summaries(tool_score)
+        records.append({
+            'timestamp': timestamp,
+            'date': date,
+            'tool': tool,
+            'challenge': OVERALL,
+            'f1_score': tool_score.get('mean_f1', 0.0),
+            'precision': tool_score.get('mean_precision', 0.0),
+            'recall': tool_score.get('mean_recall', 0.0),
+            'runs': sum(s['runs'] for s in summaries),
+        })
+
+        # One point per challenge, averaged over its runs
+        for summary in summaries:
+            records.append({
+                'timestamp': timestamp,
+                'date': date,
+                'tool': tool,
+                'challenge': summary['challenge_id'],
+                'f1_score': summary['f1'],
+                'precision': summary['precision'],
+                'recall': summary['recall'],
+                'runs': summary['runs'],
+            })
+
+    return records
+
+
+def challenge_summaries(tool_score: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-challenge means of a report tool entry.
+
+    Reports carry them in ``challenge_summaries``, with or without per-run
+    results; older reports only have the per-run ``per_challenge``.
+    """
+    if tool_score.get('challenge_summaries'):
+        return tool_score['challenge_summaries']
+    by_challenge: Dict[str, List[Dict[str, Any]]] = {}
+    for pc in tool_score.get('per_challenge', []):
+        by_challenge.setdefault(pc['challenge_id'], []).append(pc)
+    return [
+        {
+            'challenge_id': cid,
+            'runs': len(runs),
+            **{k: round(sum(r[k] for r in runs) / len(runs), 4)
+               for k in ('f1', 'precision', 'recall')},
+        }
+        for cid, runs in sorted(by_challenge.items())
+    ]
+
+
+def append_records(store_file: Path, records: Iterable[Dict[str, Any]]) -> int:
+    """Append records to the JSONL store. Never rewrites existing lines."""
+    store_file.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(store_file, 'ab') as f:
+        for record in records:
+            f.write(dumps(record) + b'\n')
+            count += 1
+    return count
+
+
+def _reversed_lines(path: Path) -> Iterable[bytes]:
+    """Non-empty lines of *path* from last to first, read from the end in blocks."""
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        rest = b''
+        while end > 0:
+            start = max(0, end - _BLOCK)
+            f.seek(start)
+            lines = (f.read(end - start) + rest).split(b'\n')
+            rest = lines.pop(0)
+            yield from (line for line in reversed(lines) if line)
+            end = start
+        if rest:
+            yield rest
+
+
+def trim_partial_line(store_file: Path) -> None:
+    """Drop a last line left incomplete by an interrupted append."""
+    if not store_file.exists() or store_file.stat().st_size == 0:
+        return
+    with open(store_file, 'rb+') as f:
+        end = f.seek(-1, os.SEEK_END) + 1
+        if f.read(1) == b'\n':
+            return
+        keep = 0
+        while end > 0:
+            start = max(0, end - _BLOCK)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b'\n')
+            if newline >= 0:
+                keep = start + newline + 1
+                break
+            end = start
+        f.truncate(keep)
+
+
+def stored_keys(store_file: Path, timestamp: str) -> set:
+    """``(tool, challenge)`` of the records for *timestamp* at the end of the store."""
+    keys = set()
+    if not store_file.exists():
+        return keys
+    for line in _reversed_lines(store_file):
+        record = loads(line)
+        if record['timestamp'] != timestamp:
+            break
+        keys.add((record['tool'], record['challenge']))
+    return keys
+
+
+def bucket_keys(date: str) -> Dict[str, str]:
+    """Return the weekly/monthly/quarterly bucket a YYYY-MM-DD date falls into."""
+    d = datetime.strptime(date, '%Y-%m-%d')
+    iso_year, iso_week, _ = d.isocalendar()
+    return {
+        'weekly': f'{iso_year}-W{iso_week:02d}',
+        'monthly': f'{d.year}-{d.month:02d}',
+        'quarterly': f'{d.year}-Q{(d.month - 1) // 3 + 1}',
+    }
+
 
+def update_rollups(state: Dict[str, Any], records: List[Dict[str, Any]]) -> None:
+    """Fold new overall records into the rollup sums and trend windows in place."""
+    rollups = state.setdefault('rollups', {period: {} for period in EXPORT_BUCKETS})
+    windows = state.setdefault('trend_windows', {})
 
-def extract_metrics(report: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract key metrics from a benchmark report."""
-    metrics = {}
+    for record in records:
+        if record['challenge'] != OVERALL:
+            continue
+        tool = record['tool']
+        for period, key in bucket_keys(record['date']).items():
+            bucket = rollups.setdefault(period, {}).setdefault(key, {})
+            acc = bucket.setdefault(tool, {'count': 0, **{k: 0.0 for k in _METRIC_KEYS}})
+            acc['count'] += 1
+            for k in _METRIC_KEYS:
+                acc[k] += record[k]
 
-    # Extract overall scores
-    if 'overall_scores' in report:
-        for tool_score in report['overall_scores']:
-            tool_name = tool_score['tool']
-            metrics[tool_name] = {
-                'f1_score': tool_score['metrics']['avg_f1_score'],
-                'precision': tool_score['metrics']['avg_precision'],
-                'recall': tool_score['metrics']['avg_recall'],
-                'response_time_ms': tool_score['metrics']['avg_response_time_ms'],
-                'success_rate': tool_score['metrics'].get('success_rate', 1.0)
-            }
+        window = deque(windows.get(tool, []), maxlen=TREND_WINDOW)
+        window.append({k: record[k] for k in _METRIC_KEYS})
+        windows[tool] = list(window)
 
-    return metrics
+
+def calculate_trends(windows: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Calculate performance trends from each tool's recent-run window."""
+    trends = {}
+    for tool, window in windows.items():
+        if len(window) < 2:
+            continue
+        first = window[0]
+        last = window[-1]
+        trends[tool] = {
+            'f1_score_change': last['f1_score'] - first['f1_score'],
+            'precision_change': last['precision'] - first['precision'],
+            'recall_change': last['recall'] - first['recall'],
+            'direction': 'improving' if last['f1_score'] > first['f1_score'] else 'declining'
+        }
+    return trends
+
+
+def export_series(state: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Downsample the rollups to the most recent buckets of each period."""
+    series: Dict[str, List[Dict[str, Any]]] = {}
+    for period, limit in EXPORT_BUCKETS.items():
+        buckets = state.get('rollups', {}).get(period, {})
+        points = []
+        for key in sorted(buckets)[-limit:]:
+            points.append({
+                'date': key,
+                'metrics': {
+                    tool: {k: round(acc[k] / acc['count'], 4) for k in _METRIC_KEYS}
+                    for tool, acc in sorted(buckets[key].items())
+                },
+            })
+        series[period] = points
+    return series
+
+
+def _legacy_records(historical: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert entries from the old truncated historical.json into store records."""
+    records = []
+    for entry in historical.get('entries', []):
+        for tool, metrics in entry.get('metrics', {}).items():
+            records.append({
+                'timestamp': entry['timestamp'],
+                'date': entry.get('date', entry['timestamp'][:10]),
+                'tool': tool,
+                'challenge': OVERALL,
+                **{k: metrics.get(k, 0.0) for k in _METRIC_KEYS},
+                'runs': 0,
+            })
+    return records
+
+
+def record_report(report: Dict[str, Any], data_dir: Path) -> Optional[int]:
+    """Add a report to the history under *data_dir*.
+
+    Returns the number of records appended, or None if the report was
+    already recorded.
+    """
+    store_file = data_dir / 'history' / 'metrics.jsonl'
+    state_file = data_dir / 'history' / 'rollups.json'
+    historical_file = data_dir / 'historical.json'
+    state = load_json_file(state_file)
+
+    # First run with the new store: carry over whatever the old file still had
+    if 'last_timestamp' not in state:
+        legacy = _legacy_records(load_json_file(historical_file))
+        if not store_file.exists():
+            append_records(store_file, legacy)
+        update_rollups(state, legacy)
+
+    # The report timestamp identifies a run; re-processing it must not duplicate
+    timestamp = report.get('timestamp') or datetime.now(timezone.utc).isoformat()
+    if timestamp <= state.get('last_timestamp', ''):
+        return None
+
+    records = extract_records(report, timestamp)
+    trim_partial_line(store_file)
+    stored = stored_keys(store_file, timestamp)
+    appended = append_records(
+        store_file, [r for r in records if (r['tool'], r['challenge']) not in stored]
+    )
+    update_rollups(state, records)
+    state['last_timestamp'] = timestamp
+    state['total_runs'] = state.get('total_runs', 0) + 1
+    state.setdefault('oldest_run', timestamp)
+    save_json_file(state_file, state)
+
+    series = export_series(state)
+    historical = {
+        'recent_history': series['weekly'],
+        'series': series,
+        'trends': calculate_trends(state['trend_windows']),
+        'metadata': {
+            'last_updated': datetime.now(timezone.utc).isoformat(),
+            'total_runs': state['total_runs'],
+            'oldest_run': state['oldest_run'],
+            'newest_run': timestamp,
+        },
+    }
+    save_json_file(historical_file, historical)
+    return appended
 
 
 def process_historical_data():
     """Process latest benchmark results and update historical data."""
     project_root = Path(__file__).resolve().parents[1]
-
-    # Paths
     latest_report = project_root / 'results' / 'latest' / 'report.json'
-    historical_file = project_root / 'docs' / 'data' / 'historical.json'
+    data_dir = project_root / 'docs' / 'data'
 
     if not latest_report.exists():
         print("No latest report found, skipping historical processing")
         return
 
-    # Load latest report
     report = load_json_file(latest_report)
-
-    # Load existing historical data
-    historical = load_json_file(historical_file)
-    if 'entries' not in historical:
-        historical['entries'] = []
-
-    # Create new entry
-    timestamp = datetime.now(timezone.utc).isoformat()
-    new_entry = {
-        'timestamp': timestamp,
-        'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'),
-        'metrics': extract_metrics(report),
-        'metadata': {
-            'benchmark_version': report.get('metadata', {}).get('benchmark_version', '1.0.0'),
-            'num_runs': report.get('metadata', {}).get('num_runs', 3),
-            'challenges_count': len(report.get('challenges', [])),
-            'tools_count': len(report.get('overall_scores', []))
-        }
-    }
-
-    # Add to historical data
-    historical['entries'].append(new_entry)
-
-    # Keep only the most recent entries
-    if len(historical['entries']) > MAX_HISTORY_ENTRIES:
-        historical['entries'] = historical['entries'][-MAX_HISTORY_ENTRIES:]
-
-    # Calculate trends (last 4 weeks)
-    if len(historical['entries']) >= 2:
-        historical['trends'] = calculate_trends(historical['entries'][-4:])
-
-    # Update metadata
-    historical['metadata'] = {
-        'last_updated': timestamp,
-        'total_runs': len(historical['entries']),
-        'oldest_run': historical['entries'][0]['timestamp'] if historical['entries'] else None,
-        'newest_run': timestamp
-    }
-
-    # Save historical data
-    save_json_file(historical_file, historical)
-    print(f"Historical data updated with {len(historical['entries'])} entries")
-
-
-def calculate_trends(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate performance trends from historical entries."""
-    if len(entries) < 2:
-        return {}
-
-    trends = {}
-    tools = set()
-
-    # Get all tool names
-    for entry in entries:
-        tools.update(entry['metrics'].keys())
-
-    # Calculate trends for each tool
-    for tool in tools:
-        tool_data = []
-        for entry in entries:
-            if tool in entry['metrics']:
-                tool_data.append(entry['metrics'][tool])
-
-        if len(tool_data) >= 2:
-            first = tool_data[0]
-            last = tool_data[-1]
-
-            trends[tool] = {
-                'f1_score_change': last['f1_score'] - first['f1_score'],
-                'precision_change': last['precision'] - first['precision'],
-                'recall_change': last['recall'] - first['recall'],
-                'response_time_change': last['response_time_ms'] - first['response_time_ms'],
-                'direction': 'improving' if last['f1_score'] > first['f1_score'] else 'declining'
-            }
-
-    return trends
+    appended = record_report(report, data_dir)
+    if appended is None:
+        print(f"Report {report.get('timestamp')} already recorded, skipping")
+        return
+    total_runs = load_json_file(data_dir / 'history' / 'rollups.json')['total_runs']
+    print(f"Historical data updated: {appended} records appended ({total_runs} runs total)")
 
 
 if __name__ == '__main__':
@@ -1,16 +1,31 @@
 #!/usr/bin/env python3
 """Update dashboard data from latest benchmark results.
 
-Transforms the evaluator's report.json into the benchmark-results.json
-format expected by the docs/ UI.
+Transforms the evaluator's report.json into the dashboard format expected by
+the docs/ UI, then splits it into a small ``index.json`` (leaderboard, tool
+metadata, precomputed breakdowns) plus content-hashed per-tool and
+per-challenge shards that the frontend fetches on demand.
 """
 
-import json
+import gzip
+import hashlib
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import yaml
 
+from code_review_benchmark.serialization import dumps, read_json
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz siblings are written without it
+    brotli = None
+
+SHARDS_DIRNAME = "shards"
+INDEX_FILENAME = "index.json"
+
 # ── Tool metadata (enriched info not in report.json) ──
 
 TOOL_METADATA: Dict[str, Dict[str, Any]] = {
@@ -134,6 +149,40 @@ def tool_display_name(tool_id: str) -> str:
     return meta["display_name"] if meta else tool_id
 
 
+def challenge_rows(tool_entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One tool's per-challenge means, plus per-run F1 scores when the report has them.
+
+    ``per_challenge`` lists every run only in reports written with
+    ``crb evaluate --full-report``; ``challenge_summaries`` is always there
+    in current reports and has the means without the per-run scores.
+    """
+    per_challenge = tool_entry.get("per_challenge", [])
+    if not per_challenge:
+        return [
+            {**summary, "runs": None} for summary in tool_entry.get("challenge_summaries", [])
+        ]
+
+    by_challenge: Dict[str, List[Dict[str, Any]]] = {}
+    for pc in per_challenge:
+        by_challenge.setdefault(pc["challenge_id"], []).append(pc)
+
+    rows: List[Dict[str, Any]] = []
+    for cid, runs in sorted(by_challenge.items()):
+        n = len(runs)
+        rows.append({
+            "challenge_id": cid,
+            "precision": sum(r["precision"] for r in runs) / n,
+            "recall": sum(r["recall"] for r in runs) / n,
+            "f1": sum(r["f1"] for r in runs) / n,
+            "findings": sum(r["findings"] for r in runs) / n,
+            "matched": sum(1 for r in runs for m in r["matches"] if m["matched"]) / n,
+            "ground_truths": sum(len(r["matches"]) for r in runs) / n,
+            # Per-run F1 scores for the "run consistency" display
+            "runs": [{"f1_score": r["f1"]} for r in runs] if n > 1 else None,
+        })
+    return rows
+
+
 def transform_report(
     report: Dict[str, Any],
     challenges_meta: Dict[str, Dict[str, Any]],
@@ -192,7 +241,6 @@ def transform_report(
             })
 
     # ── Results (flat per-tool-per-challenge) ──
-    # Report has tools[].per_challenge[] with multiple runs per challenge.
     # UI expects one result per tool × challenge, averaged across runs.
     results: List[Dict[str, Any]] = []
     overall_scores: List[Dict[str, Any]] = []
@@ -200,58 +248,31 @@ def transform_report(
     for t in tool_entries:
         tool_id = t["tool"]
         display = tool_display_name(tool_id)
-        per_challenge = t.get("per_challenge", [])
-
-        # Group per_challenge entries by challenge_id (may have multiple runs)
-        by_challenge: Dict[str, List[Dict[str, Any]]] = {}
-        for pc in per_challenge:
-            cid = pc["challenge_id"]
-            by_challenge.setdefault(cid, []).append(pc)
 
         total_tp = 0
         total_fp = 0
         total_fn = 0
 
-        for cid, runs in sorted(by_challenge.items()):
-            # Average metrics across runs
-            avg_precision = sum(r["precision"] for r in runs) / len(runs)
-            avg_recall = sum(r["recall"] for r in runs) / len(runs)
-            avg_f1 = sum(r["f1"] for r in runs) / len(runs)
-
-            # Sum counts across runs, then average
-            total_findings = sum(r["findings"] for r in runs) / len(runs)
-            matched_per_run = [
-                sum(1 for m in r["matches"] if m["matched"])
-                for r in runs
-            ]
-            gt_per_run = [len(r["matches"]) for r in runs]
-            avg_tp = sum(matched_per_run) / len(runs)
-            avg_gt = sum(gt_per_run) / len(runs)
-            avg_fp = total_findings - avg_tp
-            avg_fn = avg_gt - avg_tp
-
-            tp = round(avg_tp)
-            fp = round(avg_fp)
-            fn = round(avg_fn)
+        for row in challenge_rows(t):
+            tp = round(row["matched"])
+            fp = round(row["findings"] - row["matched"])
+            fn = round(row["ground_truths"] - row["matched"])
 
             total_tp += tp
             total_fp += fp
             total_fn += fn
 
-            # Per-run F1 scores for the "run consistency" display
-            run_scores = [{"f1_score": r["f1"]} for r in runs]
-
             results.append({
                 "tool": display,
-                "challenge": cid,
+                "challenge": row["challenge_id"],
                 "metrics": {
-                    "precision": round(avg_precision, 4),
-                    "recall": round(avg_recall, 4),
-                    "f1_score": round(avg_f1, 4),
+                    "precision": round(row["precision"], 4),
+                    "recall": round(row["recall"], 4),
+                    "f1_score": round(row["f1"], 4),
                     "true_positives": tp,
                     "false_positives": fp,
                     "false_negatives": fn,
-                    "runs": run_scores if len(runs) > 1 else None,
+                    "runs": row["runs"],
                 },
             })
 
@@ -277,12 +298,224 @@ def transform_report(
     }
 
 
+def compute_breakdown(
+    results: List[Dict[str, Any]], challenges: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Aggregate TP/FP/FN by challenge category and language.
+
+    Mirrors what the UI used to compute client-side from the full results list,
+    so the breakdown tab no longer needs every result on first paint.
+    """
+    challenge_map = {ch["id"]: ch for ch in challenges}
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {"category": {}, "language": {}}
+
+    for r in results:
+        ch = challenge_map.get(r["challenge"])
+        if not ch:
+            continue
+        language = ch.get("language") or "unknown"
+        for dim, key in (("category", ch["category"]), ("language", language)):
+            g = groups[dim].setdefault(key, {"tp": 0, "fp": 0, "fn": 0, "challenges": set()})
+            g["tp"] += r["metrics"]["true_positives"]
+            g["fp"] += r["metrics"]["false_positives"]
+            g["fn"] += r["metrics"]["false_negatives"]
+            g["challenges"].add(r["challenge"])
+
+    def _rows(dim: str, with_challenges: bool) -> List[Dict[str, Any]]:
+        rows = []
+        for name, g in groups[dim].items():
+            tp, fp, fn = g["tp"], g["fp"], g["fn"]
+            precision = tp / (tp + fp) if tp + fp > 0 else 0
+            recall = tp / (tp + fn) if tp + fn > 0 else 0
+            f1 = 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0
+            row = {
+                "name": name,
+                "precision": precision,
+                "recall": recall,
+                "f1_score": f1,
+                "total_issues": tp + fn,
+                "total_found": tp,
+            }
+            if with_challenges:
+                row["challenges"] = len(g["challenges"])
+            rows.append(row)
+        return sorted(rows, key=lambda row: row["f1_score"], reverse=True)
+
+    return {
+        "by_category": _rows("category", with_challenges=False),
+        "by_language": _rows("language", with_challenges=True),
+        "by_severity": [],  # Not available from per-challenge results
+    }
+
+
+def _slugify(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "x"
+
+
+def _encode(data: Any) -> bytes:
+    """Compact, key-sorted encoding so identical content hashes identically."""
+    return dumps(data, sort_keys=True)
+
+
+def _hashed_name(prefix: str, payload: bytes) -> str:
+    digest = hashlib.sha256(payload).hexdigest()[:12]
+    return f"{prefix}.{digest}.json"
+
+
+def build_shards(dashboard: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    """Split a full dashboard dict into an index and content-hashed shards.
+
+    Returns ``(index, shards)`` where ``shards`` maps a filename (relative to
+    the shards directory) to its encoded payload.
+    """
+    results = dashboard["results"]
+    challenges = dashboard["challenges"]
+    shards: Dict[str, bytes] = {}
+
+    def _add(prefix: str, data: Any) -> str:
+        payload = _encode(data)
+        name = _hashed_name(prefix, payload)
+        shards[name] = payload
+        return f"{SHARDS_DIRNAME}/{name}"
+
+    by_tool: Dict[str, List[Dict[str, Any]]] = {}
+    by_challenge: Dict[str, List[Dict[str, Any]]] = {}
+    for r in results:
+        by_tool.setdefault(r["tool"], []).append(r)
+        by_challenge.setdefault(r["challenge"], []).append(r)
+
+    tool_shards = {
+        tool: _add(f"tool-{_slugify(tool)}", {"tool": tool, "results": tool_results})
+        for tool, tool_results in sorted(by_tool.items())
+    }
+
+    # The challenge list carries per-challenge summaries so the challenges tab
+    # renders without touching any result shard.
+    challenge_list = []
+    for ch in challenges:
+        ch_results = by_challenge.get(ch["id"], [])
+        best = max(ch_results, key=lambda r: r["metrics"]["f1_score"], default=None)
+        summary = dict(ch)
+        summary["avg_f1"] = (
+            sum(r["metrics"]["f1_score"] for r in ch_results) / len(ch_results)
+            if ch_results
+            else 0
+        )
+        summary["best_tool"] = best["tool"] if best else "N/A"
+        summary["shard"] = _add(
+            f"challenge-{_slugify(ch['id'])}", {"challenge": ch, "results": ch_results}
+        )
+        challenge_list.append(summary)
+
+    metadata = dict(dashboard["metadata"])
+    metadata["ground_truth_issues_count"] = sum(
+        ch.get("ground_truth_issues", 0) for ch in challenges
+    )
+
+    index = {
+        "metadata": metadata,
+        "system_prompt": dashboard.get("system_prompt", ""),
+        "tools": dashboard["tools"],
+        "overall_scores": dashboard["overall_scores"],
+        "metrics_breakdown": compute_breakdown(results, challenges),
+        "recent_history": dashboard.get("recent_history", []),
+        "trends": dashboard.get("trends", {}),
+        "shards": {
+            "challenges": _add("challenges", {"challenges": challenge_list}),
+            "tools": tool_shards,
+        },
+    }
+    return index, shards
+
+
+def _replace(path: Path, payload: bytes) -> None:
+    """Write *payload* to a temporary file and move it over *path*."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def _siblings(path: Path) -> List[Path]:
+    suffixes = [".gz", ".br"] if brotli is not None else [".gz"]
+    return [Path(f"{path}{suffix}") for suffix in suffixes]
+
+
+def _write_with_siblings(path: Path, payload: bytes) -> None:
+    """Write *payload* plus precompressed ``.gz`` (and ``.br``) siblings.
+
+    Each file is replaced atomically, the siblings first, so a complete
+    *path* means its siblings are complete too.
+    """
+    _replace(Path(f"{path}.gz"), gzip.compress(payload, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _replace(Path(f"{path}.br"), brotli.compress(payload))
+    _replace(path, payload)
+
+
+def _is_current(path: Path, payload: bytes) -> bool:
+    """Whether *path* and its siblings exist and *path* holds exactly *payload*."""
+    return (
+        path.exists()
+        and path.stat().st_size == len(payload)
+        and all(sibling.exists() for sibling in _siblings(path))
+        and path.read_bytes() == payload
+    )
+
+
+def write_sharded_dashboard(dashboard: Dict[str, Any], data_dir: Path) -> Path:
+    """Write ``index.json`` and its shards under *data_dir*; prune stale shards.
+
+    Shards are written first and the index after them, so readers never see
+    it point at missing shards; shards the new index no longer names are
+    removed only once it is in place.
+    """
+    index, shards = build_shards(dashboard)
+
+    shards_dir = data_dir / SHARDS_DIRNAME
+    shards_dir.mkdir(parents=True, exist_ok=True)
+    for name, payload in shards.items():
+        # Content-hashed, but a file left by an interrupted run may be incomplete
+        if not _is_current(shards_dir / name, payload):
+            _write_with_siblings(shards_dir / name, payload)
+
+    index_path = data_dir / INDEX_FILENAME
+    _write_with_siblings(index_path, dumps(index))
+
+    keep = set(shards)
+    for existing in shards_dir.iterdir():
+        base = existing.name.removesuffix(".gz").removesuffix(".br")
+        if base not in keep:
+            existing.unlink()
+    return index_path
+
+
+def load_history(historical_path: Path) -> Dict[str, Any]:
+    """Load the downsampled history export, keyed by tool display name."""
+    if not historical_path.exists():
+        return {"recent_history": [], "trends": {}}
+    historical = read_json(historical_path)
+
+    recent_history = [
+        {
+            "date": point["date"],
+            "metrics": {
+                tool_display_name(tool): metrics for tool, metrics in point["metrics"].items()
+            },
+        }
+        for point in historical.get("recent_history", [])
+    ]
+    trends = {
+        tool_display_name(tool): trend for tool, trend in historical.get("trends", {}).items()
+    }
+    return {"recent_history": recent_history, "trends": trends}
+
+
 def update_dashboard_data():
-    """Update the dashboard's benchmark-results.json with latest data."""
+    """Update the dashboard's sharded data with the latest report."""
     project_root = Path(__file__).resolve().parents[1]
 
     latest_report_path = project_root / "results" / "latest" / "report.json"
-    dashboard_path = project_root / "docs" / "data" / "benchmark-results.json"
+    data_dir = project_root / "docs" / "data"
     challenges_dir = project_root / "challenges"
 
     if not latest_report_path.exists():
@@ -290,21 +523,19 @@ def update_dashboard_data():
         return
 
     # Load report
-    with open(latest_report_path) as f:
-        report = json.load(f)
+    report = read_json(latest_report_path)
 
     # Load challenge metadata from YAML files
     challenges_meta = load_challenge_metadata(challenges_dir)
 
     # Transform
     dashboard = transform_report(report, challenges_meta)
+    dashboard.update(load_history(data_dir / "historical.json"))
 
     # Save
-    dashboard_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(dashboard_path, "w") as f:
-        json.dump(dashboard, f, indent=2, ensure_ascii=False)
+    index_path = write_sharded_dashboard(dashboard, data_dir)
 
-    print(f"Dashboard data updated: {dashboard_path}")
+    print(f"Dashboard data updated: {index_path}")
     print(f"  Tools: {dashboard['metadata']['tools_count']}")
     print(f"  Challenges: {dashboard['metadata']['challenges_count']}")
     print(f"  Results: {len(dashboard['results'])} entries")
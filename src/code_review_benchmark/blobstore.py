@@ -0,0 +1,160 @@
+"""Content-addressed storage for run outputs.
+
+Deterministic tools (and LLMs at temperature 0) often produce byte-identical
+``output.txt`` across runs. After a run finishes, its output is moved into
+``<run dir>/blobs/`` under its sha256 and replaced by a small
+``output.txt.blob`` pointer, so identical outputs are stored once.
+``crb evaluate`` keys its parse/match/judge results by the same hash and
+evaluates each distinct output once.
+
+Blobs are zstd-compressed when the ``zstandard`` package is installed (the
+``fast`` extra) and gzip-compressed otherwise; the pointer records which.
+Run directories written before the store existed (plain ``output.txt``)
+are read as before.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO
+
+from code_review_benchmark.profiling import span
+from code_review_benchmark.runners.base import OUTPUT_FILENAME
+from code_review_benchmark.serialization import read_json, write_json
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is not installed
+    zstandard = None
+
+BLOBS_DIRNAME = "blobs"
+POINTER_SUFFIX = ".blob"
+OUTPUT_POINTER = OUTPUT_FILENAME + POINTER_SUFFIX
+
+_CODEC_SUFFIX = {"zstd": ".zst", "gzip": ".gz"}
+_CHUNK = 1 << 20
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+class BlobStore:
+    """sha256-addressed, compressed blobs under ``root/sha256/ab/<digest>.<codec>``."""
+
+    def __init__(self, root: Path, codec: str | None = None) -> None:
+        self.root = root
+        self.codec = codec or default_codec()
+
+    def path_for(self, digest: str, codec: str) -> Path:
+        return self.root / "sha256" / digest[:2] / f"{digest}{_CODEC_SUFFIX[codec]}"
+
+    def find(self, digest: str) -> tuple[Path, str] | None:
+        """The stored file for *digest* and its codec, in whichever codec it was written."""
+        for codec in (self.codec, *(c for c in _CODEC_SUFFIX if c != self.codec)):
+            path = self.path_for(digest, codec)
+            if path.exists():
+                return path, codec
+        return None
+
+    def put_file(self, source: Path) -> tuple[str, int]:
+        """Store *source*'s content; returns ``(digest, size)``. Existing blobs are reused."""
+        digest, size = _hash_file(source)
+        if self.find(digest) is None:
+            target = self.path_for(digest, self.codec)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Compress to a temp file next to the target, then rename, so
+            # concurrent writers of the same content never expose a partial blob
+            fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+            try:
+                with open(source, "rb") as src, os.fdopen(fd, "wb") as raw:
+                    with _compressor(self.codec, raw) as out:
+                        shutil.copyfileobj(src, out, _CHUNK)
+                os.chmod(tmp, 0o644)
+                os.replace(tmp, target)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        return digest, size
+
+    def read_bytes(self, digest: str) -> bytes:
+        found = self.find(digest)
+        if found is None:
+            raise FileNotFoundError(f"blob {digest} not found in {self.root}")
+        path, codec = found
+        with open(path, "rb") as raw:
+            if codec == "gzip":
+                return gzip.decompress(raw.read())
+            if zstandard is None:
+                raise RuntimeError(f"blob {digest} is zstd-compressed; install zstandard")
+            return zstandard.ZstdDecompressor().stream_reader(raw).read()
+
+
+def store_for(run_dir: Path) -> BlobStore:
+    return BlobStore(run_dir / BLOBS_DIRNAME)
+
+
+def intern_output(result_dir: Path, store: BlobStore) -> str | None:
+    """Move a run's ``output.txt`` into *store*, leaving a pointer; returns the digest."""
+    output = result_dir / OUTPUT_FILENAME
+    if not output.exists():
+        return None
+    digest, size = store.put_file(output)
+    write_json(
+        result_dir / OUTPUT_POINTER,
+        {"sha256": digest, "size": size, "codec": store.find(digest)[1]},
+    )
+    output.unlink()
+    return digest
+
+
+def has_output(result_dir: Path) -> bool:
+    return (result_dir / OUTPUT_FILENAME).exists() or (result_dir / OUTPUT_POINTER).exists()
+
+
+def output_digest(result_dir: Path) -> str | None:
+    """The sha256 of a run's output, from its pointer or by hashing ``output.txt``."""
+    pointer = result_dir / OUTPUT_POINTER
+    if pointer.exists():
+        return read_json(pointer)["sha256"]
+    output = result_dir / OUTPUT_FILENAME
+    return _hash_file(output)[0] if output.exists() else None
+
+
+def output_size(result_dir: Path) -> int:
+    pointer = result_dir / OUTPUT_POINTER
+    if pointer.exists():
+        return read_json(pointer)["size"]
+    output = result_dir / OUTPUT_FILENAME
+    return output.stat().st_size if output.exists() else 0
+
+
+def read_output(result_dir: Path, store: BlobStore) -> str:
+    """A run's output text, from ``output.txt`` or the blob its pointer names."""
+    output = result_dir / OUTPUT_FILENAME
+    with span("read_output", cat="io"):
+        if output.exists():
+            return output.read_text()
+        digest = read_json(result_dir / OUTPUT_POINTER)["sha256"]
+        return store.read_bytes(digest).decode()
+
+
+def _hash_file(path: Path) -> tuple[str, int]:
+    h = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            h.update(chunk)
+            size += len(chunk)
+    return h.hexdigest(), size
+
+
+def _compressor(codec: str, raw: IO[bytes]) -> IO[bytes]:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).stream_writer(raw, closefd=False)
+    return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0)
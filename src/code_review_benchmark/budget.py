@@ -0,0 +1,222 @@
+"""Call/token/cost estimates and spend limits for `crb run` and `crb evaluate`.
+
+Token counts are estimated from the prompts the tools and the judge would
+actually be sent (about four characters per token); output tokens use a
+typical response size until the real response is known. Prices are USD per
+million tokens and can be overridden with a JSON file named by
+``CRB_PRICES`` (``{"model-prefix": [input, output]}``).
+
+A :class:`SpendGovernor` is asked to :meth:`~SpendGovernor.admit` every call
+before it is made. Once ``max_spend`` or ``max_calls`` would be exceeded it
+refuses that call and every later one, so callers stop scheduling new work
+and record what they have. In ``dry_run`` mode it admits nothing and only
+counts, which is how ``--plan`` works. One governor may be shared between
+threads, e.g. by ``crb run``'s reviews and its background evaluation.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from code_review_benchmark.models.evaluation import SpendReport
+from code_review_benchmark.serialization import read_json
+
+# Kinds of call
+REVIEW = "review"
+JUDGE = "judge"
+
+# Typical response sizes, used until the actual response is known
+REVIEW_OUTPUT_TOKENS = 1500
+JUDGE_OUTPUT_TOKENS = 120
+
+# USD per million (input, output) tokens, matched by longest model-name prefix
+DEFAULT_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "o1": (15.00, 60.00),
+    "claude-opus-4": (15.00, 75.00),
+    "claude-sonnet-4": (3.00, 15.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+def load_prices() -> dict[str, tuple[float, float]]:
+    prices = dict(DEFAULT_PRICES)
+    override = os.environ.get("CRB_PRICES")
+    if override:
+        prices.update({k: tuple(v) for k, v in read_json(Path(override)).items()})
+    return prices
+
+
+def price_for(model: str, prices: dict[str, tuple[float, float]]) -> tuple[float, float] | None:
+    matches = [prefix for prefix in prices if model.startswith(prefix)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+@dataclass
+class CallLine:
+    """Calls of one kind to one model."""
+
+    kind: str
+    model: str
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float | None = 0.0  # None when the model has no known price
+
+
+class SpendGovernor:
+    def __init__(
+        self,
+        max_spend: float | None = None,
+        max_calls: int | None = None,
+        dry_run: bool = False,
+    ) -> None:
+        self.max_spend = max_spend
+        self.max_calls = max_calls
+        self.dry_run = dry_run
+        self.exhausted = False
+        self.denied = 0
+        self.lines: dict[tuple[str, str], CallLine] = {}
+        self._prices = load_prices()
+        self._lock = threading.RLock()
+
+    @property
+    def limited(self) -> bool:
+        return self.max_spend is not None or self.max_calls is not None
+
+    @property
+    def calls(self) -> int:
+        return sum(line.calls for line in self.lines.values())
+
+    @property
+    def spent(self) -> float:
+        return sum(line.cost or 0.0 for line in self.lines.values())
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float | None:
+        price = price_for(model, self._prices)
+        if price is None:
+            return None
+        return (input_tokens * price[0] + output_tokens * price[1]) / 1_000_000
+
+    def admit(self, kind: str, model: str, input_tokens: int, output_tokens: int) -> bool:
+        """Whether a call with these estimated tokens may be made.
+
+        Admitted calls are not charged; call :meth:`charge` once the call
+        has been made. In dry-run mode the call is charged and refused.
+        """
+        with self._lock:
+            if self.dry_run:
+                self.charge(kind, model, input_tokens, output_tokens)
+                return False
+            if not self.exhausted:
+                over_calls = self.max_calls is not None and self.calls + 1 > self.max_calls
+                cost = self.cost(model, input_tokens, output_tokens) or 0.0
+                over_spend = self.max_spend is not None and self.spent + cost > self.max_spend
+                self.exhausted = over_calls or over_spend
+            if self.exhausted:
+                self.denied += 1
+                return False
+            return True
+
+    def charge(self, kind: str, model: str, input_tokens: int, output_tokens: int) -> None:
+        with self._lock:
+            line = self.lines.setdefault((kind, model), CallLine(kind, model))
+            line.calls += 1
+            line.input_tokens += input_tokens
+            line.output_tokens += output_tokens
+            cost = self.cost(model, input_tokens, output_tokens)
+            line.cost = None if cost is None or line.cost is None else line.cost + cost
+
+    def report(self, skipped: int = 0) -> SpendReport:
+        """Summary for ``report.json``/``spend.json``; *skipped* counts work never started."""
+        lines = list(self.lines.values())
+        return SpendReport(
+            calls=self.calls,
+            input_tokens=sum(line.input_tokens for line in lines),
+            output_tokens=sum(line.output_tokens for line in lines),
+            cost_usd=round(self.spent, 4),
+            unpriced_models=sorted({line.model for line in lines if line.cost is None}),
+            max_spend=self.max_spend,
+            max_calls=self.max_calls,
+            exhausted=self.exhausted,
+            denied_calls=self.denied,
+            skipped=skipped,
+            estimated=True,
+        )
+
+    def table(self, title: str):
+        """A rich table of calls, tokens and cost per (kind, model)."""
+        from rich.table import Table
+
+        table = Table(title=title)
+        for column in ("Kind", "Model", "Calls", "Input tokens", "Output tokens", "Cost (USD)"):
+            table.add_column(column, justify="left" if column in ("Kind", "Model") else "right")
+        for line in sorted(self.lines.values(), key=lambda ln: (ln.kind, ln.model)):
+            table.add_row(
+                line.kind,
+                line.model,
+                str(line.calls),
+                f"{line.input_tokens:,}",
+                f"{line.output_tokens:,}",
+                f"{line.cost:.2f}" if line.cost is not None else "unknown",
+            )
+        unpriced = any(line.cost is None for line in self.lines.values())
+        table.add_row(
+            "total",
+            "",
+            str(self.calls),
+            f"{sum(ln.input_tokens for ln in self.lines.values()):,}",
+            f"{sum(ln.output_tokens for ln in self.lines.values()):,}",
+            f"{self.spent:.2f}" + ("+" if unpriced else ""),
+        )
+        return table
+
+
+def plan_reviews(
+    challenges: list, lanes: list, workdir: Path | None = None
+) -> dict[tuple[str, str], tuple[str, int]]:
+    """Estimated ``(model, input tokens)`` of one review per ``(challenge id, lane name)``.
+
+    Each challenge repo is built once to get the diff the tools would see.
+    Tools that are not direct LLM reviewers are estimated from the same
+    prompt; their own prompts and call counts may differ.
+    """
+    from code_review_benchmark.challenge_repo.builder import build_challenge_repo
+    from code_review_benchmark.runners.llm_reviewer_base import (
+        CODE_REVIEW_SYSTEM_PROMPT,
+        AbstractLLMReviewer,
+    )
+
+    system_tokens = estimate_tokens(CODE_REVIEW_SYSTEM_PROMPT)
+    plan = {}
+    for challenge in challenges:
+        repo = build_challenge_repo(challenge, base_tmp=workdir)
+        try:
+            prompts = AbstractLLMReviewer.build_review_prompts(
+                repo.path, repo.pr_branch, repo.main_branch
+            )
+        except ValueError:
+            prompts = [""]
+        finally:
+            repo.cleanup()
+        tokens = sum(system_tokens + estimate_tokens(prompt) for prompt in prompts)
+        for lane in lanes:
+            if isinstance(lane.runner, AbstractLLMReviewer):
+                resolved = lane.runner._resolve_model(lane.model)
+            else:
+                resolved = lane.model or f"{lane.runner.name} (default model)"
+            plan[(challenge.id, lane.name)] = (resolved, tokens)
+    return plan
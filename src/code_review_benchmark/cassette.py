@@ -0,0 +1,158 @@
+"""Record and replay LLM provider calls (``--record`` / ``--replay``).
+
+Every reviewer request (:meth:`AbstractLLMReviewer._call_llm`) and judge
+request (``llm_judge._call_judge``) goes through :data:`cassette`. When
+recording, each successful response is appended to a JSONL cassette file
+with the request's hash and how long it took. When replaying, responses are
+served from the cassette without importing a provider SDK or touching the
+network, so ``crb run`` and ``crb evaluate`` can be repeated offline, e.g.
+to benchmark scheduling or evaluation changes. With ``latency=True`` each
+replayed response is delayed by its recorded duration.
+
+A request is identified by the caller (reviewer name or ``judge``), model,
+prompts and sampling settings. The same request made several times (one
+per run) is recorded once per occurrence and replayed in the same order,
+starting over once the recorded occurrences are used up. With parallel
+runs the order between identical requests is not fixed, so runs of the
+same tool and challenge may swap outputs; nothing else changes.
+Failed requests are not recorded, so retries are not replayed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from code_review_benchmark.serialization import dumps, loads
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMiss(LookupError):
+    """A replayed request that the cassette has no response for."""
+
+
+def request_key(request: dict) -> str:
+    """Stable hash of a request description."""
+    return hashlib.sha256(dumps(request, sort_keys=True)).hexdigest()
+
+
+class Cassette:
+    def __init__(self) -> None:
+        self.mode: str | None = None
+        self.path: Path | None = None
+        self.latency = False
+        self.hits = 0
+        self.recorded = 0
+        self._responses: dict[str, list[dict]] = {}
+        self._seen: dict[str, int] = {}  # occurrences of each key so far
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.mode is not None
+
+    def start(self, path: Path, mode: str, latency: bool = False) -> Cassette:
+        """Record to (appending) or replay from the cassette at *path*."""
+        self.close()
+        self.path, self.mode, self.latency = path, mode, latency
+        self.hits = self.recorded = 0
+        self._responses, self._seen = {}, {}
+        if mode == REPLAY:
+            with open(path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        entry = loads(line)
+                        self._responses.setdefault(entry["key"], []).append(entry)
+            # Concurrent calls finish, and so are recorded, out of order
+            for entries in self._responses.values():
+                entries.sort(key=lambda entry: entry.get("occurrence", 0))
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "ab")
+            atexit.register(self.close)
+        return self
+
+    def call(self, request: dict, fn: Callable[[], str]) -> str:
+        """Return *fn*'s response to *request*, recording or replaying it if active."""
+        if self.mode is None:
+            return fn()
+        key = request_key(request)
+        with self._lock:
+            occurrence = self._seen.get(key, 0)
+            self._seen[key] = occurrence + 1
+        if self.mode == REPLAY:
+            return self._replay(key, occurrence, request)
+
+        started = time.monotonic()
+        response = fn()
+        entry = {
+            "key": key,
+            "caller": request.get("caller"),
+            "model": request.get("model"),
+            "occurrence": occurrence,
+            "latency_s": round(time.monotonic() - started, 3),
+            "response": response,
+        }
+        with self._lock:
+            if self._file is not None:
+                self._file.write(dumps(entry) + b"\n")
+                self._file.flush()
+                self.recorded += 1
+        return response
+
+    def _replay(self, key: str, occurrence: int, request: dict) -> str:
+        entries = self._responses.get(key)
+        if not entries:
+            raise CassetteMiss(
+                f"{self.path} has no response for this {request.get('caller')} request "
+                f"to {request.get('model')}"
+            )
+        entry = entries[occurrence % len(entries)]
+        with self._lock:
+            self.hits += 1
+        if self.latency:
+            time.sleep(entry["latency_s"])
+        return entry["response"]
+
+    def summary(self) -> str | None:
+        """One line on what was recorded or replayed, if a cassette is in use."""
+        if self.mode == RECORD:
+            return f"Recorded {self.recorded} LLM response(s) to {self.path}"
+        if self.mode == REPLAY:
+            return f"Replayed {self.hits} LLM response(s) from {self.path}"
+        return None
+
+    def close(self) -> None:
+        if self._file is not None:
+            atexit.unregister(self.close)
+            self._file.close()
+            self._file = None
+        self.mode = None
+
+
+# Shared by every reviewer and the judge in the process
+cassette = Cassette()
+
+
+def start_cassette(record: str | None, replay: str | None, latency: bool = False) -> None:
+    """Start recording to *record* or replaying *replay*, as given on the command line.
+
+    Raises ValueError for conflicting options or a missing cassette.
+    """
+    if record and replay:
+        raise ValueError("use one of --record and --replay")
+    if latency and not replay:
+        raise ValueError("--replay-latency needs --replay")
+    if replay:
+        if not Path(replay).is_file():
+            raise ValueError(f"cassette not found: {replay}")
+        cassette.start(Path(replay), REPLAY, latency=latency)
+    elif record:
+        cassette.start(Path(record), RECORD)
@@ -8,7 +8,9 @@ from pathlib import Path
 
 from git import Repo
 
+from code_review_benchmark.challenge_repo.workspace import reaper, workspace_prefix
 from code_review_benchmark.models.challenge import Challenge
+from code_review_benchmark.profiling import span
 
 
 class ChallengeRepo:
@@ -20,28 +22,63 @@ class ChallengeRepo:
         self.challenge = challenge
         self.main_branch = "main"
         self.pr_branch = "challenge"
-
-    def cleanup(self) -> None:
-        shutil.rmtree(self.path, ignore_errors=True)
+        self.pr_commit = repo.head.commit.hexsha
+        self.main_commit = repo.heads[self.main_branch].commit.hexsha
+        self._config = (Path(repo.git_dir) / "config").read_bytes()
+        # Passed to runners as RunContext.shared while the repo is reused
+        self.artifacts: dict = {}
+        # False once a failed reset has discarded the repo
+        self.reusable = True
+
+    def reset(self) -> None:
+        """Undo whatever a tool changed, so the next task sees the repo as built.
+
+        Restores the git config, both branches and the work tree, and deletes
+        any other refs (branches, tags, stashes) the tool created. Raises
+        GitCommandError if git cannot, e.g. when a killed tool left an
+        ``index.lock`` behind.
+        """
+        with span("git", op="reset"):
+            (Path(self.repo.git_dir) / "config").write_bytes(self._config)
+            self.repo.git.checkout("-f", "-B", self.pr_branch, self.pr_commit)
+            self.repo.git.branch("-f", self.main_branch, self.main_commit)
+            keep = {f"refs/heads/{self.pr_branch}", f"refs/heads/{self.main_branch}"}
+            for ref in self.repo.git.for_each_ref("--format=%(refname)").split():
+                if ref not in keep:
+                    self.repo.git.update_ref("-d", ref)
+            self.repo.git.clean("-fdx")
+
+    def cleanup(self, wait: bool = False) -> None:
+        """Delete the repo, in the background unless *wait* is set."""
+        if wait:
+            shutil.rmtree(self.path, ignore_errors=True)
+        else:
+            reaper.discard(self.path)
 
 
 def build_challenge_repo(challenge: Challenge, base_tmp: Path | None = None) -> ChallengeRepo:
     """Create a temp git repo: main branch has 'before', 'challenge' branch has 'after'.
 
-    Returns a ChallengeRepo with paths and branch names.
+    The repo is created under *base_tmp* (see
+    :func:`~code_review_benchmark.challenge_repo.workspace.resolve_workdir`),
+    or the system temp dir. Returns a ChallengeRepo with paths and branch names.
     """
-    tmp_dir = Path(tempfile.mkdtemp(prefix=f"crb-{challenge.id}-", dir=base_tmp))
-    repo = Repo.init(tmp_dir, initial_branch="main")
-    repo.config_writer().set_value("user", "name", "CRB").release()
-    repo.config_writer().set_value("user", "email", "crb@benchmark").release()
+    tmp_dir = Path(tempfile.mkdtemp(prefix=workspace_prefix(challenge.id), dir=base_tmp))
+    with span("git", op="init"):
+        repo = Repo.init(tmp_dir, initial_branch="main")
+        repo.config_writer().set_value("user", "name", "CRB").release()
+        repo.config_writer().set_value("user", "email", "crb@benchmark").release()
 
     # Copy 'before' files and commit on main
-    _copy_tree(challenge.before_dir, tmp_dir)
-    repo.git.add(A=True)
-    repo.index.commit("Initial state (before)")
+    with span("copy_files"):
+        _copy_tree(challenge.before_dir, tmp_dir)
+    with span("git", op="commit"):
+        repo.git.add(A=True)
+        repo.index.commit("Initial state (before)")
 
     # Create PR branch and apply 'after' files
-    repo.git.checkout("-b", "challenge")
+    with span("git", op="checkout"):
+        repo.git.checkout("-b", "challenge")
 
     # Remove all tracked files, then copy 'after'
     for item in tmp_dir.iterdir():
@@ -52,9 +89,11 @@ def build_challenge_repo(challenge: Challenge, base_tmp: Path | None = None) ->
         else:
             item.unlink()
 
-    _copy_tree(challenge.after_dir, tmp_dir)
-    repo.git.add(A=True)
-    repo.index.commit(challenge.pr.title)
+    with span("copy_files"):
+        _copy_tree(challenge.after_dir, tmp_dir)
+    with span("git", op="commit"):
+        repo.git.add(A=True)
+        repo.index.commit(challenge.pr.title)
 
     return ChallengeRepo(repo_path=tmp_dir, repo=repo, challenge=challenge)
 
@@ -0,0 +1,131 @@
+"""Scratch space for challenge repos: placement, background deletion, orphan sweep.
+
+Each task builds and deletes a small git repo. On ``/dev/shm`` (tmpfs) that
+is memory-speed instead of disk I/O, and deleting through the
+:class:`Reaper` thread takes ``rmtree`` off the task's critical path.
+Workspace names carry the creating process's PID, so
+:func:`sweep_orphans` can remove those left behind by crashed runs without
+touching ones that are still in use.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PREFIX = "crb-"
+SHM = Path("/dev/shm")
+
+# Leave this much of tmpfs free; it is shared with everything else in RAM
+MIN_FREE_BYTES = 1 << 30
+
+# Workspaces without an owner PID (older naming) are swept after this long
+ORPHAN_AGE_SECONDS = 3600
+
+_OWNED = re.compile(rf"^{re.escape(PREFIX)}(\d+)-")
+
+
+def workspace_prefix(name: str) -> str:
+    """``mkdtemp`` prefix for a workspace owned by this process."""
+    return f"{PREFIX}{os.getpid()}-{name}-"
+
+
+def resolve_workdir(value: str | None, min_free: int = MIN_FREE_BYTES) -> Path | None:
+    """Where to create workspaces.
+
+    ``"auto"`` (or None) picks ``/dev/shm`` when it is writable with at
+    least *min_free* bytes available, else the system temp dir (``None``);
+    ``"tmp"`` forces the system temp dir; anything else is a directory.
+    """
+    if value in (None, "", "auto"):
+        try:
+            if os.access(SHM, os.W_OK) and shutil.disk_usage(SHM).free >= min_free:
+                return SHM
+        except OSError:
+            pass
+        return None
+    if value == "tmp":
+        return None
+    path = Path(value)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def sweep_orphans(workdir: Path | None, now: float | None = None) -> int:
+    """Delete workspaces in *workdir* whose owning process is gone; returns the count."""
+    base = workdir or Path(tempfile.gettempdir())
+    now = now or time.time()
+    removed = 0
+    try:
+        entries = list(base.iterdir())
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.name.startswith(PREFIX) or not entry.is_dir() or entry.is_symlink():
+            continue
+        match = _OWNED.match(entry.name)
+        if match:
+            if _pid_alive(int(match.group(1))):
+                continue
+        else:
+            try:
+                if now - entry.stat().st_mtime < ORPHAN_AGE_SECONDS:
+                    continue
+            except OSError:
+                continue
+        shutil.rmtree(entry, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by someone else
+    return True
+
+
+class Reaper:
+    """Deletes directories on a background thread."""
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[Path] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def discard(self, path: Path) -> None:
+        """Schedule *path* for deletion and return immediately."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="crb-reaper", daemon=True)
+                self._thread.start()
+        self._queue.put(path)
+
+    def drain(self) -> None:
+        """Block until every scheduled deletion has finished."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+            finally:
+                self._queue.task_done()
+
+
+reaper = Reaper()
+# Finish pending deletions before the interpreter exits
+atexit.register(reaper.drain)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 from typing import Optional
@@ -17,20 +16,108 @@ def evaluate_cmd(
     run_dir: str = typer.Option("results/latest", "--run-dir", help="Path to run results"),
     judge_model: Optional[str] = typer.Option(None, help="LLM model for evaluation judge"),
     skip_llm: bool = typer.Option(False, "--skip-llm", help="Use heuristic matching only"),
+    challenges_dir: Optional[str] = typer.Option(
+        None, "--challenges-dir", help="Challenge definitions (default: bundled challenges/)"
+    ),
+    full_report: bool = typer.Option(
+        False,
+        "--full-report/--compact-report",
+        help="Also list every run with its matches in report.json; by default only "
+        "per-challenge means are reported (per-run results stay in each evaluation.json)",
+    ),
+    judge_bands: Optional[str] = typer.Option(
+        None,
+        "--judge-bands",
+        help="Heuristic scores LOW,HIGH outside which the LLM judge is skipped, "
+        "or a file from `crb judge calibrate` (default: env CRB_JUDGE_BANDS)",
+    ),
+    judge_audit: float = typer.Option(
+        0.0, "--judge-audit", help="Fraction of confident pairs still sent to the judge"
+    ),
+    judge: Optional[str] = typer.Option(
+        None,
+        "--judge",
+        help="llm: judge every in-band pair with the LLM; local: use the model from "
+        "`crb judge train` and ask the LLM only when it is unsure (default: env CRB_JUDGE or llm)",
+    ),
+    local_judge_path: str = typer.Option(
+        "results/local_judge.json", "--local-judge", help="Model file for --judge local"
+    ),
+    local_threshold: Optional[float] = typer.Option(
+        None,
+        "--local-threshold",
+        min=0.5,
+        max=1.0,
+        help="Confidence the local judge needs to skip the LLM (default: from the model file)",
+    ),
+    plan: bool = typer.Option(
+        False, "--plan", help="Estimate judge calls, tokens and cost without calling the judge"
+    ),
+    max_spend: Optional[float] = typer.Option(
+        None,
+        "--max-spend",
+        help="Stop judging once estimated USD spend would exceed this; "
+        "later runs are left unevaluated",
+    ),
+    max_calls: Optional[int] = typer.Option(
+        None, "--max-calls", help="Stop judging after this many LLM judge calls"
+    ),
+    lexical_weight: float = typer.Option(
+        0.0,
+        "--lexical-weight",
+        min=0.0,
+        max=1.0,
+        help="Share of the heuristic score given to n-gram text similarity (0 = off)",
+    ),
+    dedup_threshold: Optional[float] = typer.Option(
+        None,
+        "--dedup-threshold",
+        min=0.0,
+        max=1.0,
+        help="Text similarity at which findings near each other are collapsed into one before "
+        "matching, e.g. 0.6 (default: env CRB_DEDUP_THRESHOLD or 0 = score every finding)",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Write a Chrome trace of time per phase to the run directory "
+        "(more detail: env CRB_PROFILE_DETAIL=cpu,memory)",
+    ),
+    metrics_file: Optional[str] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Keep a Prometheus textfile of progress metrics here, e.g. in node-exporter's "
+        "textfile directory (default: env CRB_METRICS_FILE)",
+    ),
+    record: Optional[str] = typer.Option(
+        None, "--record", help="Append every LLM response to this cassette file"
+    ),
+    replay: Optional[str] = typer.Option(
+        None,
+        "--replay",
+        help="Serve LLM responses from a cassette written by --record, without network access",
+    ),
+    replay_latency: bool = typer.Option(
+        False, "--replay-latency", help="With --replay: wait as long as each recorded call took"
+    ),
 ) -> None:
     """Evaluate stored run results against ground truth challenges."""
-    from code_review_benchmark.evaluation.aggregator import aggregate_results
-    from code_review_benchmark.evaluation.llm_judge import llm_judge_batch
-    from code_review_benchmark.evaluation.matcher import heuristic_match
-    from code_review_benchmark.evaluation.scorer import score_challenge_run
+    from code_review_benchmark.blobstore import has_output
+    from code_review_benchmark.budget import SpendGovernor
+    from code_review_benchmark.cassette import cassette, start_cassette
+    from code_review_benchmark.evaluation.aggregator import StreamingAggregator
+    from code_review_benchmark.evaluation.cascade import (
+        VERDICTS_FILENAME,
+        JudgeBands,
+        JudgeCascade,
+    )
+    from code_review_benchmark.evaluation.pipeline import RunEvaluator, heuristic_weights
+    from code_review_benchmark.layout import challenge_dirs
+    from code_review_benchmark.metrics import export_metrics
     from code_review_benchmark.models.challenge import load_challenges
-    from code_review_benchmark.models.evaluation import ChallengeToolResult
-    from code_review_benchmark.parsers.claude_reviewer import ClaudeReviewerParser
-    from code_review_benchmark.parsers.gemini_reviewer import GeminiReviewerParser
-    from code_review_benchmark.parsers.openai_reviewer import OpenAIReviewerParser
-    from code_review_benchmark.parsers.pr_agent import PRAgentParser
-    from code_review_benchmark.parsers.shippie import ShippieParser
-    from code_review_benchmark.runners.base import RunResult
+    from code_review_benchmark.profiling import profiler, start_profiling
+    from code_review_benchmark.runners.base import split_lane
+    from code_review_benchmark.serialization import write_json
 
     project_root = Path(__file__).resolve().parents[4]
     run_path = Path(run_dir) if Path(run_dir).is_absolute() else project_root / run_dir
@@ -38,6 +125,15 @@ def evaluate_cmd(
     if not run_path.exists():
         console.print(f"[red]Run directory not found: {run_path}[/red]")
         raise typer.Exit(1)
+    if profile:
+        start_profiling("evaluate")
+        # A plan leaves the run directory untouched
+        profiler.output_dir = None if plan else run_path
+
+    try:
+        start_cassette(record, replay, replay_latency)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--record/--replay")
 
     judge_model = judge_model or os.environ.get("CRB_JUDGE_MODEL") or None
     tool_model = os.environ.get("CRB_TOOL_MODEL", "")
@@ -47,25 +143,71 @@ def evaluate_cmd(
 
     resolved_judge_model = judge_model or DEFAULT_JUDGE_MODEL
 
-    # Build parser lookup
-    parsers = {
-        "claude-reviewer": ClaudeReviewerParser(),
-        "gemini-reviewer": GeminiReviewerParser(),
-        "openai-reviewer": OpenAIReviewerParser(),
-        "pr-agent": PRAgentParser(),
-        "shippie": ShippieParser(),
-    }
+    judge_bands = judge_bands or os.environ.get("CRB_JUDGE_BANDS")
+    try:
+        bands = JudgeBands.parse(judge_bands) if judge_bands else JudgeBands()
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--judge-bands")
+    judge = judge or os.environ.get("CRB_JUDGE", "llm")
+    if judge not in ("llm", "local"):
+        raise typer.BadParameter("must be 'llm' or 'local'", param_hint="--judge")
+    local_judge = None
+    if judge == "local" and not skip_llm:
+        from code_review_benchmark.evaluation.local_judge import LocalJudge
+
+        model_path = Path(local_judge_path)
+        if not model_path.is_absolute():
+            model_path = project_root / model_path
+        if not model_path.exists():
+            console.print(f"[red]Local judge not found: {model_path} (run `crb judge train`)[/red]")
+            raise typer.Exit(1)
+        try:
+            local_judge = LocalJudge.load(model_path)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+        if local_threshold is not None:
+            local_judge.threshold = local_threshold
+
+    cascade = JudgeCascade(
+        bands=bands,
+        verdicts_path=run_path / VERDICTS_FILENAME,
+        audit_rate=judge_audit,
+        local_judge=local_judge,
+    )
+
+    governor = None
+    if plan or max_spend is not None or max_calls is not None:
+        governor = SpendGovernor(max_spend=max_spend, max_calls=max_calls, dry_run=plan)
 
     # Load challenges
-    challenges_dir = project_root / "challenges"
-    all_challenges = {ch.id: ch for ch in load_challenges(challenges_dir)}
+    challenges_path = Path(challenges_dir) if challenges_dir else project_root / "challenges"
+    all_challenges = {ch.id: ch for ch in load_challenges(challenges_path)}
 
-    all_results: list[ChallengeToolResult] = []
+    # Results are folded in as they are scored so nothing per-run is retained
+    # beyond what the report itself needs.
+    evaluator = RunEvaluator(
+        run_path=run_path,
+        challenges=all_challenges,
+        cascade=cascade,
+        aggregator=StreamingAggregator(
+            challenges=list(all_challenges.values()),
+            compute_breakdown=True,
+            keep_per_challenge=full_report,
+        ),
+        judge_model=judge_model,
+        skip_llm=skip_llm,
+        governor=governor,
+        weights=heuristic_weights(lexical_weight),
+        dry_run=plan,
+    )
+    if dedup_threshold is not None:
+        evaluator.dedup_threshold = dedup_threshold
+
+    exporter = None if plan else export_metrics(metrics_file)
 
     # Walk the run directory structure: {challenge_id}/{tool}/{run_N}/
-    for challenge_dir in sorted(run_path.iterdir()):
-        if not challenge_dir.is_dir():
-            continue
+    for challenge_dir in challenge_dirs(run_path):
         challenge_id = challenge_dir.name
         challenge = all_challenges.get(challenge_id)
         if not challenge:
@@ -76,77 +218,74 @@ def evaluate_cmd(
             if not tool_dir.is_dir():
                 continue
             tool_name = tool_dir.name
-            parser = parsers.get(tool_name)
-            if not parser:
+            if split_lane(tool_name)[0] not in evaluator.parsers:
                 console.print(f"[yellow]No parser for tool: {tool_name}[/yellow]")
                 continue
 
             for run_dir_path in sorted(tool_dir.iterdir()):
-                if not run_dir_path.is_dir():
+                if not run_dir_path.is_dir() or not has_output(run_dir_path):
                     continue
+                evaluated = evaluator.evaluate(challenge, tool_name, run_dir_path)
+                if evaluated is not None:
+                    print_evaluated(evaluated)
 
-                output_file = run_dir_path / "output.txt"
-                if not output_file.exists():
-                    continue
+    if exporter is not None:
+        exporter.close()
+    if cassette.active:
+        console.print(cassette.summary())
+        cassette.close()
+    if evaluator.reused:
+        console.print(
+            f"  {evaluator.reused} run(s) had the same output as an earlier run and were reused"
+        )
+    if evaluator.collapsed:
+        console.print(f"  {evaluator.collapsed} near-duplicate finding(s) collapsed")
 
-                meta_file = run_dir_path / "meta.json"
-                meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
-                run_idx = meta.get("run_index", 0)
-
-                # Parse output
-                raw_result = RunResult(
-                    tool=tool_name,
-                    success=meta.get("success", True),
-                    output_text=output_file.read_text(),
-                )
-                findings = parser.parse(raw_result)
-
-                console.print(
-                    f"  {tool_name} × {challenge_id} run {run_idx}: {len(findings)} findings"
-                )
-
-                # Heuristic matching
-                heuristic_results = heuristic_match(challenge.issues, findings)
-
-                # LLM judge (unless skipped)
-                if skip_llm:
-                    final_results = heuristic_results
-                else:
-                    final_results = llm_judge_batch(
-                        challenge.issues, findings, heuristic_results, model=judge_model
-                    )
-
-                # Score
-                scored = score_challenge_run(
-                    challenge_id=challenge_id,
-                    tool=tool_name,
-                    run_index=run_idx,
-                    num_findings=len(findings),
-                    match_results=final_results,
-                )
-                all_results.append(scored)
-
-                # Save evaluation
-                eval_file = run_dir_path / "evaluation.json"
-                eval_file.write_text(json.dumps(scored.model_dump(), indent=2))
-
-    # Aggregate
-    report = aggregate_results(
-        all_results,
-        judge_model=resolved_judge_model,
-        tool_model=tool_model,
-        challenges=list(all_challenges.values()),
-        compute_breakdown=True,
-    )
+    if plan:
+        console.print(governor.table("Planned judge calls (estimated)"))
+        console.print(
+            f"  {cascade.stats.pairs} candidate pairs; "
+            f"{cascade.stats.accepted + cascade.stats.rejected} decided by heuristic score"
+            + (f", {cascade.stats.local_decisions} by the local judge" if local_judge else "")
+        )
+        return
 
+    report = evaluator.report(judge_model=resolved_judge_model, tool_model=tool_model)
     report_file = run_path / "report.json"
-    report_file.write_text(json.dumps(report.model_dump(), indent=2))
+    write_json(report_file, report)
 
     console.print(f"\n[green]Evaluation complete.[/green] Report: {report_file}")
+    print_report_summary(report)
+
+
+def print_evaluated(evaluated) -> None:
+    """One progress line for an evaluated run."""
+    scored = evaluated.scored
+    note = " (same output as an earlier run)" if evaluated.duplicate else ""
+    console.print(
+        f"  {scored.tool} × {scored.challenge_id} run {scored.run_index}: "
+        f"{scored.findings} findings{note}"
+    )
 
-    # Print summary
+
+def print_report_summary(report) -> None:
+    """Per-tool scores, judge usage and any spend-limit warning."""
     for tool in report.tools:
         console.print(
             f"  {tool.tool}: F1={tool.mean_f1:.2%} "
             f"P={tool.mean_precision:.2%} R={tool.mean_recall:.2%}"
         )
+    if report.judge_stats:
+        stats = report.judge_stats
+        console.print(
+            f"  Judge: {stats.llm_calls}/{stats.pairs} pairs sent to the LLM "
+            f"({stats.llm_fraction:.1%}); {stats.accepted} accepted, {stats.rejected} rejected "
+            f"by heuristic score"
+            + (f", {stats.local_decisions} by the local judge" if stats.local_decisions else "")
+        )
+    if report.spend and report.spend.exhausted:
+        console.print(
+            f"[yellow]Spend limit reached: {report.spend.skipped} run(s) left unevaluated, "
+            f"{report.judge_stats.over_budget if report.judge_stats else 0} pair(s) decided "
+            f"by heuristic score. Re-run evaluate with a higher limit to finish.[/yellow]"
+        )
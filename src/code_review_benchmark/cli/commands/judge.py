@@ -0,0 +1,111 @@
+"""The `crb judge` commands — tune the LLM judge cascade and train the local judge."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+judge_app = typer.Typer(help="Tune how evaluation uses the LLM judge.", no_args_is_help=True)
+
+
+@judge_app.command(name="calibrate")
+def calibrate_cmd(
+    sources: List[str] = typer.Argument(
+        ..., help="judge_verdicts.jsonl files, or directories searched for them"
+    ),
+    target: float = typer.Option(0.98, help="Required agreement with stored judge verdicts (0-1)"),
+    output: str = typer.Option(
+        "results/judge_calibration.json", "-o", "--output", help="Where to write the bands"
+    ),
+) -> None:
+    """Pick heuristic-score bands that skip the judge at a target agreement rate.
+
+    Calibrate on runs evaluated without bands (or with --judge-audit) so the
+    verdicts cover the whole score range.
+    """
+    from code_review_benchmark.evaluation.cascade import calibrate_bands, load_verdicts
+    from code_review_benchmark.serialization import write_json
+
+    project_root = Path(__file__).resolve().parents[4]
+
+    def _resolve(p: str) -> Path:
+        return Path(p) if Path(p).is_absolute() else project_root / p
+
+    if not 0.0 < target <= 1.0:
+        raise typer.BadParameter("must be in (0, 1]", param_hint="--target")
+
+    verdicts = load_verdicts([_resolve(s) for s in sources])
+    if not verdicts:
+        console.print("[red]No judge verdicts found.[/red]")
+        raise typer.Exit(1)
+
+    calibration = calibrate_bands(verdicts, target_agreement=target)
+    out_path = _resolve(output)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(out_path, calibration.__dict__, pretty=True)
+
+    accept = calibration.accept_above if calibration.accept_above is not None else "never"
+    console.print(f"Verdicts: {calibration.samples}")
+    console.print(f"Reject below: {calibration.reject_below}   Accept at/above: {accept}")
+    console.print(
+        f"Agreement: {calibration.agreement:.2%} (target {target:.2%}); "
+        f"LLM calls: {calibration.llm_fraction:.1%} of judged pairs"
+    )
+    console.print(f"Use with: crb evaluate --judge-bands {out_path}")
+
+
+@judge_app.command(name="train")
+def train_cmd(
+    sources: List[str] = typer.Argument(
+        ..., help="judge_verdicts.jsonl files, or directories searched for them"
+    ),
+    target: float = typer.Option(
+        0.98, help="Required held-out agreement for pairs decided offline (0-1)"
+    ),
+    holdout: float = typer.Option(0.2, help="Fraction of verdicts held out for evaluation"),
+    seed: int = typer.Option(0, help="Seed for the train/holdout split"),
+    output: str = typer.Option(
+        "results/local_judge.json", "-o", "--output", help="Where to write the model"
+    ),
+) -> None:
+    """Distil stored LLM verdicts into a local judge for `crb evaluate --judge local`."""
+    from code_review_benchmark.evaluation.cascade import load_verdicts
+    from code_review_benchmark.evaluation.local_judge import train_local_judge
+
+    project_root = Path(__file__).resolve().parents[4]
+
+    def _resolve(p: str) -> Path:
+        return Path(p) if Path(p).is_absolute() else project_root / p
+
+    if not 0.0 < target <= 1.0:
+        raise typer.BadParameter("must be in (0, 1]", param_hint="--target")
+    if not 0.0 <= holdout < 1.0:
+        raise typer.BadParameter("must be in [0, 1)", param_hint="--holdout")
+
+    verdicts = load_verdicts([_resolve(s) for s in sources])
+    try:
+        result = train_local_judge(verdicts, holdout=holdout, target_agreement=target, seed=seed)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    out_path = _resolve(output)
+    result.judge.save(out_path)
+
+    metrics = result.judge.metrics
+    console.print(
+        f"Verdicts: {result.train_samples} train, {result.holdout_samples} held out"
+        + (f", {result.skipped} without features (skipped)" if result.skipped else "")
+    )
+    console.print(f"Accuracy ({metrics['evaluated_on']}): {metrics['accuracy']:.2%}")
+    console.print(
+        f"Confidence threshold: {result.judge.threshold:.3f}   "
+        f"Decided offline: {metrics['offline_fraction']:.1%} at "
+        f"{metrics['agreement']:.2%} agreement (target {target:.2%})"
+    )
+    console.print(f"Use with: crb evaluate --judge local --local-judge {out_path}")
@@ -0,0 +1,81 @@
+"""The `crb merge` command — combine run directories from separate executions."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+
+def merge_cmd(
+    sources: List[str] = typer.Argument(..., help="Run directories to merge"),
+    output: str = typer.Option(..., "-o", "--output", help="Merged run directory"),
+    challenges_dir: Optional[str] = typer.Option(
+        None, "--challenges-dir", help="Challenge definitions (default: bundled challenges/)"
+    ),
+) -> None:
+    """Union run directories, re-indexing colliding runs, into one directory."""
+    from code_review_benchmark.evaluation.aggregator import StreamingAggregator
+    from code_review_benchmark.layout import iter_run_dirs
+    from code_review_benchmark.merge import MergeError, merge_run_dirs, write_manifest
+    from code_review_benchmark.models.challenge import load_challenges
+    from code_review_benchmark.models.evaluation import BenchmarkReport, ChallengeToolResult
+    from code_review_benchmark.serialization import read_model, write_json
+
+    project_root = Path(__file__).resolve().parents[4]
+
+    def _resolve(p: str) -> Path:
+        return Path(p) if Path(p).is_absolute() else project_root / p
+
+    source_paths = [_resolve(s) for s in sources]
+    out_path = _resolve(output)
+    challenges_path = Path(challenges_dir) if challenges_dir else project_root / "challenges"
+    challenges = (
+        {ch.id: ch for ch in load_challenges(challenges_path)} if challenges_path.exists() else {}
+    )
+
+    try:
+        result = merge_run_dirs(source_paths, out_path, challenges=challenges)
+    except MergeError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    manifest = write_manifest(result, source_paths)
+
+    links: dict[str, int] = {}
+    for run in result.runs:
+        links[run.link] = links.get(run.link, 0) + 1
+    console.print(f"Merged {len(result.runs)} run(s) into {out_path}")
+    console.print(f"  Re-indexed: {result.reindexed}")
+    console.print("  Artifacts: " + ", ".join(f"{k}={v}" for k, v in sorted(links.items())))
+    if result.unverified:
+        console.print(
+            f"[yellow]  No challenge hash recorded for: "
+            f"{', '.join(sorted(set(result.unverified)))}[/yellow]"
+        )
+    console.print(f"  Manifest: {manifest}")
+
+    run_paths = [path for _cid, _tool, _idx, path in iter_run_dirs(out_path)]
+    if not all((path / "evaluation.json").exists() for path in run_paths):
+        console.print("Some runs have no evaluation.json; run `crb evaluate` on the output.")
+        return
+
+    # Every run carries its evaluation, so the merged report needs no re-judging
+    source_reports = [
+        read_model(p / "report.json", BenchmarkReport)
+        for p in source_paths
+        if (p / "report.json").exists()
+    ]
+    judge_model = ",".join(sorted({r.judge_model for r in source_reports if r.judge_model}))
+    tool_model = ",".join(sorted({r.tool_model for r in source_reports if r.tool_model}))
+
+    aggregator = StreamingAggregator(challenges=list(challenges.values()))
+    for path in run_paths:
+        aggregator.add(read_model(path / "evaluation.json", ChallengeToolResult))
+    report = aggregator.report(judge_model=judge_model, tool_model=tool_model)
+    report_file = out_path / "report.json"
+    write_json(report_file, report)
+    console.print(f"[green]Report aggregated from carried-over evaluations:[/green] {report_file}")
@@ -0,0 +1,85 @@
+"""The `crb mock-provider` command — serve fake Anthropic/OpenAI APIs for load tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+
+def mock_provider_cmd(
+    host: str = typer.Option("127.0.0.1", help="Address to listen on"),
+    port: int = typer.Option(8089, help="Port to listen on"),
+    challenges_dir: Optional[str] = typer.Option(
+        None,
+        "--challenges-dir",
+        help="Challenges whose ground truth the canned reviews report "
+        "(default: bundled challenges/)",
+    ),
+    latency: str = typer.Option(
+        "lognormal:1.0,0.5",
+        help="Seconds to first token: fixed:S, uniform:LO,HI or lognormal:MEDIAN,SIGMA",
+    ),
+    tokens_per_second: float = typer.Option(
+        80.0, "--tokens-per-second", help="Output rate after the first token (0 = instant)"
+    ),
+    rate_429: float = typer.Option(
+        0.0, "--rate-429", min=0.0, max=1.0, help="Share of requests answered 429"
+    ),
+    rate_529: float = typer.Option(
+        0.0, "--rate-529", min=0.0, max=1.0, help="Share of requests answered 529 (overloaded)"
+    ),
+    rpm: int = typer.Option(0, help="Requests per minute before answering 429 (0 = no limit)"),
+    tpm: int = typer.Option(0, help="Input tokens per minute before answering 429 (0 = no limit)"),
+    recall: float = typer.Option(
+        0.7, min=0.0, max=1.0, help="Chance a canned review reports each ground-truth issue"
+    ),
+    noise: float = typer.Option(1.0, min=0.0, help="Mean false positives per canned review"),
+    seed: int = typer.Option(0, help="Random seed (same seed and requests = same answers)"),
+) -> None:
+    """Serve the Messages and Chat Completions APIs with canned reviews, for load testing."""
+    from code_review_benchmark.serialization import dumps
+    from code_review_benchmark.synth.mock_provider import (
+        LatencyModel,
+        MockConfig,
+        load_provider,
+        make_server,
+    )
+
+    try:
+        latency_model = LatencyModel.parse(latency)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--latency")
+
+    project_root = Path(__file__).resolve().parents[4]
+    challenges_path = Path(challenges_dir) if challenges_dir else project_root / "challenges"
+    config = MockConfig(
+        latency=latency_model,
+        tokens_per_second=tokens_per_second,
+        rate_429=rate_429,
+        rate_529=rate_529,
+        rpm=rpm,
+        tpm=tpm,
+        recall=recall,
+        noise=noise,
+        seed=seed,
+    )
+    provider = load_provider(challenges_path, config)
+    server = make_server(provider, host, port)
+    url = f"http://{host}:{server.server_address[1]}"
+
+    console.print(f"Mock provider on {url} with {len(provider.challenges)} challenge(s)")
+    console.print(f"  export ANTHROPIC_BASE_URL={url} ANTHROPIC_API_KEY=mock")
+    console.print(f"  export OPENAI_BASE_URL={url}/v1 OPENAI_API_KEY=mock")
+    console.print(f"  Counters: {url}/stats · Ctrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    console.print(f"Served: {dumps(provider.stats, sort_keys=True).decode()}")
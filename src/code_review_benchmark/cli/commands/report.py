@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -18,30 +17,51 @@ def report_cmd(
         "markdown", "--format", help="Output format: markdown, json, dashboard, both"
     ),
     output_file: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    challenges_dir: Optional[str] = typer.Option(
+        None, "--challenges-dir", help="Challenge definitions (default: bundled challenges/)"
+    ),
+    false_positives: int = typer.Option(
+        0,
+        "--false-positives",
+        min=0,
+        help="List up to this many unmatched findings per tool in the markdown report",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Write a Chrome trace of time per phase to the run directory "
+        "(more detail: env CRB_PROFILE_DETAIL=cpu,memory)",
+    ),
 ) -> None:
     """Generate comparison reports from evaluated results."""
+    from code_review_benchmark.findings import iter_false_positives
     from code_review_benchmark.models.challenge import load_challenges
     from code_review_benchmark.models.evaluation import BenchmarkReport
+    from code_review_benchmark.profiling import profiler, span, start_profiling
     from code_review_benchmark.reports.json_report import (
         generate_dashboard_json,
         generate_json_report,
     )
     from code_review_benchmark.reports.markdown import generate_markdown_report
+    from code_review_benchmark.serialization import read_model
 
     project_root = Path(__file__).resolve().parents[4]
     run_path = Path(run_dir) if Path(run_dir).is_absolute() else project_root / run_dir
+    if profile:
+        start_profiling("report")
+        profiler.output_dir = run_path
 
     report_file = run_path / "report.json"
     if not report_file.exists():
         console.print(f"[red]No report.json found in {run_path}. Run `crb evaluate` first.[/red]")
         raise typer.Exit(1)
 
-    report = BenchmarkReport.model_validate(json.loads(report_file.read_text()))
+    report = read_model(report_file, BenchmarkReport)
 
     # Load challenges for dashboard format
     challenges = None
     if output_format in ("dashboard", "both"):
-        challenges_dir = project_root / "challenges"
+        challenges_path = Path(challenges_dir) if challenges_dir else project_root / "challenges"
         challenges = [
             {
                 "id": ch.id,
@@ -52,11 +72,21 @@ def report_cmd(
                 "description": ch.description,
                 "language": ch.language,
             }
-            for ch in load_challenges(challenges_dir)
+            for ch in load_challenges(challenges_path)
         ]
 
     if output_format in ("markdown", "both"):
-        md = generate_markdown_report(report)
+        # Read from each run's findings.jsonl, written by `crb evaluate`
+        drilldown = None
+        if false_positives:
+            drilldown = {}
+            with span("false_positives"):
+                for challenge_id, tool, run_index, finding in iter_false_positives(run_path):
+                    listed = drilldown.setdefault(tool, [])
+                    if len(listed) < false_positives:
+                        listed.append((challenge_id, run_index, finding))
+        with span("markdown"):
+            md = generate_markdown_report(report, false_positives=drilldown)
         if output_file and output_format == "markdown":
             Path(output_file).write_text(md)
             console.print(f"Markdown report written to {output_file}")
@@ -68,7 +98,8 @@ def report_cmd(
             console.print(md)
 
     if output_format in ("json", "both"):
-        jr = generate_json_report(report)
+        with span("json"):
+            jr = generate_json_report(report)
         if output_file and output_format == "json":
             Path(output_file).write_text(jr)
             console.print(f"JSON report written to {output_file}")
@@ -79,7 +110,8 @@ def report_cmd(
 
     if output_format in ("dashboard", "both"):
         # Generate dashboard format with breakdown metrics
-        dashboard_json = generate_dashboard_json(report, challenges=challenges)
+        with span("dashboard"):
+            dashboard_json = generate_dashboard_json(report, challenges=challenges)
         if output_file and output_format == "dashboard":
             Path(output_file).write_text(dashboard_json)
             console.print(f"Dashboard JSON written to {output_file}")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import math
 import os
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,9 +18,87 @@ console = Console()
 def run_cmd(
     tools: Optional[str] = typer.Option(None, help="Comma-separated tool names to run"),
     challenges: Optional[str] = typer.Option(None, help="Comma-separated challenge IDs"),
-    num_runs: int = typer.Option(0, "--runs", help="Runs per tool/challenge (0 = use env or 3)"),
+    runs: str = typer.Option(
+        "0",
+        "--runs",
+        help="Runs per tool/challenge (0 = use env or 3), or 'auto' to add runs only where "
+        "F1 is still uncertain (implies --evaluate)",
+    ),
+    target_ci: float = typer.Option(
+        0.05,
+        "--target-ci",
+        help="With --runs auto: stop a pair once its mean F1 is known to ± this (95% CI)",
+    ),
+    max_runs: int = typer.Option(10, "--max-runs", help="With --runs auto: most runs per pair"),
     model: Optional[str] = typer.Option(None, help="LLM model to pass to tools"),
+    models: Optional[str] = typer.Option(
+        None,
+        "--models",
+        help="Comma-separated models to sweep: each tool runs once per model it can use, "
+        "written as {challenge}/{tool}@{model}/run_N",
+    ),
     output_dir: Optional[str] = typer.Option(None, "--output-dir", help="Custom output directory"),
+    challenges_dir: Optional[str] = typer.Option(
+        None, "--challenges-dir", help="Challenge definitions (default: bundled challenges/)"
+    ),
+    queue: Optional[str] = typer.Option(
+        None,
+        "--queue",
+        help="Only enqueue tasks for `crb worker` processes: 'sqlite' (one machine) "
+        "or 'fs' (shared filesystem, several nodes)",
+    ),
+    plan: bool = typer.Option(
+        False, "--plan", help="Estimate reviewer calls, tokens and cost, then exit"
+    ),
+    max_spend: Optional[float] = typer.Option(
+        None,
+        "--max-spend",
+        help="Stop starting reviews (and, with --evaluate, judge calls) once estimated USD "
+        "spend would exceed this",
+    ),
+    max_calls: Optional[int] = typer.Option(
+        None,
+        "--max-calls",
+        help="Stop starting reviews (and, with --evaluate, judge calls) after this many calls",
+    ),
+    workdir: str = typer.Option(
+        "auto",
+        "--workdir",
+        help="Where to build scratch repos: 'auto' (/dev/shm if it has room), 'tmp', or a path",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Write a Chrome trace of time per phase to the run directory "
+        "(more detail: env CRB_PROFILE_DETAIL=cpu,memory)",
+    ),
+    evaluate: bool = typer.Option(
+        False,
+        "--evaluate",
+        help="Score each run as soon as it finishes and write report.json at the end "
+        "(judge settings from env CRB_JUDGE_MODEL/CRB_JUDGE_BANDS; judge calls count "
+        "against --max-spend/--max-calls)",
+    ),
+    skip_llm: bool = typer.Option(
+        False, "--skip-llm", help="With --evaluate: use heuristic matching only"
+    ),
+    metrics_file: Optional[str] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Keep a Prometheus textfile of progress metrics here, e.g. in node-exporter's "
+        "textfile directory (default: env CRB_METRICS_FILE)",
+    ),
+    record: Optional[str] = typer.Option(
+        None, "--record", help="Append every LLM response to this cassette file"
+    ),
+    replay: Optional[str] = typer.Option(
+        None,
+        "--replay",
+        help="Serve LLM responses from a cassette written by --record, without network access",
+    ),
+    replay_latency: bool = typer.Option(
+        False, "--replay-latency", help="With --replay: wait as long as each recorded call took"
+    ),
 ) -> None:
     """Run all (or selected) tools against all (or selected) challenges."""
     # Lazy imports to keep CLI startup fast
@@ -29,23 +107,58 @@ def run_cmd(
     import code_review_benchmark.runners.openai_reviewer  # noqa: F401
     import code_review_benchmark.runners.pr_agent  # noqa: F401
     import code_review_benchmark.runners.shippie  # noqa: F401
+    from code_review_benchmark.blobstore import output_size
+    from code_review_benchmark.budget import REVIEW, REVIEW_OUTPUT_TOKENS
+    from code_review_benchmark.cassette import cassette, start_cassette
     from code_review_benchmark.challenge_repo.builder import build_challenge_repo
+    from code_review_benchmark.challenge_repo.workspace import resolve_workdir, sweep_orphans
+    from code_review_benchmark.layout import result_dir_for
+    from code_review_benchmark.metrics import TASKS_PLANNED, export_metrics
     from code_review_benchmark.models.challenge import load_challenges
+    from code_review_benchmark.profiling import profiler, span, start_profiling
+    from code_review_benchmark.runners.executor import execute_task, plan_lanes
     from code_review_benchmark.runners.registry import available_tool_names, get_runner
+    from code_review_benchmark.serialization import write_json
+
+    if profile:
+        start_profiling("run")
+
+    try:
+        start_cassette(record, replay, replay_latency)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--record/--replay")
 
     project_root = Path(__file__).resolve().parents[4]
-    challenges_dir = project_root / "challenges"
+    challenges_path = Path(challenges_dir) if challenges_dir else project_root / "challenges"
+
+    # Resolve runs per pair: a fixed number, or adaptive
+    sequential = None
+    if runs.strip().lower() == "auto":
+        from code_review_benchmark.evaluation.sequential import SequentialRuns
 
-    # Resolve num_runs
-    if num_runs <= 0:
-        num_runs = int(os.environ.get("CRB_NUM_RUNS", "3"))
+        try:
+            sequential = SequentialRuns(target_ci, max_runs=max_runs)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--target-ci/--max-runs")
+        num_runs = max_runs  # upper bound, for planning
+        evaluate = True
+    else:
+        try:
+            num_runs = int(runs)
+        except ValueError:
+            raise typer.BadParameter("expected a number or 'auto'", param_hint="--runs")
+        if num_runs <= 0:
+            num_runs = int(os.environ.get("CRB_NUM_RUNS", "3"))
 
-    # Resolve model
-    model = model or os.environ.get("CRB_TOOL_MODEL")
+    # Resolve model(s)
+    sweep = [m.strip() for m in models.split(",") if m.strip()] if models else None
+    if sweep and model:
+        raise typer.BadParameter("use one of --model and --models", param_hint="--models")
+    model = None if sweep else model or os.environ.get("CRB_TOOL_MODEL")
 
     # Load challenges
     challenge_ids = [c.strip() for c in challenges.split(",")] if challenges else None
-    loaded = load_challenges(challenges_dir, ids=challenge_ids)
+    loaded = load_challenges(challenges_path, ids=challenge_ids)
     if not loaded:
         console.print("[red]No challenges found.[/red]")
         raise typer.Exit(1)
@@ -61,6 +174,33 @@ def run_cmd(
             console.print(f"[red]Unknown tool: {name}[/red]")
             raise typer.Exit(1)
 
+    lanes, unused = plan_lanes(runners, sweep, model)
+    for name in unused:
+        console.print(f"[yellow]Skipping {name}: the tool would not use that model[/yellow]")
+    if not lanes:
+        console.print("[red]No tool can use any of the --models.[/red]")
+        raise typer.Exit(1)
+
+    scratch = resolve_workdir(workdir)
+    swept = sweep_orphans(scratch)
+
+    governor = None
+    if plan or max_spend is not None or max_calls is not None:
+        from code_review_benchmark.budget import SpendGovernor, plan_reviews
+
+        if queue and not plan:
+            raise typer.BadParameter(
+                "spend limits apply to in-process runs only", param_hint="--max-spend/--max-calls"
+            )
+        estimates = plan_reviews(loaded, lanes, workdir=scratch)
+        governor = SpendGovernor(max_spend=max_spend, max_calls=max_calls, dry_run=plan)
+
+    if plan:
+        _print_plan(governor, estimates, loaded, lanes, num_runs)
+        if sequential is not None:
+            console.print(f"With --runs auto this is an upper bound: {max_runs} runs per pair.")
+        return
+
     # Create output directory
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     if output_dir:
@@ -68,6 +208,7 @@ def run_cmd(
     else:
         run_dir = project_root / "results" / "runs" / timestamp
     run_dir.mkdir(parents=True, exist_ok=True)
+    profiler.output_dir = run_dir
 
     # Also create/update a 'latest' symlink
     latest = project_root / "results" / "latest"
@@ -75,57 +216,279 @@ def run_cmd(
     latest.symlink_to(run_dir)
 
     console.print(f"Output: {run_dir}")
-    console.print(f"Tools: {[r.name for r in runners]}")
+    console.print(f"Tools: {[lane.name for lane in lanes]}")
     console.print(f"Challenges: {[c.id for c in loaded]}")
-    console.print(f"Runs per pair: {num_runs}")
+    if sequential is not None:
+        console.print(
+            f"Runs per pair: auto ({sequential.min_runs}-{max_runs}, until F1 ±{target_ci:g})"
+        )
+    else:
+        console.print(f"Runs per pair: {num_runs}")
+    console.print(f"Scratch: {scratch or 'system temp dir'}")
+    if swept:
+        console.print(f"Removed {swept} orphaned workspace(s) from earlier runs")
     console.print()
 
-    total_tasks = len(runners) * len(loaded) * num_runs
+    if queue:
+        if cassette.active:
+            raise typer.BadParameter(
+                "workers make the LLM calls for queued tasks", param_hint="--record/--replay"
+            )
+        if evaluate:
+            raise typer.BadParameter(
+                "queued tasks are evaluated with `crb evaluate` once workers finish",
+                param_hint="--runs auto" if sequential is not None else "--evaluate",
+            )
+        _enqueue_run(queue, run_dir, challenges_path, loaded, lanes, num_runs, model)
+        return
+
+    on_scored = sequential.record if sequential is not None else None
+    stage = _start_evaluation(run_dir, loaded, skip_llm, on_scored, governor) if evaluate else None
+
+    pairs = [(challenge.id, lane.name) for challenge in loaded for lane in lanes]
+    if sequential is not None:
+        planned = sequential.schedule(pairs)
+    else:
+        planned = {pair: range(num_runs) for pair in pairs}
+    total_tasks = 0
+    skipped = 0
+    exporter = export_metrics(metrics_file)
     with Progress(console=console) as progress:
-        task = progress.add_task("Running benchmark...", total=total_tasks)
-
-        for challenge in loaded:
-            for runner in runners:
-                for run_idx in range(num_runs):
-                    progress.update(
-                        task,
-                        description=f"{runner.name} × {challenge.id} (run {run_idx + 1})",
-                    )
-
-                    # Build temp repo
-                    repo = build_challenge_repo(challenge)
-
-                    try:
-                        result = runner.run(
-                            repo_path=repo.path,
-                            pr_branch=repo.pr_branch,
-                            main_branch=repo.main_branch,
-                            model=model,
+        task = progress.add_task("Running benchmark...", total=None)
+
+        # One round with a fixed run count; with --runs auto, rounds until every pair settles
+        while planned:
+            total_tasks += sum(len(indices) for indices in planned.values())
+            TASKS_PLANNED.set(total_tasks)
+            progress.update(task, total=total_tasks)
+            for challenge in loaded:
+                round_runs = [
+                    (lane, run_idx)
+                    for lane in lanes
+                    for run_idx in planned.get((challenge.id, lane.name), ())
+                ]
+                if not round_runs:
+                    continue
+                # A sweep builds one repo per challenge, reset between its lanes,
+                # so the diff is computed once; otherwise each task builds its own
+                repo = None
+                try:
+                    for lane, run_idx in round_runs:
+                        label = f"{lane.name} × {challenge.id} (run {run_idx + 1})"
+                        progress.update(task, description=label)
+
+                        def show_lines(lines: int, label: str = label) -> None:
+                            progress.update(task, description=f"{label} · {lines} lines")
+
+                        if governor is not None:
+                            spend_model, prompt_tokens = estimates[(challenge.id, lane.name)]
+                            if not governor.admit(
+                                REVIEW, spend_model, prompt_tokens, REVIEW_OUTPUT_TOKENS
+                            ):
+                                skipped += 1
+                                progress.advance(task)
+                                continue
+
+                        if sweep and (repo is None or not repo.reusable):
+                            with span("build_challenge_repo", challenge=challenge.id):
+                                repo = build_challenge_repo(challenge, base_tmp=scratch)
+                        result = execute_task(
+                            lane.runner,
+                            challenge,
+                            run_idx,
+                            run_dir,
+                            lane.model,
+                            on_output=show_lines,
+                            workdir=scratch,
+                            lane=lane.name,
+                            repo=repo,
                         )
-                    finally:
+                        if repo is not None and not repo.reusable:
+                            console.print(
+                                f"  [yellow]Could not reset the {challenge.id} repo after "
+                                f"{lane.name}; it was discarded[/yellow]"
+                            )
+                        output = result_dir_for(run_dir, challenge.id, lane.name, run_idx)
+                        if governor is not None:
+                            governor.charge(
+                                REVIEW,
+                                spend_model,
+                                prompt_tokens,
+                                math.ceil(output_size(output) / 4),
+                            )
+                            # Hedged duplicate requests are paid for too
+                            for _ in range(result.metadata.get("hedges", 0)):
+                                governor.charge(
+                                    REVIEW, spend_model, prompt_tokens, REVIEW_OUTPUT_TOKENS
+                                )
+
+                        status = "[green]OK[/green]" if result.success else "[red]FAIL[/red]"
+                        console.print(f"  {lane.name} × {challenge.id} run {run_idx}: {status}")
+                        progress.advance(task)
+                        if stage is not None and lane.runner.name in stage.evaluator.parsers:
+                            # Blocks while the evaluation backlog is full
+                            stage.submit(challenge, lane.name, output)
+                finally:
+                    if repo is not None and repo.reusable:
                         repo.cleanup()
 
-                    # Save raw output
-                    result_dir = run_dir / challenge.id / runner.name / f"run_{run_idx}"
-                    result_dir.mkdir(parents=True, exist_ok=True)
-
-                    (result_dir / "output.txt").write_text(result.output_text)
-                    (result_dir / "stderr.txt").write_text(result.error)
-                    (result_dir / "meta.json").write_text(
-                        json.dumps(
-                            {
-                                "tool": result.tool,
-                                "success": result.success,
-                                "return_code": result.return_code,
-                                "model": model,
-                                "run_index": run_idx,
-                            },
-                            indent=2,
-                        )
-                    )
+            if sequential is None or (governor is not None and governor.exhausted):
+                break
+            progress.update(task, description="Scoring this round...")
+            stage.wait()
+            planned = sequential.schedule(pairs)
+
+        if stage is not None:
+            progress.update(task, description="Waiting for evaluation...")
+            stage.close()
+
+    if exporter is not None:
+        exporter.close()
+    if cassette.active:
+        console.print(cassette.summary())
+        cassette.close()
+    if governor is not None:
+        write_json(run_dir / "spend.json", governor.report(skipped=skipped), pretty=True)
+        kinds = "Reviewer and judge calls" if stage is not None else "Reviewer calls"
+        console.print(governor.table(f"{kinds} (estimated)"))
+        if governor.exhausted:
+            console.print(
+                f"[yellow]Spend limit reached: {skipped} of {total_tasks} task(s) not started. "
+                f"Completed runs are saved and can be evaluated as usual.[/yellow]"
+            )
 
-                    status = "[green]OK[/green]" if result.success else "[red]FAIL[/red]"
-                    console.print(f"  {runner.name} × {challenge.id} run {run_idx}: {status}")
-                    progress.advance(task)
+    if stage is not None:
+        _write_report(stage, run_dir, ",".join(sweep) if sweep else model)
+    if sequential is not None:
+        console.print(sequential.summary())
 
     console.print(f"\n[green]Done![/green] Results in {run_dir}")
+
+
+def _start_evaluation(
+    run_dir: Path, challenges: list, skip_llm: bool, on_scored=None, governor=None
+):
+    """Start the background stage that scores runs as `crb run` produces them.
+
+    *on_scored* also receives each scored run, e.g. for adaptive run counts.
+    Judge calls are admitted by *governor*, the same one as the reviews, so
+    ``--max-spend``/``--max-calls`` cap both and ``spend.json`` lists both.
+    """
+    from code_review_benchmark.evaluation.aggregator import StreamingAggregator
+    from code_review_benchmark.evaluation.cascade import (
+        VERDICTS_FILENAME,
+        JudgeBands,
+        JudgeCascade,
+    )
+    from code_review_benchmark.evaluation.pipeline import EvaluationStage, RunEvaluator
+
+    judge_bands = os.environ.get("CRB_JUDGE_BANDS")
+    try:
+        bands = JudgeBands.parse(judge_bands) if judge_bands else JudgeBands()
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="CRB_JUDGE_BANDS")
+
+    evaluator = RunEvaluator(
+        run_path=run_dir,
+        challenges={ch.id: ch for ch in challenges},
+        cascade=JudgeCascade(bands=bands, verdicts_path=run_dir / VERDICTS_FILENAME),
+        aggregator=StreamingAggregator(challenges=challenges, compute_breakdown=True),
+        judge_model=os.environ.get("CRB_JUDGE_MODEL") or None,
+        skip_llm=skip_llm,
+        governor=governor,
+    )
+
+    def on_result(evaluated) -> None:
+        scored = evaluated.scored
+        if on_scored is not None:
+            on_scored(scored)
+        console.print(
+            f"    scored {scored.tool} × {scored.challenge_id} run {scored.run_index}: "
+            f"F1={scored.f1:.2%} ({scored.findings} findings)"
+        )
+
+    def on_error(path: Path, error: Exception) -> None:
+        console.print(f"    [red]Evaluation failed for {path}: {error}[/red]")
+
+    return EvaluationStage(evaluator, on_result=on_result, on_error=on_error).start()
+
+
+def _write_report(stage, run_dir: Path, model: str | None) -> None:
+    from code_review_benchmark.cli.commands.evaluate import print_report_summary
+    from code_review_benchmark.evaluation.llm_judge import DEFAULT_JUDGE_MODEL
+    from code_review_benchmark.serialization import write_json
+
+    evaluator = stage.evaluator
+    report = evaluator.report(
+        judge_model=evaluator.judge_model or DEFAULT_JUDGE_MODEL, tool_model=model or ""
+    )
+    report_file = run_dir / "report.json"
+    write_json(report_file, report)
+    console.print(f"\n[green]Evaluation complete.[/green] Report: {report_file}")
+    if stage.errors:
+        console.print(
+            f"[yellow]{stage.errors} run(s) could not be evaluated; "
+            "re-run `crb evaluate` once fixed.[/yellow]"
+        )
+    print_report_summary(report)
+
+
+def _print_plan(governor, estimates, challenges, lanes, num_runs) -> None:
+    """Charge every task to a dry-run governor and print the estimate."""
+    from code_review_benchmark.budget import REVIEW, REVIEW_OUTPUT_TOKENS
+
+    for challenge in challenges:
+        for lane in lanes:
+            spend_model, prompt_tokens = estimates[(challenge.id, lane.name)]
+            for _ in range(num_runs):
+                governor.admit(REVIEW, spend_model, prompt_tokens, REVIEW_OUTPUT_TOKENS)
+
+    console.print(governor.table("Planned reviewer calls (estimated)"))
+    console.print(
+        "Output tokens assume a typical review; tools other than the direct LLM reviewers "
+        "may make more calls than shown. Estimate judge calls with `crb evaluate --plan` "
+        "once outputs exist."
+    )
+
+
+def _enqueue_run(
+    backend: str,
+    run_dir: Path,
+    challenges_path: Path,
+    challenges: list,
+    lanes: list,
+    num_runs: int,
+    model: str | None,
+) -> None:
+    """Materialise the run matrix as a durable queue for `crb worker`.
+
+    Sweep tasks are queued under their lane name, which tells the worker the model.
+    """
+    from code_review_benchmark.serialization import write_json
+    from code_review_benchmark.workqueue.base import QUEUE_CONFIG_FILENAME, Task, open_queue
+
+    try:
+        task_queue = open_queue(backend, run_dir)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    tasks = [
+        Task(challenge.id, lane.name, run_idx)
+        for challenge in challenges
+        for lane in lanes
+        for run_idx in range(num_runs)
+    ]
+    added = task_queue.enqueue(tasks)
+    write_json(
+        run_dir / QUEUE_CONFIG_FILENAME,
+        {
+            "backend": backend,
+            "challenges_dir": str(challenges_path.resolve()),
+            "model": model,
+        },
+        pretty=True,
+    )
+
+    console.print(f"Queued {added} new task(s) ({len(tasks) - added} already known)")
+    console.print(f"Start workers with: crb worker --run-dir {run_dir}")
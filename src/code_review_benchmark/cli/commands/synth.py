@@ -0,0 +1,70 @@
+"""The `crb synth` command — generate synthetic challenges and run directories."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+
+def _parse_range(value: str, option: str) -> tuple[int, int]:
+    """Parse ``"3"`` or ``"2-5"`` into an inclusive (min, max) tuple."""
+    try:
+        if "-" in value:
+            lo, hi = (int(v) for v in value.split("-", 1))
+        else:
+            lo = hi = int(value)
+    except ValueError:
+        raise typer.BadParameter(f"expected N or MIN-MAX, got {value!r}", param_hint=option)
+    if lo < 1 or hi < lo:
+        raise typer.BadParameter(f"invalid range {value!r}", param_hint=option)
+    return lo, hi
+
+
+def synth_cmd(
+    output_dir: str = typer.Option("results/synth", "--output-dir", help="Where to write data"),
+    num_challenges: int = typer.Option(100, "--challenges", help="Number of challenges"),
+    seed: int = typer.Option(0, help="Random seed (same seed = identical output)"),
+    files: str = typer.Option("1-3", help="Files per challenge (N or MIN-MAX)"),
+    diff_lines: str = typer.Option("20-80", "--diff-lines", help="Added lines per challenge"),
+    issues: str = typer.Option("1-4", help="Ground truth issues per challenge"),
+    tools: Optional[str] = typer.Option(None, help="Comma-separated tools to fake outputs for"),
+    num_runs: int = typer.Option(3, "--runs", help="Fake runs per tool/challenge (0 = none)"),
+) -> None:
+    """Generate synthetic challenges (and fake run outputs) for load testing."""
+    from code_review_benchmark.synth.generator import (
+        SYNTH_TOOLS,
+        SynthConfig,
+        generate_challenges,
+        generate_run_dir,
+    )
+
+    project_root = Path(__file__).resolve().parents[4]
+    out_path = Path(output_dir) if Path(output_dir).is_absolute() else project_root / output_dir
+
+    config = SynthConfig(
+        num_challenges=num_challenges,
+        seed=seed,
+        files=_parse_range(files, "--files"),
+        diff_lines=_parse_range(diff_lines, "--diff-lines"),
+        issues=_parse_range(issues, "--issues"),
+        tools=[t.strip() for t in tools.split(",")] if tools else list(SYNTH_TOOLS),
+        num_runs=num_runs,
+    )
+
+    challenges_path = out_path / "challenges"
+    generate_challenges(challenges_path, config)
+    console.print(f"Challenges: {challenges_path} ({num_challenges})")
+
+    if num_runs > 0:
+        run_path = out_path / "run"
+        written = generate_run_dir(run_path, challenges_path, config)
+        console.print(f"Run directory: {run_path} ({written} runs)")
+        console.print(
+            f"\nEvaluate with: crb evaluate --run-dir {run_path} "
+            f"--challenges-dir {challenges_path} --skip-llm"
+        )
@@ -0,0 +1,140 @@
+"""The `crb worker` command — execute tasks from a queued run."""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+
+def worker_cmd(
+    run_dir: str = typer.Option("results/latest", "--run-dir", help="Run created with --queue"),
+    worker_id: Optional[str] = typer.Option(None, help="Worker name (default: host:pid)"),
+    lease_seconds: float = typer.Option(
+        600.0, "--lease-seconds", help="Lease length; renewed every third of it while running"
+    ),
+    max_tasks: int = typer.Option(0, "--max-tasks", help="Stop after N tasks (0 = no limit)"),
+    poll_interval: float = typer.Option(
+        5.0, "--poll-interval", help="Seconds to wait while other workers hold the last leases"
+    ),
+    workdir: str = typer.Option(
+        "auto",
+        "--workdir",
+        help="Where to build scratch repos: 'auto' (/dev/shm if it has room), 'tmp', or a path",
+    ),
+    metrics_file: Optional[str] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Keep a Prometheus textfile of progress metrics here, e.g. in node-exporter's "
+        "textfile directory (default: env CRB_METRICS_FILE)",
+    ),
+) -> None:
+    """Lease tasks from a queued run and execute them until the queue is drained."""
+    import code_review_benchmark.runners.claude_reviewer  # noqa: F401
+    import code_review_benchmark.runners.gemini_reviewer  # noqa: F401
+    import code_review_benchmark.runners.openai_reviewer  # noqa: F401
+    import code_review_benchmark.runners.pr_agent  # noqa: F401
+    import code_review_benchmark.runners.shippie  # noqa: F401
+    from code_review_benchmark.challenge_repo.workspace import resolve_workdir, sweep_orphans
+    from code_review_benchmark.metrics import export_metrics
+    from code_review_benchmark.models.challenge import load_challenges
+    from code_review_benchmark.runners.base import AbstractToolRunner, split_lane
+    from code_review_benchmark.runners.executor import execute_task
+    from code_review_benchmark.runners.registry import get_runner
+    from code_review_benchmark.serialization import read_json
+    from code_review_benchmark.workqueue.base import QUEUE_CONFIG_FILENAME, open_queue
+
+    project_root = Path(__file__).resolve().parents[4]
+    run_path = Path(run_dir) if Path(run_dir).is_absolute() else project_root / run_dir
+
+    config_file = run_path / QUEUE_CONFIG_FILENAME
+    if not config_file.exists():
+        console.print(f"[red]No {QUEUE_CONFIG_FILENAME} in {run_path}.[/red]")
+        console.print("Create the queue with `crb run --queue sqlite|fs` first.")
+        raise typer.Exit(1)
+    config = read_json(config_file)
+
+    task_queue = open_queue(config["backend"], run_path)
+    challenges = {ch.id: ch for ch in load_challenges(Path(config["challenges_dir"]))}
+    model = config.get("model")
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    runners: dict[str, AbstractToolRunner] = {}
+
+    scratch = resolve_workdir(workdir)
+    swept = sweep_orphans(scratch)
+
+    console.print(f"Worker {worker_id} on {run_path} ({config['backend']} queue)")
+    console.print(f"Scratch: {scratch or 'system temp dir'}")
+    if swept:
+        console.print(f"Removed {swept} orphaned workspace(s) from earlier runs")
+
+    exporter = export_metrics(metrics_file)
+    done = 0
+    while not max_tasks or done < max_tasks:
+        lease = task_queue.lease(worker_id, lease_seconds)
+        if lease is None:
+            if task_queue.is_drained():
+                break
+            # Remaining tasks are leased elsewhere; wait in case a lease expires
+            time.sleep(poll_interval)
+            continue
+
+        task = lease.task
+        label = f"{task.tool} × {task.challenge_id} run {task.run_index}"
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=_heartbeat_loop,
+            args=(task_queue, lease, lease_seconds, stop),
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            challenge = challenges[task.challenge_id]
+            # Model sweeps queue tasks under a tool@model lane
+            tool, lane_model = split_lane(task.tool)
+            if tool not in runners:
+                runners[tool] = get_runner(tool)
+            result = execute_task(
+                runners[tool],
+                challenge,
+                task.run_index,
+                run_path,
+                lane_model or model,
+                workdir=scratch,
+                lane=task.tool,
+            )
+        except Exception as e:
+            task_queue.fail(lease, f"{type(e).__name__}: {e}")
+            console.print(f"  {label}: [red]ERROR[/red] {e}")
+        else:
+            task_queue.complete(lease)
+            status = "[green]OK[/green]" if result.success else "[red]FAIL[/red]"
+            console.print(f"  {label}: {status} (attempt {lease.attempt})")
+        finally:
+            stop.set()
+            heartbeat.join()
+        done += 1
+
+    if exporter is not None:
+        exporter.close()
+    counts = task_queue.counts()
+    console.print(
+        f"\n[green]Worker finished[/green] after {done} task(s). Queue: "
+        + ", ".join(f"{state}={n}" for state, n in counts.items())
+    )
+
+
+def _heartbeat_loop(task_queue, lease, lease_seconds: float, stop: threading.Event) -> None:
+    """Renew *lease* every third of its length until *stop* is set."""
+    while not stop.wait(lease_seconds / 3):
+        if not task_queue.heartbeat(lease, lease_seconds):
+            console.print(f"  [yellow]Lost lease on {lease.task.task_id}[/yellow]")
+            return
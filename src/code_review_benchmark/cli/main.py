@@ -4,7 +4,16 @@ from __future__ import annotations
 
 import typer
 
-from code_review_benchmark.cli.commands import evaluate, report, run
+from code_review_benchmark.cli.commands import (
+    evaluate,
+    judge,
+    merge,
+    mock_provider,
+    report,
+    run,
+    synth,
+    worker,
+)
 
 app = typer.Typer(
     name="crb",
@@ -15,6 +24,11 @@ app = typer.Typer(
 app.command(name="run")(run.run_cmd)
 app.command(name="evaluate")(evaluate.evaluate_cmd)
 app.command(name="report")(report.report_cmd)
+app.command(name="synth")(synth.synth_cmd)
+app.command(name="worker")(worker.worker_cmd)
+app.command(name="merge")(merge.merge_cmd)
+app.command(name="mock-provider")(mock_provider.mock_provider_cmd)
+app.add_typer(judge.judge_app, name="judge")
 
 
 @app.command()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import math
 import statistics
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 
@@ -10,10 +12,14 @@ from code_review_benchmark.models.challenge import Challenge
 from code_review_benchmark.models.evaluation import (
     BenchmarkReport,
     CategoryMetrics,
+    ChallengeSummary,
     ChallengeToolResult,
     MetricsBreakdown,
     ToolScore,
 )
+from code_review_benchmark.runners.base import split_lane
+
+SEVERITY_ORDER = ["critical", "high", "medium", "low", "info"]
 
 
 def compute_group_metrics(
@@ -106,8 +112,7 @@ def compute_tool_breakdown(
 
     # Compute metrics for each severity
     severity_metrics = []
-    severity_order = ["critical", "high", "medium", "low", "info"]
-    for sev in severity_order:
+    for sev in SEVERITY_ORDER:
         if sev in by_severity:
             sev_results = by_severity[sev]
             p, r, f1, findings, matched, gt = compute_group_metrics(sev_results)
@@ -212,6 +217,7 @@ def aggregate_results(
         tool_scores.append(
             ToolScore(
                 tool=tool_name,
+                model=split_lane(tool_name)[1],
                 challenges_run=len(by_challenge),
                 total_ground_truths=total_gt,
                 total_findings=total_findings,
@@ -225,6 +231,10 @@ def aggregate_results(
                 stddev_recall=(round(statistics.stdev(recalls), 4) if len(recalls) > 1 else 0.0),
                 stddev_f1=(round(statistics.stdev(f1s), 4) if len(f1s) > 1 else 0.0),
                 per_challenge=tool_results,
+                runs_per_challenge={cid: len(runs) for cid, runs in sorted(by_challenge.items())},
+                challenge_summaries=[
+                    _summarise(cid, runs) for cid, runs in sorted(by_challenge.items())
+                ],
                 metrics_breakdown=tool_breakdown,
             )
         )
@@ -243,3 +253,241 @@ def aggregate_results(
         tools=tool_scores,
         metrics_breakdown=overall_breakdown,
     )
+
+
+# ── Streaming aggregation ──
+
+
+@dataclass
+class _Welford:
+    """Online mean and sample variance (Welford's algorithm)."""
+
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+@dataclass
+class _GroupAccumulator:
+    """Running totals equivalent to :func:`compute_group_metrics` over a group."""
+
+    findings: int = 0
+    matched: int = 0
+    ground_truths: int = 0
+    weighted_precision: float = 0.0
+    weighted_recall: float = 0.0
+    challenge_ids: set[str] = field(default_factory=set)
+
+    def add(self, result: ChallengeToolResult, matched: int) -> None:
+        weight = len(result.matches)
+        self.findings += result.findings
+        self.matched += matched
+        self.ground_truths += weight
+        self.weighted_precision += result.precision * weight
+        self.weighted_recall += result.recall * weight
+        self.challenge_ids.add(result.challenge_id)
+
+    def to_metrics(self, name: str) -> CategoryMetrics:
+        if self.ground_truths > 0:
+            precision = self.weighted_precision / self.ground_truths
+            recall = self.weighted_recall / self.ground_truths
+            f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+        else:
+            precision = recall = f1 = 0.0
+        return CategoryMetrics(
+            name=name,
+            total_ground_truths=self.ground_truths,
+            total_findings=self.findings,
+            total_matched=self.matched,
+            precision=round(precision, 4),
+            recall=round(recall, 4),
+            f1=round(f1, 4),
+            challenges_count=len(self.challenge_ids),
+        )
+
+
+@dataclass
+class _Breakdown:
+    by_category: Dict[str, _GroupAccumulator] = field(default_factory=dict)
+    by_severity: Dict[str, _GroupAccumulator] = field(default_factory=dict)
+    by_language: Dict[str, _GroupAccumulator] = field(default_factory=dict)
+
+    def add(self, result: ChallengeToolResult, matched: int, challenge: Challenge) -> None:
+        for category in challenge.categories:
+            self.by_category.setdefault(category, _GroupAccumulator()).add(result, matched)
+        # One entry per issue, as compute_tool_breakdown does
+        for issue in challenge.issues:
+            severity = issue.severity.value
+            self.by_severity.setdefault(severity, _GroupAccumulator()).add(result, matched)
+        self.by_language.setdefault(challenge.language, _GroupAccumulator()).add(result, matched)
+
+    def to_breakdown(self) -> MetricsBreakdown:
+        return MetricsBreakdown(
+            by_category=[acc.to_metrics(n) for n, acc in sorted(self.by_category.items())],
+            by_severity=[
+                self.by_severity[sev].to_metrics(sev)
+                for sev in SEVERITY_ORDER
+                if sev in self.by_severity
+            ],
+            by_language=[acc.to_metrics(n) for n, acc in sorted(self.by_language.items())],
+        )
+
+
+def _summarise(challenge_id: str, runs: list[ChallengeToolResult]) -> ChallengeSummary:
+    sums = _RunSums()
+    for r in runs:
+        sums.n += 1
+        sums.precision += r.precision
+        sums.recall += r.recall
+        sums.f1 += r.f1
+        sums.findings += r.findings
+        sums.matched += sum(1 for m in r.matches if m.matched)
+        sums.ground_truths += len(r.matches)
+    return sums.summary(challenge_id)
+
+
+@dataclass
+class _RunSums:
+    """Sums over the runs of one (tool, challenge) pair."""
+
+    n: int = 0
+    precision: float = 0.0
+    recall: float = 0.0
+    f1: float = 0.0
+    findings: int = 0
+    matched: int = 0
+    ground_truths: int = 0
+
+    def summary(self, challenge_id: str) -> ChallengeSummary:
+        return ChallengeSummary(
+            challenge_id=challenge_id,
+            runs=self.n,
+            precision=round(self.precision / self.n, 4),
+            recall=round(self.recall / self.n, 4),
+            f1=round(self.f1 / self.n, 4),
+            findings=round(self.findings / self.n, 4),
+            matched=round(self.matched / self.n, 4),
+            ground_truths=round(self.ground_truths / self.n, 4),
+        )
+
+
+@dataclass
+class _ToolAccumulator:
+    findings: int = 0
+    matched: int = 0
+    ground_truths: int = 0
+    by_challenge: Dict[str, _RunSums] = field(default_factory=dict)
+    per_challenge: List[ChallengeToolResult] = field(default_factory=list)
+    breakdown: _Breakdown = field(default_factory=_Breakdown)
+
+
+class StreamingAggregator:
+    """Build a :class:`BenchmarkReport` from results as they are produced.
+
+    Produces the same report as :func:`aggregate_results` while holding only
+    running totals: per tool, per (tool, challenge) pair and per breakdown
+    group, so memory does not grow with the number of runs. Per-pair means
+    are reported as ``ToolScore.challenge_summaries``. With
+    ``keep_per_challenge`` every result is also retained, matches included,
+    for ``ToolScore.per_challenge`` exactly as the batch aggregator does.
+    """
+
+    def __init__(
+        self,
+        challenges: list[Challenge] | None = None,
+        compute_breakdown: bool = True,
+        keep_per_challenge: bool = False,
+    ) -> None:
+        self._challenges_map: Dict[str, Challenge] = (
+            {c.id: c for c in challenges} if challenges and compute_breakdown else {}
+        )
+        self._keep_per_challenge = keep_per_challenge
+        self._tools: Dict[str, _ToolAccumulator] = {}
+        self._overall = _Breakdown()
+        self._challenge_ids: set[str] = set()
+
+    def add(self, result: ChallengeToolResult) -> None:
+        """Fold one scored run into the running totals."""
+        tool = self._tools.setdefault(result.tool, _ToolAccumulator())
+        matched = sum(1 for m in result.matches if m.matched)
+        self._challenge_ids.add(result.challenge_id)
+
+        tool.findings += result.findings
+        tool.matched += matched
+        tool.ground_truths += len(result.matches)
+
+        sums = tool.by_challenge.setdefault(result.challenge_id, _RunSums())
+        sums.n += 1
+        sums.precision += result.precision
+        sums.recall += result.recall
+        sums.f1 += result.f1
+        sums.findings += result.findings
+        sums.matched += matched
+        sums.ground_truths += len(result.matches)
+
+        if self._keep_per_challenge:
+            tool.per_challenge.append(result)
+
+        challenge = self._challenges_map.get(result.challenge_id)
+        if challenge:
+            tool.breakdown.add(result, matched, challenge)
+            self._overall.add(result, matched, challenge)
+
+    def report(
+        self, judge_model: str = "", tool_model: str = "", num_runs: int = 1
+    ) -> BenchmarkReport:
+        """Finalize the accumulated totals into a report."""
+        tool_scores: list[ToolScore] = []
+        for tool_name, tool in sorted(self._tools.items()):
+            precision, recall, f1 = _Welford(), _Welford(), _Welford()
+            for sums in tool.by_challenge.values():
+                precision.add(sums.precision / sums.n)
+                recall.add(sums.recall / sums.n)
+                f1.add(sums.f1 / sums.n)
+
+            tool_scores.append(
+                ToolScore(
+                    tool=tool_name,
+                    model=split_lane(tool_name)[1],
+                    challenges_run=len(tool.by_challenge),
+                    total_ground_truths=tool.ground_truths,
+                    total_findings=tool.findings,
+                    total_matched=tool.matched,
+                    mean_precision=round(precision.mean, 4),
+                    mean_recall=round(recall.mean, 4),
+                    mean_f1=round(f1.mean, 4),
+                    stddev_precision=round(precision.stdev, 4),
+                    stddev_recall=round(recall.stdev, 4),
+                    stddev_f1=round(f1.stdev, 4),
+                    per_challenge=list(tool.per_challenge),
+                    runs_per_challenge={
+                        cid: sums.n for cid, sums in sorted(tool.by_challenge.items())
+                    },
+                    challenge_summaries=[
+                        sums.summary(cid) for cid, sums in sorted(tool.by_challenge.items())
+                    ],
+                    metrics_breakdown=(
+                        tool.breakdown.to_breakdown() if self._challenges_map else None
+                    ),
+                )
+            )
+
+        return BenchmarkReport(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            judge_model=judge_model,
+            tool_model=tool_model,
+            num_runs=num_runs,
+            challenges=sorted(self._challenge_ids),
+            tools=tool_scores,
+            metrics_breakdown=self._overall.to_breakdown() if self._challenges_map else None,
+        )
@@ -0,0 +1,220 @@
+"""Heuristic-confidence cascade in front of the LLM judge.
+
+Each ground truth's best heuristic candidate is routed by its heuristic score:
+
+- below ``reject_below``: decided "no match" without the judge
+- at or above ``accept_above``: decided "match" without the judge
+- in between: sent to the LLM judge
+
+Every judge call is appended to a verdict store (``judge_verdicts.jsonl`` in
+the run directory). :func:`calibrate_bands` picks the widest bands whose
+decisions would have agreed with those stored verdicts at a target rate,
+which is what ``crb judge calibrate`` runs. A small ``audit_rate`` keeps
+sending confident pairs to the judge so agreement stays measured.
+
+With a :class:`~code_review_benchmark.evaluation.local_judge.LocalJudge`,
+pairs inside the band go to the distilled model first and only reach the
+LLM when it is unsure.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from code_review_benchmark.models.evaluation import JudgeStats
+from code_review_benchmark.serialization import dumps, loads, read_json
+
+if TYPE_CHECKING:
+    from code_review_benchmark.evaluation.local_judge import LocalJudge
+
+VERDICTS_FILENAME = "judge_verdicts.jsonl"
+
+# Routing decisions
+REJECT = "reject"
+ACCEPT = "accept"
+JUDGE = "judge"
+AUDIT = "audit"  # confident pair sent to the judge anyway
+LOCAL = "local"  # in-band pair decided by the local judge
+
+# Below this the judge has never been consulted, so calibration cannot go lower
+MIN_REJECT_BELOW = 0.1
+
+
+@dataclass
+class JudgeBands:
+    reject_below: float = MIN_REJECT_BELOW
+    accept_above: float | None = None  # None: never accept without the judge
+
+    @classmethod
+    def parse(cls, value: str) -> JudgeBands:
+        """Parse ``"LOW,HIGH"`` or the path of a calibration file."""
+        if Path(value).is_file():
+            data = read_json(Path(value))
+            return cls(data["reject_below"], data["accept_above"])
+        try:
+            low, high = (float(v) for v in value.split(","))
+        except ValueError:
+            raise ValueError(f"expected LOW,HIGH or a calibration file, got {value!r}")
+        if not 0.0 <= low <= high:
+            raise ValueError(f"invalid judge bands {value!r}")
+        return cls(low, high)
+
+
+@dataclass
+class JudgeCascade:
+    """Routes pairs, records verdicts, and keeps :class:`JudgeStats`."""
+
+    bands: JudgeBands = field(default_factory=JudgeBands)
+    verdicts_path: Path | None = None
+    audit_rate: float = 0.0
+    seed: int = 0
+    local_judge: LocalJudge | None = None
+    stats: JudgeStats = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stats = JudgeStats(
+            reject_below=self.bands.reject_below, accept_above=self.bands.accept_above
+        )
+        self._rng = random.Random(self.seed)
+
+    def route(self, heuristic_score: float, features: dict[str, float] | None = None) -> str:
+        """Decide how a pair with *heuristic_score* is resolved.
+
+        Returns :data:`JUDGE` or :data:`AUDIT` when the LLM judge must be
+        called, :data:`LOCAL` when the local judge is confident about the
+        pair's *features*, otherwise :data:`ACCEPT` or :data:`REJECT`.
+        """
+        self.stats.pairs += 1
+        decision = self._band(heuristic_score)
+        if decision == JUDGE:
+            if (
+                self.local_judge is not None
+                and features is not None
+                and self.local_judge.decide(features) is not None
+            ):
+                self.stats.local_decisions += 1
+                return LOCAL
+            self.stats.llm_calls += 1
+            return JUDGE
+
+        # Floor rejections were never judged before the cascade existed either
+        if (
+            heuristic_score >= MIN_REJECT_BELOW
+            and self.audit_rate
+            and self._rng.random() < self.audit_rate
+        ):
+            self.stats.llm_calls += 1
+            self.stats.audited += 1
+            return AUDIT
+        if decision == ACCEPT:
+            self.stats.accepted += 1
+        else:
+            self.stats.rejected += 1
+        return decision
+
+    def skip_llm(self) -> None:
+        """A pair routed to the LLM was not judged because the spend limit was reached."""
+        self.stats.llm_calls -= 1
+        self.stats.over_budget += 1
+
+    def record(
+        self, decision: str, heuristic_score: float, matched: bool, confidence: float, **context
+    ) -> None:
+        """Store one judge verdict; for audits, count disagreement with the bands."""
+        if decision == AUDIT and (self._band(heuristic_score) == ACCEPT) != matched:
+            self.stats.audit_disagreements += 1
+        if self.verdicts_path is None:
+            return
+        record = {
+            "heuristic_score": heuristic_score,
+            "matched": matched,
+            "confidence": confidence,
+            **context,
+        }
+        with open(self.verdicts_path, "ab") as f:
+            f.write(dumps(record) + b"\n")
+
+    def _band(self, heuristic_score: float) -> str:
+        if heuristic_score < self.bands.reject_below:
+            return REJECT
+        if self.bands.accept_above is not None and heuristic_score >= self.bands.accept_above:
+            return ACCEPT
+        return JUDGE
+
+
+def load_verdicts(paths: list[Path]) -> list[dict]:
+    """Read verdicts from ``judge_verdicts.jsonl`` files or run directories containing them."""
+    verdicts = []
+    for path in paths:
+        files = sorted(path.rglob(VERDICTS_FILENAME)) if path.is_dir() else [path]
+        for file in files:
+            with open(file, "rb") as f:
+                verdicts.extend(loads(line) for line in f if line.strip())
+    return verdicts
+
+
+@dataclass
+class Calibration:
+    reject_below: float
+    accept_above: float | None
+    target_agreement: float
+    agreement: float
+    llm_fraction: float
+    samples: int
+
+
+def calibrate_bands(verdicts: list[dict], target_agreement: float = 0.98) -> Calibration:
+    """Find the bands that skip the most judge calls while agreeing with it often enough.
+
+    A pair decided by the bands agrees with the stored verdict when an
+    accepted pair was judged a match or a rejected pair was judged no match;
+    pairs inside the band are always decided by the judge, so they agree.
+    """
+    pairs = sorted((v["heuristic_score"], bool(v["matched"])) for v in verdicts)
+    n = len(pairs)
+    if n == 0:
+        return Calibration(MIN_REJECT_BELOW, None, target_agreement, 1.0, 1.0, 0)
+    budget = int((1.0 - target_agreement) * n + 1e-9)
+
+    scores = [s for s, _ in pairs]
+    # fn[i]: judged matches among pairs[:i] (wrong if rejected)
+    fn = [0] * (n + 1)
+    for i, (_, matched) in enumerate(pairs):
+        fn[i + 1] = fn[i] + matched
+    # fp[j]: judged non-matches among pairs[j:] (wrong if accepted)
+    fp = [0] * (n + 1)
+    for j in range(n - 1, -1, -1):
+        fp[j] = fp[j + 1] + (not pairs[j][1])
+
+    # Cuts must fall between distinct scores so a threshold can separate them
+    cuts = [0] + [i for i in range(1, n) if scores[i] != scores[i - 1]] + [n]
+    # Two pointers: a higher reject cut spends more of the error budget, so
+    # the accept cut can only move up.
+    best = (0, 0, n)  # (skipped, i, j)
+    j_pos = 0
+    for i_pos, i in enumerate(cuts):
+        if fn[i] > budget:
+            break
+        j_pos = max(j_pos, i_pos)
+        while fn[i] + fp[cuts[j_pos]] > budget:
+            j_pos += 1
+        j = cuts[j_pos]
+        skipped = i + (n - j)
+        if skipped > best[0]:
+            best = (skipped, i, j)
+
+    skipped, i, j = best
+    reject_below = max(MIN_REJECT_BELOW, scores[i] if i < n else scores[-1] + 1e-6)
+    accept_above = scores[j] if j < n else None
+    errors = fn[i] + fp[j]
+    return Calibration(
+        reject_below=round(reject_below, 4),
+        accept_above=round(accept_above, 4) if accept_above is not None else None,
+        target_agreement=target_agreement,
+        agreement=round(1.0 - errors / n, 4),
+        llm_fraction=round((n - skipped) / n, 4),
+        samples=n,
+    )
@@ -0,0 +1,154 @@
+"""Collapse near-duplicate findings before matching and judging.
+
+Some tools report the same issue more than once. PR-Agent's output is
+parsed from both its table rows and its ``### Suggestion`` blocks, and
+Shippie's stdout is read together with the review files it writes. Each
+copy counts as a finding, which lowers precision and multiplies heuristic
+matching and judge calls.
+
+Two findings are near-duplicates when they are in the same file, within
+``line_window`` lines of each other (or either has no line), and the
+estimated Jaccard similarity of their normalised title and description,
+over character 3-grams within words, reaches the threshold. Estimates come
+from MinHash signatures. Locality-sensitive hashing buckets each signature
+band by file and line block, so a finding is compared only with earlier
+ones that are both textually and physically close, and the whole pass is
+linear in the number of findings. The first finding of a group is kept, and
+``merged_from`` lists the positions in the parser's output of every finding
+folded into it.
+
+Collapsing is off by default: it changes the finding counts that precision
+is computed from, so scores with and without it are not directly
+comparable. ``SUGGESTED_THRESHOLD`` works well for table/block copies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+
+from code_review_benchmark.evaluation.lexical import char_ngrams, finding_text
+from code_review_benchmark.models.finding import NormalizedFinding
+
+DEFAULT_THRESHOLD = 0.0
+SUGGESTED_THRESHOLD = 0.6
+DEFAULT_LINE_WINDOW = 10
+NUM_PERM = 64
+BANDS = 16  # of NUM_PERM // BANDS rows: candidates from about 0.5 similarity
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(NUM_PERM)]
+
+
+def dedup_threshold() -> float:
+    """Similarity at which findings are collapsed (env ``CRB_DEDUP_THRESHOLD``; default 0 = off)."""
+    return float(os.environ.get("CRB_DEDUP_THRESHOLD", DEFAULT_THRESHOLD))
+
+
+def minhash(shingles: set[str]) -> tuple[int, ...]:
+    """MinHash signature of a set of shingles; empty for an empty set."""
+    if not shingles:
+        return ()
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") for s in shingles
+    ]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def _lines(finding: NormalizedFinding) -> tuple[int, int] | None:
+    if finding.line_start is None:
+        return None
+    return finding.line_start, max(finding.line_end or finding.line_start, finding.line_start)
+
+
+def _nearby(a: NormalizedFinding, b: NormalizedFinding, line_window: int) -> bool:
+    if a.file != b.file:
+        return False
+    a_lines, b_lines = _lines(a), _lines(b)
+    if a_lines is None or b_lines is None:
+        return True
+    return a_lines[0] - line_window <= b_lines[1] and b_lines[0] - line_window <= a_lines[1]
+
+
+# Location part of a bucket key: a line block, ANY_LINE for every lined finding
+# of a file, or None for findings without lines
+ANY_LINE = "*"
+
+
+def _stored_under(finding: NormalizedFinding, line_window: int, width: int) -> list:
+    lines = _lines(finding)
+    if lines is None:
+        return [None]
+    first, last = (lines[0] - line_window) // width, (lines[1] + line_window) // width
+    return [*range(first, last + 1), ANY_LINE]
+
+
+def _looked_up_under(finding: NormalizedFinding, width: int) -> list:
+    lines = _lines(finding)
+    if lines is None:
+        return [ANY_LINE, None]
+    return [*range(lines[0] // width, lines[1] // width + 1), None]
+
+
+def collapse_duplicates(
+    findings: list[NormalizedFinding],
+    threshold: float,
+    line_window: int = DEFAULT_LINE_WINDOW,
+) -> list[NormalizedFinding]:
+    """*findings* with near-duplicates folded into their first occurrence.
+
+    A *threshold* of 0 (or less) returns *findings* unchanged.
+    """
+    if threshold <= 0 or len(findings) < 2:
+        return findings
+    rows = NUM_PERM // BANDS
+    width = max(line_window, 1)
+    buckets: dict[tuple, list[int]] = {}
+    kept: list[int] = []  # positions of the findings kept
+    signatures: dict[int, tuple[int, ...]] = {}
+    merged: dict[int, list[int]] = {}
+
+    for i, finding in enumerate(findings):
+        signature = minhash(set(char_ngrams(finding_text(finding), (3, 3))))
+        bands = [(band, signature[band * rows : (band + 1) * rows]) for band in range(BANDS)]
+        candidates = {
+            j
+            for block in _looked_up_under(finding, width)
+            for band in bands
+            if signature
+            for j in buckets.get((finding.file, block, band), ())
+        }
+        original = next(
+            (
+                j
+                for j in sorted(candidates)
+                if similarity(signature, signatures[j]) >= threshold
+                and _nearby(findings[j], finding, line_window)
+            ),
+            None,
+        )
+        if original is not None:
+            merged.setdefault(original, [original]).append(i)
+            continue
+        kept.append(i)
+        signatures[i] = signature
+        if signature:
+            for block in _stored_under(finding, line_window, width):
+                for band in bands:
+                    buckets.setdefault((finding.file, block, band), []).append(i)
+
+    if not merged:
+        return findings
+    return [
+        findings[i].model_copy(update={"merged_from": merged[i]}) if i in merged else findings[i]
+        for i in kept
+    ]
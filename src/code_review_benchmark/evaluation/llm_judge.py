@@ -9,10 +9,29 @@ from __future__ import annotations
 
 import json
 import os
-
+import time
+
+from code_review_benchmark.budget import (
+    JUDGE,
+    JUDGE_OUTPUT_TOKENS,
+    SpendGovernor,
+    estimate_tokens,
+)
+from code_review_benchmark.cassette import cassette
+from code_review_benchmark.evaluation.cascade import (
+    ACCEPT,
+    LOCAL,
+    MIN_REJECT_BELOW,
+    REJECT,
+    JudgeCascade,
+)
+from code_review_benchmark.evaluation.lexical import lexical_scores
+from code_review_benchmark.evaluation.local_judge import pair_features
+from code_review_benchmark.metrics import JUDGE_PAIRS, LLM_ERRORS, LLM_SECONDS, TOKENS
 from code_review_benchmark.models.challenge import GroundTruthIssue
 from code_review_benchmark.models.evaluation import MatchResult
 from code_review_benchmark.models.finding import NormalizedFinding
+from code_review_benchmark.profiling import span
 
 DEFAULT_JUDGE_MODEL = "claude-sonnet-4-20250514"
 
@@ -48,14 +67,19 @@ _BEDROCK_MODEL_MAP = {
 }
 
 
+def _use_bedrock() -> bool:
+    use_bedrock = os.environ.get("CRB_CLAUDE_USE_BEDROCK", "").lower() == "true"
+    aws_profile = os.environ.get("AWS_PROFILE", "")
+    return use_bedrock or bool(aws_profile and not os.environ.get("ANTHROPIC_API_KEY"))
+
+
 def _get_client():
     """Create the appropriate Anthropic client (direct API or Bedrock)."""
     import anthropic
 
-    use_bedrock = os.environ.get("CRB_CLAUDE_USE_BEDROCK", "").lower() == "true"
     aws_profile = os.environ.get("AWS_PROFILE", "")
 
-    if use_bedrock or (aws_profile and not os.environ.get("ANTHROPIC_API_KEY")):
+    if _use_bedrock():
         region = os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1"))
         return anthropic.AnthropicBedrock(
             aws_region=region,
@@ -65,18 +89,49 @@ def _get_client():
 
 
 def _call_judge(model: str, system_prompt: str, user_msg: str) -> dict:
-    """Call the Anthropic API (direct or Bedrock) and return the parsed JSON response."""
-    client, is_bedrock = _get_client()
-    api_model = _BEDROCK_MODEL_MAP.get(model, model) if is_bedrock else model
+    """Call the Anthropic API (direct or Bedrock) and return the parsed JSON response.
 
-    response = client.messages.create(
-        model=api_model,
-        max_tokens=512,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_msg}],
-        temperature=0.0,
+    With ``--record``/``--replay`` the response goes through the cassette.
+    """
+    is_bedrock = _use_bedrock()
+    api_model = _BEDROCK_MODEL_MAP.get(model, model) if is_bedrock else model
+    request = {
+        "caller": "judge",
+        "model": model,
+        "system": system_prompt,
+        "user": user_msg,
+        "max_tokens": 512,
+        "temperature": 0.0,
+    }
+
+    def send() -> str:
+        client, _ = _get_client()
+        response = client.messages.create(
+            model=api_model,
+            max_tokens=512,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_msg}],
+            temperature=0.0,
+        )
+        return response.content[0].text
+
+    labels = {"tool": "judge", "provider": "bedrock" if is_bedrock else "anthropic", "model": model}
+    started = time.monotonic()
+    try:
+        with span("judge_call", cat="api", model=api_model):
+            content = cassette.call(request, send)
+    except Exception:
+        LLM_ERRORS.inc(**labels)
+        raise
+    finally:
+        LLM_SECONDS.observe(time.monotonic() - started, **labels)
+    TOKENS.inc(
+        estimate_tokens(system_prompt) + estimate_tokens(user_msg),
+        tool="judge",
+        model=model,
+        direction="input",
     )
-    content = response.content[0].text
+    TOKENS.inc(estimate_tokens(content), tool="judge", model=model, direction="output")
     return _extract_json(content)
 
 
@@ -129,17 +184,31 @@ def llm_judge_batch(
     findings: list[NormalizedFinding],
     heuristic_results: list[MatchResult],
     model: str | None = None,
+    cascade: JudgeCascade | None = None,
+    governor: SpendGovernor | None = None,
 ) -> list[MatchResult]:
     """Run LLM judge on findings that heuristic pre-matched (or nearly matched).
 
-    For each ground truth, the LLM judges the best heuristic-matched finding.
-    If the heuristic found no match at all (score < 0.1), skip the LLM call.
+    For each ground truth, the best heuristic-matched finding is routed through
+    *cascade*: confidently low or high heuristic scores are decided without the
+    LLM, the rest are judged. The default cascade only skips scores below 0.1.
+    Pair features are computed for the cascade's local judge and stored with
+    every LLM verdict so ``crb judge train`` can learn from them.
+
+    Each LLM call is first admitted by *governor*; pairs it refuses are
+    decided by heuristic score (``budget_heuristic``).
     """
+    if cascade is None:
+        cascade = JudgeCascade()
     results: list[MatchResult] = []
+    lexical = (
+        lexical_scores(ground_truths, findings)
+        if any(h.finding_index is not None for h in heuristic_results)
+        else []
+    )
 
-    for gt, heuristic in zip(ground_truths, heuristic_results):
-        if heuristic.finding_index is None or heuristic.match_score < 0.1:
-            # No plausible match — mark as unmatched
+    for gt_idx, (gt, heuristic) in enumerate(zip(ground_truths, heuristic_results)):
+        if heuristic.finding_index is None:
             results.append(
                 MatchResult(
                     ground_truth_id=gt.id,
@@ -152,8 +221,98 @@ def llm_judge_batch(
             continue
 
         finding = findings[heuristic.finding_index]
+        features = pair_features(
+            gt, finding, heuristic.match_score, lexical[gt_idx][heuristic.finding_index]
+        )
+        decision = cascade.route(heuristic.match_score, features)
+        JUDGE_PAIRS.inc(decision=decision)
+        if decision == REJECT and heuristic.match_score < MIN_REJECT_BELOW:
+            # No plausible match — mark as unmatched
+            results.append(
+                MatchResult(
+                    ground_truth_id=gt.id,
+                    matched=False,
+                    match_score=0.0,
+                    match_method="llm_judge",
+                    explanation="No heuristic candidate to judge",
+                    heuristic_score=heuristic.match_score,
+                )
+            )
+            continue
+        if decision == REJECT:
+            results.append(
+                MatchResult(
+                    ground_truth_id=gt.id,
+                    finding_index=heuristic.finding_index,
+                    matched=False,
+                    match_score=heuristic.match_score,
+                    match_method="cascade_reject",
+                    explanation=f"heuristic score {heuristic.match_score:.3f} below judge band",
+                    heuristic_score=heuristic.match_score,
+                )
+            )
+            continue
+        if decision == ACCEPT:
+            results.append(
+                MatchResult(
+                    ground_truth_id=gt.id,
+                    finding_index=heuristic.finding_index,
+                    matched=True,
+                    match_score=heuristic.match_score,
+                    match_method="cascade_accept",
+                    explanation=f"heuristic score {heuristic.match_score:.3f} above judge band",
+                    heuristic_score=heuristic.match_score,
+                )
+            )
+            continue
+        if decision == LOCAL:
+            matched, confidence = cascade.local_judge.decide(features)
+            results.append(
+                MatchResult(
+                    ground_truth_id=gt.id,
+                    finding_index=heuristic.finding_index,
+                    matched=matched,
+                    match_score=round(0.4 * heuristic.match_score + 0.6 * confidence, 3),
+                    match_method="heuristic+local_judge",
+                    explanation=f"local judge confidence {confidence:.2f}",
+                    heuristic_score=heuristic.match_score,
+                )
+            )
+            continue
+
+        if governor is not None:
+            judge_model = _get_judge_model(model)
+            prompt_tokens = estimate_tokens(_SYSTEM_PROMPT) + estimate_tokens(
+                _build_user_message(gt, finding)
+            )
+            if not governor.admit(JUDGE, judge_model, prompt_tokens, JUDGE_OUTPUT_TOKENS):
+                cascade.skip_llm()
+                JUDGE_PAIRS.inc(decision="over_budget")
+                results.append(
+                    heuristic.model_copy(
+                        update={
+                            "match_method": "budget_heuristic",
+                            "heuristic_score": heuristic.match_score,
+                        }
+                    )
+                )
+                continue
+
         llm_result = llm_judge_match(gt, finding, model=model)
+        if governor is not None:
+            governor.charge(JUDGE, judge_model, prompt_tokens, JUDGE_OUTPUT_TOKENS)
         llm_result.finding_index = heuristic.finding_index
+        llm_result.heuristic_score = heuristic.match_score
+        cascade.record(
+            decision,
+            heuristic.match_score,
+            llm_result.matched,
+            llm_result.match_score,
+            ground_truth_id=gt.id,
+            finding=finding.title,
+            judge_model=_get_judge_model(model),
+            features=features,
+        )
 
         # Combine heuristic and LLM scores
         combined_score = 0.4 * heuristic.match_score + 0.6 * llm_result.match_score
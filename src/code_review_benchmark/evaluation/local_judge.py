@@ -0,0 +1,258 @@
+"""Offline judge distilled from stored LLM verdicts.
+
+Every LLM judge call is appended to ``judge_verdicts.jsonl`` together with the
+pair's features (see :func:`pair_features`). ``crb judge train`` fits an
+L2-regularised logistic regression on those verdicts and picks a confidence
+threshold on a held-out split; ``crb evaluate --judge local`` then decides a
+pair offline when the model is at least that confident and escalates to the
+LLM otherwise. Escalated verdicts are recorded too, so retraining keeps
+covering the cases the model was unsure about.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from code_review_benchmark.evaluation.matcher import (
+    _file_overlap,
+    _keyword_overlap,
+    _line_overlap,
+)
+from code_review_benchmark.models.challenge import GroundTruthIssue, Severity
+from code_review_benchmark.models.finding import NormalizedFinding
+from code_review_benchmark.serialization import read_json, write_json
+
+FEATURES = (
+    "heuristic",
+    "file",
+    "line",
+    "keyword",
+    "lexical",
+    "severity",
+    "category",
+    "same_basename",
+    "same_extension",
+    "same_directory",
+    "has_line",
+)
+
+_SEVERITY_RANK = {s: i for i, s in enumerate(Severity)}
+
+
+def pair_features(
+    gt: GroundTruthIssue,
+    finding: NormalizedFinding,
+    heuristic_score: float,
+    lexical: float,
+) -> dict[str, float]:
+    """Features of one ground-truth/finding pair, keyed by :data:`FEATURES`."""
+    gt_path = gt.file.replace("\\", "/")
+    f_path = (finding.file or "").replace("\\", "/")
+    gt_dir, _, gt_name = gt_path.rpartition("/")
+    f_dir, _, f_name = f_path.rpartition("/")
+
+    if finding.severity is None:
+        severity = 0.5
+    else:
+        gap = abs(_SEVERITY_RANK[gt.severity] - _SEVERITY_RANK[finding.severity])
+        severity = 1.0 - gap / (len(_SEVERITY_RANK) - 1)
+
+    category = 0.0
+    if finding.category:
+        a, b = gt.category.lower(), finding.category.lower()
+        category = float(a in b or b in a)
+
+    return {
+        "heuristic": heuristic_score,
+        "file": _file_overlap(gt.file, finding.file),
+        "line": _line_overlap(gt.line_start, gt.line_end, finding.line_start, finding.line_end),
+        "keyword": _keyword_overlap(gt, finding),
+        "lexical": lexical,
+        "severity": severity,
+        "category": category,
+        "same_basename": float(bool(f_name) and gt_name == f_name),
+        "same_extension": float(bool(f_name) and Path(gt_name).suffix == Path(f_name).suffix),
+        "same_directory": float(bool(f_path) and gt_dir == f_dir),
+        "has_line": float(finding.line_start is not None),
+    }
+
+
+@dataclass
+class LocalJudge:
+    """Logistic regression over standardised :data:`FEATURES`."""
+
+    weights: list[float]
+    bias: float
+    means: list[float]
+    scales: list[float]
+    threshold: float = 0.9  # minimum confidence to decide without the LLM
+    features: list[str] = field(default_factory=lambda: list(FEATURES))
+    metrics: dict = field(default_factory=dict)
+
+    def probability(self, features: dict[str, float]) -> float:
+        """Probability that the LLM judge would call the pair a match."""
+        z = self.bias
+        for name, w, mu, s in zip(self.features, self.weights, self.means, self.scales):
+            z += w * (features.get(name, 0.0) - mu) / s
+        return _sigmoid(z)
+
+    def decide(self, features: dict[str, float]) -> tuple[bool, float] | None:
+        """``(matched, confidence)`` when confident enough, else ``None`` (ask the LLM)."""
+        p = self.probability(features)
+        confidence = max(p, 1.0 - p)
+        if confidence < self.threshold:
+            return None
+        return p >= 0.5, confidence
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(path, self.__dict__, pretty=True)
+
+    @classmethod
+    def load(cls, path: Path) -> LocalJudge:
+        data = read_json(path)
+        if data.get("features") != list(FEATURES):
+            raise ValueError(f"{path} was trained on different features; run `crb judge train`")
+        return cls(**data)
+
+
+@dataclass
+class TrainingResult:
+    judge: LocalJudge
+    train_samples: int
+    holdout_samples: int
+    skipped: int  # verdicts recorded without features
+
+
+def train_local_judge(
+    verdicts: list[dict],
+    holdout: float = 0.2,
+    target_agreement: float = 0.98,
+    l2: float = 1.0,
+    seed: int = 0,
+) -> TrainingResult:
+    """Fit a :class:`LocalJudge` on verdicts and report agreement on a held-out split.
+
+    The threshold is the lowest confidence at which the model's held-out
+    decisions still agree with the LLM at *target_agreement*, which
+    maximises the share of pairs decided offline.
+    """
+    usable = [v for v in verdicts if v.get("features")]
+    rows = [
+        ([v["features"].get(name, 0.0) for name in FEATURES], bool(v["matched"])) for v in usable
+    ]
+    if len(rows) < 10:
+        raise ValueError(f"need at least 10 verdicts with features, found {len(rows)}")
+
+    random.Random(seed).shuffle(rows)
+    n_holdout = max(1, int(len(rows) * holdout)) if holdout > 0 else 0
+    test, train = rows[:n_holdout], rows[n_holdout:]
+
+    d = len(FEATURES)
+    means = [sum(x[k] for x, _ in train) / len(train) for k in range(d)]
+    scales = []
+    for k in range(d):
+        var = sum((x[k] - means[k]) ** 2 for x, _ in train) / len(train)
+        scales.append(math.sqrt(var) if var > 1e-12 else 1.0)
+
+    def standardise(x: list[float]) -> list[float]:
+        return [1.0] + [(x[k] - means[k]) / scales[k] for k in range(d)]
+
+    X = [standardise(x) for x, _ in train]
+    y = [float(label) for _, label in train]
+    beta = _fit_logistic(X, y, l2)
+
+    judge = LocalJudge(weights=beta[1:], bias=beta[0], means=means, scales=scales)
+    scored = test or train  # without a holdout, report (optimistic) training fit
+    predictions = [(judge.probability(dict(zip(FEATURES, x))), label) for x, label in scored]
+    judge.threshold, coverage, agreement = _pick_threshold(predictions, target_agreement)
+    judge.metrics = {
+        "accuracy": round(sum((p >= 0.5) == label for p, label in predictions) / len(scored), 4),
+        "target_agreement": target_agreement,
+        "agreement": round(agreement, 4),
+        "offline_fraction": round(coverage, 4),
+        "evaluated_on": "holdout" if test else "train",
+    }
+    return TrainingResult(
+        judge=judge,
+        train_samples=len(train),
+        holdout_samples=len(test),
+        skipped=len(verdicts) - len(usable),
+    )
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+def _fit_logistic(X: list[list[float]], y: list[float], l2: float, iterations: int = 25):
+    """Newton's method (IRLS) with an L2 penalty on everything but the intercept."""
+    d = len(X[0])
+    beta = [0.0] * d
+    for _ in range(iterations):
+        grad = [l2 * b if k else 0.0 for k, b in enumerate(beta)]
+        hess = [[(l2 if i == j and i else 0.0) for j in range(d)] for i in range(d)]
+        for x, target in zip(X, y):
+            p = _sigmoid(sum(b * v for b, v in zip(beta, x)))
+            r = p - target
+            w = max(p * (1.0 - p), 1e-9)
+            for i in range(d):
+                grad[i] += r * x[i]
+                wx = w * x[i]
+                row = hess[i]
+                for j in range(i, d):
+                    row[j] += wx * x[j]
+        for i in range(d):
+            for j in range(i):
+                hess[i][j] = hess[j][i]
+            hess[i][i] += 1e-9
+        step = _solve(hess, grad)
+        beta = [b - s for b, s in zip(beta, step)]
+        if max(abs(s) for s in step) < 1e-6:
+            break
+    return beta
+
+
+def _solve(a: list[list[float]], b: list[float]) -> list[float]:
+    """Gaussian elimination with partial pivoting."""
+    n = len(b)
+    m = [row[:] + [b[i]] for i, row in enumerate(a)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(col + 1, n):
+            f = m[r][col] / m[col][col]
+            for c in range(col, n + 1):
+                m[r][c] -= f * m[col][c]
+    x = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        x[r] = (m[r][n] - sum(m[r][c] * x[c] for c in range(r + 1, n))) / m[r][r]
+    return x
+
+
+def _pick_threshold(
+    predictions: list[tuple[float, bool]], target_agreement: float
+) -> tuple[float, float, float]:
+    """Lowest confidence threshold meeting *target_agreement*: ``(threshold, coverage, agreement)``.
+
+    Pairs are taken in order of decreasing confidence; ties are kept together
+    so the threshold decides exactly the pairs counted.
+    """
+    ranked = sorted(
+        ((max(p, 1 - p), (p >= 0.5) == label) for p, label in predictions), reverse=True
+    )
+    best = (1.0 + 1e-9, 0.0, 1.0)  # decide nothing offline
+    agree = 0
+    for i, (confidence, correct) in enumerate(ranked):
+        agree += correct
+        if i + 1 < len(ranked) and ranked[i + 1][0] == confidence:
+            continue
+        if agree / (i + 1) >= target_agreement:
+            best = (confidence, (i + 1) / len(ranked), agree / (i + 1))
+    return best
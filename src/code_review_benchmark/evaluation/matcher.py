@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from code_review_benchmark.evaluation.lexical import lexical_scores
 from code_review_benchmark.models.challenge import GroundTruthIssue
 from code_review_benchmark.models.evaluation import MatchResult
 from code_review_benchmark.models.finding import NormalizedFinding
@@ -13,18 +14,27 @@ def heuristic_match(
     file_weight: float = 0.4,
     line_weight: float = 0.2,
     keyword_weight: float = 0.4,
+    lexical_weight: float = 0.0,
 ) -> list[MatchResult]:
     """Score each ground truth against all findings using heuristic overlap.
 
     Returns one MatchResult per ground truth, linked to the best-matching finding.
     Enforces one-to-one assignment: each finding can match at most one ground truth.
     Uses greedy assignment by descending score.
+
+    ``lexical_weight`` adds character n-gram TF-IDF similarity between the
+    texts (see :mod:`~code_review_benchmark.evaluation.lexical`); it is off by
+    default.
     """
+    lexical = lexical_scores(ground_truths, findings) if lexical_weight > 0 else None
+
     # Compute all pairwise scores
     all_pairs: list[tuple[int, int, float]] = []  # (gt_idx, finding_idx, score)
     for gt_idx, gt in enumerate(ground_truths):
         for f_idx, finding in enumerate(findings):
             score = _score_pair(gt, finding, file_weight, line_weight, keyword_weight)
+            if lexical is not None:
+                score += lexical_weight * lexical[gt_idx][f_idx]
             if score > 0.0:
                 all_pairs.append((gt_idx, f_idx, score))
 
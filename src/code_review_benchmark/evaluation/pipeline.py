@@ -0,0 +1,268 @@
+"""Evaluate run directories one at a time, inline or behind a running benchmark.
+
+:class:`RunEvaluator` is the per-run part of ``crb evaluate``: parse (or
+reuse stored findings), heuristic match, judge, score, write
+``evaluation.json`` and fold the result into a streaming aggregate.
+``crb evaluate`` walks a finished run directory and feeds it every run.
+``crb run --evaluate`` instead hands each run to an :class:`EvaluationStage`
+as soon as its tool finishes, so judging overlaps with reviewing and
+``report.json`` is ready shortly after the last review.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from code_review_benchmark.blobstore import output_digest, read_output, store_for
+from code_review_benchmark.budget import SpendGovernor
+from code_review_benchmark.evaluation.aggregator import StreamingAggregator
+from code_review_benchmark.evaluation.cascade import JudgeCascade
+from code_review_benchmark.evaluation.dedup import collapse_duplicates, dedup_threshold
+from code_review_benchmark.evaluation.llm_judge import llm_judge_batch
+from code_review_benchmark.evaluation.matcher import heuristic_match
+from code_review_benchmark.evaluation.scorer import score_challenge_run
+from code_review_benchmark.findings import read_findings, write_findings
+from code_review_benchmark.metrics import record_eval_run
+from code_review_benchmark.models.challenge import Challenge
+from code_review_benchmark.models.evaluation import BenchmarkReport, ChallengeToolResult
+from code_review_benchmark.parsers.base import AbstractOutputParser
+from code_review_benchmark.profiling import span
+from code_review_benchmark.runners.base import RunResult, split_lane
+from code_review_benchmark.serialization import read_json, write_json
+
+# Finished runs allowed to wait for evaluation before `crb run` stops starting new ones
+DEFAULT_BACKLOG = 8
+
+# (challenge, tool) pairs whose evaluated outputs are remembered for reuse
+MEMO_PAIRS = 64
+
+
+def default_parsers() -> dict[str, AbstractOutputParser]:
+    from code_review_benchmark.parsers.claude_reviewer import ClaudeReviewerParser
+    from code_review_benchmark.parsers.gemini_reviewer import GeminiReviewerParser
+    from code_review_benchmark.parsers.openai_reviewer import OpenAIReviewerParser
+    from code_review_benchmark.parsers.pr_agent import PRAgentParser
+    from code_review_benchmark.parsers.shippie import ShippieParser
+
+    return {
+        "claude-reviewer": ClaudeReviewerParser(),
+        "gemini-reviewer": GeminiReviewerParser(),
+        "openai-reviewer": OpenAIReviewerParser(),
+        "pr-agent": PRAgentParser(),
+        "shippie": ShippieParser(),
+    }
+
+
+def heuristic_weights(lexical_weight: float = 0.0) -> dict[str, float]:
+    """Matcher weights with *lexical_weight* taken out of the default ones.
+
+    Scores stay in [0, 1], so the pre-match threshold keeps its meaning.
+    """
+    keep = 1.0 - lexical_weight
+    return {
+        "file_weight": 0.4 * keep,
+        "line_weight": 0.2 * keep,
+        "keyword_weight": 0.4 * keep,
+        "lexical_weight": lexical_weight,
+    }
+
+
+@dataclass
+class EvaluatedRun:
+    scored: ChallengeToolResult
+    duplicate: bool  # same output as an earlier run, whose results were reused
+
+
+@dataclass
+class RunEvaluator:
+    """Evaluates single runs, accumulating the report as it goes."""
+
+    run_path: Path
+    challenges: dict[str, Challenge]
+    cascade: JudgeCascade
+    aggregator: StreamingAggregator
+    judge_model: str | None = None
+    skip_llm: bool = False
+    governor: SpendGovernor | None = None
+    weights: dict[str, float] = field(default_factory=heuristic_weights)
+    # Plan mode: score for the governor's estimate but write and aggregate nothing
+    dry_run: bool = False
+    parsers: dict[str, AbstractOutputParser] = field(default_factory=default_parsers)
+    # Similarity at which near-duplicate findings are collapsed (0 = score every finding)
+    dedup_threshold: float = field(default_factory=dedup_threshold)
+    reused: int = 0
+    collapsed: int = 0  # near-duplicate findings folded into another
+    skipped: int = 0  # runs left unevaluated because the spend limit was reached
+
+    def __post_init__(self) -> None:
+        self._store = store_for(self.run_path)
+        # Identical outputs (same bytes, same challenge and tool) get identical
+        # findings and matches, so each distinct one is parsed, matched and
+        # judged once: (challenge, tool) -> (sha256, success) -> (findings, results).
+        # `crb evaluate` walks a pair's runs together, but `crb run --runs auto`
+        # comes back to a pair in later rounds, so the MEMO_PAIRS most recently
+        # used pairs are kept; memory stays independent of the number of runs.
+        self._memo: OrderedDict[tuple[str, str], dict[tuple[str, bool], tuple[list, list]]] = (
+            OrderedDict()
+        )
+
+    def evaluate(self, challenge: Challenge, tool: str, run_dir: Path) -> EvaluatedRun | None:
+        """Score the run in *run_dir*; None if the spend limit has been reached."""
+        # Once the budget is spent, leave the remaining runs unevaluated
+        # rather than scoring them on heuristics alone.
+        if self.governor is not None and self.governor.exhausted:
+            self.skipped += 1
+            return None
+
+        parser = self.parsers[split_lane(tool)[0]]
+        meta_file = run_dir / "meta.json"
+        meta = read_json(meta_file) if meta_file.exists() else {}
+        success = meta.get("success", True)
+        digest = output_digest(run_dir)
+        memo = self._pair_memo((challenge.id, tool))
+        key = (digest, success)
+
+        duplicate = key in memo
+        stored = False
+        if duplicate:
+            findings, final_results = memo[key]
+            self.reused += 1
+            record_eval_run("duplicate")
+        else:
+            # Parse output, unless this run's findings are already stored
+            version = self._findings_version(parser)
+            findings = read_findings(run_dir, version, digest)
+            stored = findings is not None
+            if not stored:
+                raw_result = RunResult(
+                    tool=tool, success=success, output_text=read_output(run_dir, self._store)
+                )
+                with span("parser.parse", tool=tool):
+                    findings = parser.parse(raw_result)
+                with span("collapse_duplicates", findings=len(findings)):
+                    findings = collapse_duplicates(findings, self.dedup_threshold)
+            self.collapsed += sum(len(f.merged_from) - 1 for f in findings if f.merged_from)
+            record_eval_run("stored" if stored else "parsed")
+            final_results = self._match(challenge, findings)
+            memo[key] = (findings, final_results)
+
+        scored = score_challenge_run(
+            challenge_id=challenge.id,
+            tool=tool,
+            run_index=meta.get("run_index", 0),
+            num_findings=len(findings),
+            match_results=final_results,
+        )
+        if not self.dry_run:
+            with span("aggregate_results"):
+                self.aggregator.add(scored)
+            # Save evaluation, and the findings its finding_index values point into
+            if not stored:
+                write_findings(run_dir, findings, self._findings_version(parser), digest)
+            write_json(run_dir / "evaluation.json", scored)
+        return EvaluatedRun(scored, duplicate)
+
+    def report(self, judge_model: str, tool_model: str) -> BenchmarkReport:
+        with span("aggregate_results"):
+            report = self.aggregator.report(judge_model=judge_model, tool_model=tool_model)
+        report.dedup_threshold = max(self.dedup_threshold, 0.0)
+        if not self.skip_llm:
+            report.judge_stats = self.cascade.stats
+        if self.governor is not None:
+            report.spend = self.governor.report(skipped=self.skipped)
+        return report
+
+    def _pair_memo(self, pair: tuple[str, str]) -> dict:
+        """The memo of *pair*'s outputs, evicting the least recently used pair if full."""
+        memo = self._memo.get(pair)
+        if memo is not None:
+            self._memo.move_to_end(pair)
+            return memo
+        memo = self._memo[pair] = {}
+        if len(self._memo) > MEMO_PAIRS:
+            self._memo.popitem(last=False)
+        return memo
+
+    def _findings_version(self, parser: AbstractOutputParser) -> str:
+        """Version stored with findings, so a changed dedup threshold re-parses them."""
+        if self.dedup_threshold <= 0:
+            return parser.version
+        return f"{parser.version}+dedup{self.dedup_threshold:g}"
+
+    def _match(self, challenge: Challenge, findings: list) -> list:
+        with span("heuristic_match", pairs=len(challenge.issues) * len(findings)):
+            heuristic_results = heuristic_match(challenge.issues, findings, **self.weights)
+        if self.skip_llm:
+            return heuristic_results
+        with span("llm_judge_batch"):
+            return llm_judge_batch(
+                challenge.issues,
+                findings,
+                heuristic_results,
+                model=self.judge_model,
+                cascade=self.cascade,
+                governor=self.governor,
+            )
+
+
+class EvaluationStage:
+    """Evaluates finished runs on a background thread while later tasks run.
+
+    :meth:`submit` blocks once *backlog* runs are waiting, so a slow judge
+    holds back new reviews instead of letting the queue grow without bound.
+    An error evaluating one run is reported through *on_error* and does not
+    stop the others.
+    """
+
+    def __init__(
+        self,
+        evaluator: RunEvaluator,
+        backlog: int = DEFAULT_BACKLOG,
+        on_result: Callable[[EvaluatedRun], None] | None = None,
+        on_error: Callable[[Path, Exception], None] | None = None,
+    ) -> None:
+        self.evaluator = evaluator
+        self.errors = 0
+        self._on_result = on_result
+        self._on_error = on_error
+        self._queue: queue.Queue[tuple[Challenge, str, Path] | None] = queue.Queue(backlog)
+        self._thread = threading.Thread(target=self._loop, name="crb-evaluate", daemon=True)
+
+    def start(self) -> EvaluationStage:
+        self._thread.start()
+        return self
+
+    def submit(self, challenge: Challenge, tool: str, run_dir: Path) -> None:
+        self._queue.put((challenge, tool, run_dir))
+
+    def wait(self) -> None:
+        """Wait for every run submitted so far to be evaluated, keeping the stage running."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Wait for every submitted run to be evaluated."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while (item := self._queue.get()) is not None:
+            try:
+                self._evaluate(*item)
+            finally:
+                self._queue.task_done()
+
+    def _evaluate(self, challenge: Challenge, tool: str, run_dir: Path) -> None:
+        try:
+            evaluated = self.evaluator.evaluate(challenge, tool, run_dir)
+        except Exception as e:
+            self.errors += 1
+            if self._on_error is not None:
+                self._on_error(run_dir, e)
+            return
+        if evaluated is not None and self._on_result is not None:
+            self._on_result(evaluated)
@@ -0,0 +1,122 @@
+"""Sequential stopping for ``crb run --runs auto``.
+
+Instead of a fixed number of runs for every (challenge, tool) pair, each
+pair first gets ``min_runs`` runs. Once those are scored, pairs whose mean
+F1 still has a 95% confidence interval wider than ``±target`` get more
+runs, up to ``max_runs``. Deterministic tools stop after the first round,
+while noisy ones get the runs that actually narrow their estimate.
+
+The number of extra runs is Stein's two-stage estimate, ``(t·s / target)²``
+minus the runs already made, so most pairs settle in one or two rounds
+instead of one run at a time. A pair with fewer than two scored runs
+(because evaluation failed or the tool has no parser) is not extended.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import threading
+from typing import Hashable
+
+from code_review_benchmark.models.evaluation import ChallengeToolResult
+
+DEFAULT_TARGET_CI = 0.05
+DEFAULT_MIN_RUNS = 2
+DEFAULT_MAX_RUNS = 10
+
+# Two-sided 95% Student t quantiles for 1..30 degrees of freedom
+_T_975 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+
+
+def t_quantile(df: int) -> float:
+    """The 97.5th percentile of Student's t with *df* degrees of freedom."""
+    return _T_975[df - 1] if df <= len(_T_975) else 1.96
+
+
+def ci_half_width(values: list[float]) -> float:
+    """Half-width of the 95% confidence interval of the mean of *values*."""
+    if len(values) < 2:
+        return math.inf
+    return t_quantile(len(values) - 1) * statistics.stdev(values) / math.sqrt(len(values))
+
+
+class SequentialRuns:
+    """Decides how many runs each pair gets, from the F1 of the runs scored so far.
+
+    Pairs are identified by any hashable key; ``crb run`` uses
+    ``(challenge_id, tool)``, which is also what :meth:`record` reads from
+    a scored run. :meth:`record` may be called from the evaluation thread.
+    """
+
+    def __init__(
+        self,
+        target: float = DEFAULT_TARGET_CI,
+        min_runs: int = DEFAULT_MIN_RUNS,
+        max_runs: int = DEFAULT_MAX_RUNS,
+    ) -> None:
+        if target <= 0:
+            raise ValueError("the target confidence interval must be positive")
+        if not 2 <= min_runs <= max_runs:
+            raise ValueError("need 2 <= minimum runs <= maximum runs")
+        self.target = target
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+        self._scores: dict[Hashable, list[float]] = {}
+        self._started: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, scored: ChallengeToolResult) -> None:
+        """Note the F1 of a scored run."""
+        with self._lock:
+            self._scores.setdefault((scored.challenge_id, scored.tool), []).append(scored.f1)
+
+    def schedule(self, keys: list[Hashable]) -> dict[Hashable, range]:
+        """Run indices to start next for each of *keys* that needs more runs.
+
+        The first call gives every pair ``min_runs`` runs; later calls only
+        extend pairs that are still too uncertain. Empty once all have settled.
+        """
+        planned: dict[Hashable, range] = {}
+        for key in keys:
+            started = self._started.get(key, 0)
+            extra = self.min_runs if started == 0 else self._extra_runs(key, started)
+            if extra > 0:
+                planned[key] = range(started, started + extra)
+                self._started[key] = started + extra
+        return planned
+
+    def _extra_runs(self, key: Hashable, started: int) -> int:
+        with self._lock:
+            scores = list(self._scores.get(key, ()))
+        if len(scores) < 2 or started >= self.max_runs:
+            return 0
+        if ci_half_width(scores) <= self.target:
+            return 0
+        spread = t_quantile(len(scores) - 1) * statistics.stdev(scores) / self.target
+        needed = math.ceil(spread**2)
+        return min(max(needed - len(scores), 1), self.max_runs - started)
+
+    def unsettled(self) -> list[Hashable]:
+        """Pairs that reached ``max_runs`` with the interval still wider than the target."""
+        with self._lock:
+            return [
+                key
+                for key, scores in self._scores.items()
+                if self._started.get(key, 0) >= self.max_runs
+                and ci_half_width(scores) > self.target
+            ]
+
+    def summary(self) -> str:
+        """One line on how many runs the pairs took."""
+        runs = list(self._started.values())
+        early = sum(1 for n in runs if n < self.max_runs)
+        return (
+            f"Adaptive runs: {sum(runs)} run(s) over {len(runs)} pair(s); "
+            f"{early} settled before {self.max_runs} runs, "
+            f"{len(self.unsettled())} still wider than ±{self.target:g} F1"
+        )
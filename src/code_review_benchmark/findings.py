@@ -0,0 +1,95 @@
+"""Parsed findings stored next to each run's ``evaluation.json``.
+
+``crb evaluate`` writes the findings it parsed to ``findings.jsonl``: a
+header line recording the parser version and the sha256 of the output it
+came from, then one finding per line. ``finding_index`` in
+``evaluation.json`` indexes into these lines, so reports can show what a
+tool actually said (e.g. its false positives) without re-parsing raw output.
+A later evaluate reuses the file when neither the output nor the parser
+version has changed.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from code_review_benchmark.layout import iter_run_dirs
+from code_review_benchmark.models.evaluation import ChallengeToolResult
+from code_review_benchmark.models.finding import NormalizedFinding
+from code_review_benchmark.profiling import span
+from code_review_benchmark.serialization import dumps, loads, read_model
+
+FINDINGS_FILENAME = "findings.jsonl"
+EVALUATION_FILENAME = "evaluation.json"
+
+
+def write_findings(
+    result_dir: Path,
+    findings: list[NormalizedFinding],
+    parser_version: str,
+    output_sha256: str | None,
+) -> None:
+    header = {
+        "parser_version": parser_version,
+        "output_sha256": output_sha256,
+        "count": len(findings),
+    }
+    lines = [dumps(header)]
+    lines.extend(f.model_dump_json(exclude_defaults=True).encode() for f in findings)
+    # Replace rather than overwrite: after `crb merge` the file may be a hard
+    # link into the source run directory, which must not change.
+    path = result_dir / FINDINGS_FILENAME
+    tmp = path.with_name(f".{FINDINGS_FILENAME}.tmp")
+    with span("write_findings", cat="io"):
+        tmp.write_bytes(b"\n".join(lines) + b"\n")
+        os.replace(tmp, path)
+
+
+def read_findings(
+    result_dir: Path,
+    parser_version: str | None = None,
+    output_sha256: str | None = None,
+) -> list[NormalizedFinding] | None:
+    """Stored findings, or None if absent or written for another parser version or output.
+
+    Pass ``None`` for either key to accept whatever the file was written with.
+    """
+    path = result_dir / FINDINGS_FILENAME
+    if not path.exists():
+        return None
+    with span("read_findings", cat="io"):
+        lines = path.read_bytes().splitlines()
+    if not lines:
+        return None
+    header = loads(lines.pop(0))
+    if parser_version is not None and header.get("parser_version") != parser_version:
+        return None
+    if output_sha256 is not None and header.get("output_sha256") != output_sha256:
+        return None
+    try:
+        findings = [NormalizedFinding.model_validate_json(line) for line in lines if line]
+    except ValueError:
+        return None  # truncated write
+    return findings if len(findings) == header.get("count") else None
+
+
+def false_positives(result_dir: Path) -> list[tuple[int, NormalizedFinding]]:
+    """``(index, finding)`` for each stored finding that matched no ground-truth issue."""
+    evaluation = result_dir / EVALUATION_FILENAME
+    findings = read_findings(result_dir)
+    if findings is None or not evaluation.exists():
+        return []
+    scored = read_model(evaluation, ChallengeToolResult)
+    matched = {m.finding_index for m in scored.matches if m.matched}
+    return [(i, f) for i, f in enumerate(findings) if i not in matched]
+
+
+def iter_false_positives(
+    run_path: Path,
+) -> Iterator[tuple[str, str, int, NormalizedFinding]]:
+    """``(challenge_id, tool, run_index, finding)`` for every false positive under *run_path*."""
+    for challenge_id, tool, run_index, path in iter_run_dirs(run_path):
+        for _, finding in false_positives(path):
+            yield challenge_id, tool, run_index, finding
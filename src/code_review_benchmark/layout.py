@@ -0,0 +1,44 @@
+"""Layout of a run directory.
+
+Each run's files live in ``{challenge}/{tool}/run_N/`` under the run
+directory, ``{tool}`` being a lane name (``{tool}@{model}``) in a
+``--models`` sweep. The blob store and the filesystem task queue are kept
+there too, and are not challenges.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+from code_review_benchmark.blobstore import BLOBS_DIRNAME, has_output
+from code_review_benchmark.workqueue.base import QUEUE_DIRNAME
+
+RUN_DIR_PATTERN = re.compile(r"^run_(\d+)$")
+
+# Directories in a run directory that are not challenges
+_NOT_CHALLENGES = (BLOBS_DIRNAME, QUEUE_DIRNAME)
+
+
+def result_dir_for(run_dir: Path, challenge_id: str, tool: str, run_index: int) -> Path:
+    """Directory holding the outputs of one run."""
+    return run_dir / challenge_id / tool / f"run_{run_index}"
+
+
+def challenge_dirs(run_dir: Path) -> list[Path]:
+    """The per-challenge directories of *run_dir*, sorted by name."""
+    return sorted(p for p in run_dir.iterdir() if p.is_dir() and p.name not in _NOT_CHALLENGES)
+
+
+def iter_run_dirs(run_dir: Path) -> Iterator[tuple[str, str, int, Path]]:
+    """Yield ``(challenge_id, tool, run_index, path)`` for every run under *run_dir*."""
+    for challenge_dir in challenge_dirs(run_dir):
+        for tool_dir in sorted(p for p in challenge_dir.iterdir() if p.is_dir()):
+            runs = []
+            for path in tool_dir.iterdir():
+                m = RUN_DIR_PATTERN.match(path.name)
+                if m and path.is_dir() and has_output(path):
+                    runs.append((int(m.group(1)), path))
+            for run_index, path in sorted(runs):
+                yield challenge_dir.name, tool_dir.name, run_index, path
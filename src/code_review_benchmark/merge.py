@@ -0,0 +1,198 @@
+"""Combine run directories produced by separate executions.
+
+Runs are unioned into one ``{challenge}/{tool}/run_N/`` tree. When two
+sources both have ``run_N`` for the same pair, the later one is re-indexed to
+the next free index and its ``meta.json``/``evaluation.json`` are rewritten to
+match. Large artifacts are hard-linked (or reflinked, or copied as a last
+resort); the small JSON files are always written fresh so re-evaluating the
+merged directory never modifies a source. Outputs kept in a source's blob
+store are linked into the merged directory's store along with their pointers.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from code_review_benchmark.blobstore import (
+    BLOBS_DIRNAME,
+    OUTPUT_POINTER,
+    BlobStore,
+    store_for,
+)
+from code_review_benchmark.layout import iter_run_dirs
+from code_review_benchmark.models.challenge import Challenge
+from code_review_benchmark.models.evaluation import ChallengeToolResult
+from code_review_benchmark.serialization import read_json, read_model, write_json
+
+MANIFEST_FILENAME = "merge.json"
+
+# Rewritten per run rather than linked
+_REWRITTEN = {"meta.json", "evaluation.json"}
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/XFS
+_FICLONE = 0x40049409
+
+
+class MergeError(Exception):
+    """Raised when run directories cannot be merged safely."""
+
+
+@dataclass
+class MergedRun:
+    source: str
+    target: str
+    link: str  # "hardlink", "reflink" or "copy"
+    evaluated: bool
+
+
+@dataclass
+class MergeResult:
+    output: Path
+    runs: list[MergedRun] = field(default_factory=list)
+    reindexed: int = 0
+    challenge_hashes: dict[str, str] = field(default_factory=dict)
+    unverified: list[str] = field(default_factory=list)
+
+
+def merge_run_dirs(
+    sources: list[Path],
+    output: Path,
+    challenges: dict[str, Challenge] | None = None,
+) -> MergeResult:
+    """Merge *sources* into *output* (which may already hold runs).
+
+    Every run's ``challenge_hash`` must agree across sources and, when
+    *challenges* is given, with the current challenge definitions. Runs from
+    before hashes were recorded are merged but listed as unverified.
+    """
+    output = output.resolve()
+    for source in sources:
+        if source.resolve() == output:
+            raise MergeError(f"Output directory {output} is also a source")
+        if not source.is_dir():
+            raise MergeError(f"Run directory not found: {source}")
+
+    result = MergeResult(output=output)
+    current = {cid: ch.fingerprint() for cid, ch in (challenges or {}).items()}
+    taken: dict[tuple[str, str], set[int]] = {}
+    if output.exists():
+        for cid, tool, run_index, path in iter_run_dirs(output):
+            taken.setdefault((cid, tool), set()).add(run_index)
+            _check_hash(result, current, cid, read_json(path / "meta.json"), path)
+
+    # Validate everything before writing anything
+    planned = []
+    for source in sources:
+        for cid, tool, run_index, path in iter_run_dirs(source):
+            meta_file = path / "meta.json"
+            meta = read_json(meta_file) if meta_file.exists() else {}
+            _check_hash(result, current, cid, meta, path)
+            pointer = path / OUTPUT_POINTER
+            if pointer.exists() and store_for(source).find(read_json(pointer)["sha256"]) is None:
+                raise MergeError(f"{pointer}: its output is missing from {source / BLOBS_DIRNAME}")
+            planned.append((cid, tool, run_index, path, meta))
+
+    output_store = store_for(output)
+    for cid, tool, run_index, path, meta in planned:
+        used = taken.setdefault((cid, tool), set())
+        new_index = run_index
+        if new_index in used:
+            new_index = max(used) + 1
+            result.reindexed += 1
+        used.add(new_index)
+
+        target = output / cid / tool / f"run_{new_index}"
+        target.mkdir(parents=True, exist_ok=True)
+        link = "copy"
+        for item in sorted(path.iterdir()):
+            if item.is_file() and item.name not in _REWRITTEN:
+                link = _link_or_copy(item, target / item.name)
+        if (path / OUTPUT_POINTER).exists():
+            _link_blob(store_for(path.parents[2]), output_store, path / OUTPUT_POINTER)
+
+        meta["run_index"] = new_index
+        write_json(target / "meta.json", meta)
+        evaluated = (path / "evaluation.json").exists()
+        if evaluated:
+            scored = read_model(path / "evaluation.json", ChallengeToolResult)
+            scored.run_index = new_index
+            write_json(target / "evaluation.json", scored)
+
+        result.runs.append(
+            MergedRun(
+                source=str(path),
+                target=str(target.relative_to(output)),
+                link=link,
+                evaluated=evaluated,
+            )
+        )
+
+    return result
+
+
+def write_manifest(result: MergeResult, sources: list[Path]) -> Path:
+    """Record where every merged run came from."""
+    manifest = result.output / MANIFEST_FILENAME
+    write_json(
+        manifest,
+        {
+            "sources": [str(s.resolve()) for s in sources],
+            "runs": [run.__dict__ for run in result.runs],
+            "reindexed": result.reindexed,
+            "challenge_hashes": result.challenge_hashes,
+            "unverified": sorted(set(result.unverified)),
+        },
+        pretty=True,
+    )
+    return manifest
+
+
+def _check_hash(
+    result: MergeResult, current: dict[str, str], challenge_id: str, meta: dict, path: Path
+) -> None:
+    recorded = meta.get("challenge_hash")
+    if not recorded:
+        result.unverified.append(challenge_id)
+        return
+    expected = result.challenge_hashes.setdefault(challenge_id, current.get(challenge_id, recorded))
+    if recorded != expected:
+        raise MergeError(
+            f"{path}: challenge {challenge_id!r} hash {recorded} does not match {expected}; "
+            "these runs were produced against a different version of the challenge"
+        )
+
+
+def _link_blob(source_store: BlobStore, output_store: BlobStore, pointer: Path) -> None:
+    """Link the blob *pointer* names into *output_store*, unless it is already there."""
+    digest = read_json(pointer)["sha256"]
+    if output_store.find(digest) is not None:
+        return
+    blob, codec = source_store.find(digest)
+    target = output_store.path_for(digest, codec)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _link_or_copy(blob, target)
+
+
+def _link_or_copy(src: Path, dst: Path) -> str:
+    """Hard-link *src* to *dst*, falling back to a reflink, then a plain copy."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return "reflink"
+    except (ImportError, OSError):
+        shutil.copy2(src, dst)
+        return "copy"
@@ -0,0 +1,267 @@
+"""Live progress metrics as a Prometheus textfile (``--metrics-file``).
+
+A long ``crb run``/``crb worker``/``crb evaluate`` periodically rewrites a
+text exposition file, which node-exporter's textfile collector picks up
+(``--collector.textfile.directory``). Nothing listens on a port. The file is
+replaced atomically, so a scrape never sees a partial write.
+
+The metrics below are always recorded; it costs a dict update under a lock
+per task, LLM call or judged pair. They are written only when a
+:class:`TextfileExporter` is running. Useful alerts:
+
+- stalls: ``time() - crb_last_task_timestamp_seconds``
+- throughput: ``rate(crb_tasks_total[30m])`` per tool
+- evaluate cache hit ratio: ``crb_eval_cache_hit_ratio``
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+
+# Seconds; spans fast judge calls to tools that run for many minutes
+DEFAULT_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+DEFAULT_INTERVAL = 15.0
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = super().render()
+        lines.extend(
+            f"{self.name}{_labels(self.labelnames, key)} {_number(v)}" for key, v in values
+        )
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values -> ([count per bucket], sum)
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * len(self.buckets), [0.0]))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            series = sorted((k, (list(c), t[0])) for k, (c, t) in self._series.items())
+        lines = super().render()
+        for key, (counts, total) in series:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.metrics: list[_Metric] = []
+
+    def add(self, metric: _Metric) -> _Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+TASKS = registry.add(
+    Counter("crb_tasks_total", "Tool runs finished, by outcome.", ("tool", "status"))
+)
+TASKS_IN_FLIGHT = registry.add(Gauge("crb_tasks_in_flight", "Tool runs currently executing."))
+TASKS_PLANNED = registry.add(Gauge("crb_tasks_planned", "Tool runs this process intends to run."))
+LAST_TASK = registry.add(
+    Gauge("crb_last_task_timestamp_seconds", "Unix time the last tool run finished.")
+)
+TASK_SECONDS = registry.add(
+    Histogram("crb_task_duration_seconds", "Wall time of one tool run.", ("tool",))
+)
+LLM_SECONDS = registry.add(
+    Histogram(
+        "crb_llm_request_duration_seconds",
+        "Latency of one LLM request by a reviewer tool or the judge (tool=judge).",
+        ("tool", "provider", "model"),
+    )
+)
+LLM_ERRORS = registry.add(
+    Counter("crb_llm_request_errors_total", "Failed LLM requests.", ("tool", "provider", "model"))
+)
+TOKENS = registry.add(
+    Counter(
+        "crb_tokens_total",
+        "Estimated tokens sent and received (about four characters per token).",
+        ("tool", "model", "direction"),
+    )
+)
+JUDGE_PAIRS = registry.add(
+    Counter(
+        "crb_judge_pairs_total",
+        "Candidate pairs by how they were routed; judge and audit pairs go to the LLM "
+        "unless the spend limit refuses them (also counted as over_budget).",
+        ("decision",),
+    )
+)
+EVAL_RUNS = registry.add(
+    Counter(
+        "crb_eval_runs_total",
+        "Runs evaluated, by where their findings came from "
+        "(parsed, stored findings.jsonl, or an identical earlier output).",
+        ("source",),
+    )
+)
+EVAL_CACHE_HIT_RATIO = registry.add(
+    Gauge("crb_eval_cache_hit_ratio", "Share of evaluated runs that did not need parsing.")
+)
+LAST_WRITE = registry.add(
+    Gauge("crb_metrics_timestamp_seconds", "Unix time this file was written.")
+)
+
+
+def record_eval_run(source: str) -> None:
+    """Count one evaluated run; *source* is ``parsed``, ``stored`` or ``duplicate``."""
+    EVAL_RUNS.inc(source=source)
+    total = sum(EVAL_RUNS.value(source=s) for s in ("parsed", "stored", "duplicate"))
+    EVAL_CACHE_HIT_RATIO.set(1 - EVAL_RUNS.value(source="parsed") / total)
+
+
+class TextfileExporter:
+    """Rewrites *path* with the registry's metrics every *interval* seconds until closed."""
+
+    def __init__(
+        self, path: Path, interval: float = DEFAULT_INTERVAL, source: Registry = registry
+    ) -> None:
+        self.path = path
+        self.interval = interval
+        self.source = source
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="crb-metrics", daemon=True)
+
+    def start(self) -> TextfileExporter:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.write()
+        self._thread.start()
+        atexit.register(self.close)
+        return self
+
+    def write(self) -> None:
+        LAST_WRITE.set(round(time.time(), 3))
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text(self.source.render())
+        os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        """Stop the writer thread and write the final values."""
+        if self._stop.is_set():
+            return
+        atexit.unregister(self.close)
+        self._stop.set()
+        self._thread.join()
+        self.write()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+
+def export_metrics(path: str | None) -> TextfileExporter | None:
+    """Start exporting to *path* (or ``CRB_METRICS_FILE``), every ``CRB_METRICS_INTERVAL`` s."""
+    path = path or os.environ.get("CRB_METRICS_FILE")
+    if not path:
+        return None
+    interval = float(os.environ.get("CRB_METRICS_INTERVAL", DEFAULT_INTERVAL))
+    return TextfileExporter(Path(path), interval).start()
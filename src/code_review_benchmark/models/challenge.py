@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from enum import Enum
 from pathlib import Path
 
@@ -64,6 +65,23 @@ class Challenge(BaseModel):
         assert self.base_path is not None
         return self.base_path / "after"
 
+    def fingerprint(self) -> str:
+        """Content hash of the challenge directory (definition plus before/after trees).
+
+        Stored with every run so results produced against different versions
+        of a challenge are never mixed.
+        """
+        assert self.base_path is not None
+        digest = hashlib.sha256()
+        for path in sorted(self.base_path.rglob("*")):
+            rel = path.relative_to(self.base_path)
+            if not path.is_file() or any(part.startswith(".") for part in rel.parts):
+                continue
+            data = path.read_bytes()
+            digest.update(f"{rel.as_posix()}\0{len(data)}\0".encode())
+            digest.update(data)
+        return digest.hexdigest()[:16]
+
     @classmethod
     def from_yaml(cls, path: Path) -> Challenge:
         with open(path) as f:
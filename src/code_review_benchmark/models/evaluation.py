@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class MatchResult(BaseModel):
@@ -10,8 +10,9 @@ class MatchResult(BaseModel):
     finding_index: int | None = None  # index into the tool's findings list
     matched: bool = False
     match_score: float = 0.0  # 0-1 confidence
-    match_method: str = ""  # "heuristic", "llm_judge", or "both"
+    match_method: str = ""  # "heuristic", "llm_judge", "heuristic+llm_judge" or "cascade_*"
     explanation: str = ""
+    heuristic_score: float | None = None  # heuristic score of the judged pair, if any
 
 
 class ChallengeToolResult(BaseModel):
@@ -25,8 +26,23 @@ class ChallengeToolResult(BaseModel):
     f1: float = 0.0
 
 
+class ChallengeSummary(BaseModel):
+    """One tool's runs on one challenge, averaged; reported with or without per-run results."""
+
+    challenge_id: str
+    runs: int = 0
+    precision: float = 0.0
+    recall: float = 0.0
+    f1: float = 0.0
+    # Means per run
+    findings: float = 0.0
+    matched: float = 0.0
+    ground_truths: float = 0.0
+
+
 class ToolScore(BaseModel):
     tool: str
+    model: str | None = None  # set for tool@model lanes of a model sweep
     challenges_run: int = 0
     total_ground_truths: int = 0
     total_findings: int = 0
@@ -38,6 +54,9 @@ class ToolScore(BaseModel):
     stddev_recall: float = 0.0
     stddev_f1: float = 0.0
     per_challenge: list[ChallengeToolResult] = Field(default_factory=list)
+    # Runs scored per challenge; differs between challenges with `--runs auto`
+    runs_per_challenge: dict[str, int] = Field(default_factory=dict)
+    challenge_summaries: list[ChallengeSummary] = Field(default_factory=list)
     metrics_breakdown: MetricsBreakdown | None = None
 
 
@@ -62,11 +81,51 @@ class MetricsBreakdown(BaseModel):
     by_language: list[CategoryMetrics] = Field(default_factory=list)
 
 
+class JudgeStats(BaseModel):
+    """How ground-truth/finding pairs were decided during evaluation."""
+
+    pairs: int = 0  # pairs with a heuristic candidate
+    llm_calls: int = 0
+    accepted: int = 0  # decided as a match from the heuristic score alone
+    rejected: int = 0  # decided as no match from the heuristic score alone
+    audited: int = 0  # confident pairs sent to the judge anyway, as a spot check
+    audit_disagreements: int = 0
+    local_decisions: int = 0  # decided offline by the distilled local judge
+    over_budget: int = 0  # decided by heuristic score because the spend limit was reached
+    reject_below: float = 0.1
+    accept_above: float | None = None
+
+    @computed_field
+    @property
+    def llm_fraction(self) -> float:
+        return self.llm_calls / self.pairs if self.pairs else 0.0
+
+
+class SpendReport(BaseModel):
+    """Estimated API usage of a run or evaluation, and whether a budget cut it short."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    unpriced_models: list[str] = Field(default_factory=list)  # not included in cost_usd
+    max_spend: float | None = None
+    max_calls: int | None = None
+    exhausted: bool = False
+    denied_calls: int = 0
+    skipped: int = 0  # tasks or runs never started because the budget ran out
+    estimated: bool = True
+
+
 class BenchmarkReport(BaseModel):
     timestamp: str
     judge_model: str = ""
     tool_model: str = ""
     num_runs: int = 1
+    # Similarity at which near-duplicate findings were collapsed (0 = not collapsed)
+    dedup_threshold: float = 0.0
     challenges: list[str] = Field(default_factory=list)
     tools: list[ToolScore] = Field(default_factory=list)
     metrics_breakdown: MetricsBreakdown | None = None
+    judge_stats: JudgeStats | None = None
+    spend: SpendReport | None = None
@@ -18,3 +18,5 @@ class NormalizedFinding(BaseModel):
     description: str = ""
     raw_text: str = ""
     keywords: list[str] = Field(default_factory=list)
+    # Positions in the parser's output of the near-duplicates collapsed into this one
+    merged_from: list[int] = Field(default_factory=list)
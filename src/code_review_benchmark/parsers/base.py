@@ -11,6 +11,10 @@ from code_review_benchmark.runners.base import RunResult
 class AbstractOutputParser(ABC):
     """Parses raw tool output into normalized findings."""
 
+    # Stored with each run's findings.jsonl; bump it when parse() would now
+    # produce different findings from the same output, so stored ones are redone.
+    version = "1"
+
     @property
     @abstractmethod
     def tool_name(self) -> str:
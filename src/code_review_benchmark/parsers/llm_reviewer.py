@@ -13,6 +13,7 @@ from code_review_benchmark.models.challenge import Severity
 from code_review_benchmark.models.finding import NormalizedFinding
 from code_review_benchmark.parsers.base import AbstractOutputParser
 from code_review_benchmark.runners.base import RunResult
+from code_review_benchmark.runners.diff_shards import UNSTRUCTURED_HEADER
 
 _SEVERITY_MAP: dict[str, Severity] = {
     "critical": Severity.CRITICAL,
@@ -38,7 +39,8 @@ class LLMReviewerParser(AbstractOutputParser):
             return []
 
         findings: list[NormalizedFinding] = []
-        text = result.output_text
+        # A merged sharded review keeps free-text shard reviews after the findings.
+        text, _, unstructured = result.output_text.partition(UNSTRUCTURED_HEADER)
 
         # Split on "### Finding N" headers.
         finding_blocks = re.split(r"###\s+Finding\s+\d+", text)
@@ -52,7 +54,7 @@ class LLMReviewerParser(AbstractOutputParser):
         if not findings:
             findings = self._parse_freetext(text)
 
-        return findings
+        return findings + self._parse_freetext(unstructured)
 
     def _parse_finding_block(self, block: str) -> NormalizedFinding | None:
         file_match = re.search(r"\*\*File\*\*:\s*`?([^`\n]+?)`?\s*$", block, re.MULTILINE)
@@ -0,0 +1,197 @@
+"""Phase timing for `crb run`, `crb evaluate` and `crb report` (``--profile``).
+
+Code marks its phases with :func:`span`::
+
+    with span("parse", tool=tool_name):
+        findings = parser.parse(raw_result)
+
+When profiling is off (the default) ``span`` returns a shared no-op context
+manager, so a span costs one attribute check. With ``--profile`` every span
+becomes a complete ("X") event in a Chrome trace-event file,
+``profile-<command>.trace.json``, which opens in https://ui.perfetto.dev or
+``chrome://tracing``. A per-phase summary is printed and stored in the
+trace's ``otherData``.
+
+``CRB_PROFILE_DETAIL`` adds more, at a cost:
+
+- ``cpu`` — cProfile the main thread and write ``profile-<command>.pstats``
+- ``memory`` — trace allocations and record each span's peak (``peak_kib``);
+  allocations by other threads running at the same time are included
+"""
+
+from __future__ import annotations
+
+import atexit
+import cProfile
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager
+
+_NULL = nullcontext()
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.command = ""
+        # Where finish() writes; set by the command once it knows its output directory
+        self.output_dir: Path | None = None
+        self.events: list[dict] = []
+        self._origin = 0
+        self._cpu: cProfile.Profile | None = None
+        self._memory = False
+        self._local = threading.local()
+        self._root: ContextManager | None = None
+
+    def start(self, command: str, cpu: bool = False, memory: bool = False) -> None:
+        """Start recording; the trace is written by :meth:`finish` or at exit."""
+        self.command = command
+        self.events = []
+        self._origin = time.perf_counter_ns()
+        self._local = threading.local()
+        self._memory = memory
+        if memory:
+            tracemalloc.start()
+        if cpu:
+            self._cpu = cProfile.Profile()
+            self._cpu.enable()
+        self.enabled = True
+        self._root = self.span(command, cat="command")
+        self._root.__enter__()
+        atexit.register(self.finish)
+
+    def span(self, name: str, cat: str = "phase", **args) -> ContextManager:
+        if not self.enabled:
+            return _NULL
+        return _Span(self, name, cat, args)
+
+    def finish(self) -> list[Path]:
+        """Stop recording and write the trace (and pstats); returns the files written."""
+        if not self.enabled:
+            return []
+        atexit.unregister(self.finish)
+        self._root.__exit__(None, None, None)
+        self.enabled = False
+        if self._cpu is not None:
+            self._cpu.disable()
+        if self._memory:
+            self._memory = False
+            tracemalloc.stop()
+
+        written: list[Path] = []
+        if self.output_dir is not None:
+            from code_review_benchmark.serialization import write_json
+
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            trace = self.output_dir / f"profile-{self.command}.trace.json"
+            write_json(
+                trace,
+                {
+                    "traceEvents": self.events + self._thread_names(),
+                    "displayTimeUnit": "ms",
+                    "otherData": {"command": self.command, "phases": self.summary()},
+                },
+            )
+            written.append(trace)
+            if self._cpu is not None:
+                stats = self.output_dir / f"profile-{self.command}.pstats"
+                self._cpu.dump_stats(stats)
+                written.append(stats)
+            self._print_summary(written)
+        self._cpu = None
+        return written
+
+    def summary(self) -> dict[str, dict]:
+        """Calls, total and max milliseconds (and peak memory) per span name."""
+        phases: dict[str, dict] = {}
+        for event in self.events:
+            phase = phases.setdefault(event["name"], {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            ms = event["dur"] / 1000
+            phase["calls"] += 1
+            phase["total_ms"] = round(phase["total_ms"] + ms, 3)
+            phase["max_ms"] = round(max(phase["max_ms"], ms), 3)
+            if "peak_kib" in event["args"]:
+                phase["peak_kib"] = max(phase.get("peak_kib", 0), event["args"]["peak_kib"])
+        return dict(sorted(phases.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def _thread_names(self) -> list[dict]:
+        names = {t.native_id: t.name for t in threading.enumerate()}
+        tids = sorted({event["tid"] for event in self.events})
+        return [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": names.get(tid, str(tid))},
+            }
+            for tid in tids
+        ]
+
+    def _print_summary(self, written: list[Path]) -> None:
+        lines = [f"Profile ({self.command}):"]
+        for name, phase in list(self.summary().items())[:12]:
+            peak = f"  peak {phase['peak_kib']:,} KiB" if "peak_kib" in phase else ""
+            lines.append(f"  {name:<28} {phase['calls']:>6}×  {phase['total_ms']:>12,.1f} ms{peak}")
+        lines.extend(f"  wrote {path}" for path in written)
+        print("\n".join(lines), file=sys.stderr)
+
+
+class _Span:
+    __slots__ = ("_profiler", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, profiler: Profiler, name: str, cat: str, args: dict) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._cat = cat
+        self._args = args
+
+    def __enter__(self) -> _Span:
+        if self._profiler._memory:
+            # Fold the enclosing span's peak so far into its stack entry, then
+            # reset so this span's peak is its own.
+            stack = self._profiler._local.__dict__.setdefault("peaks", [])
+            if stack:
+                stack[-1] = max(stack[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            stack.append(0)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter_ns()
+        args = self._args
+        if self._profiler._memory:
+            stack = self._profiler._local.peaks
+            peak = max(stack.pop(), tracemalloc.get_traced_memory()[1])
+            args = {**args, "peak_kib": peak // 1024}
+            if stack:
+                stack[-1] = max(stack[-1], peak)
+        self._profiler.events.append(
+            {
+                "name": self._name,
+                "cat": self._cat,
+                "ph": "X",
+                "ts": (self._start - self._profiler._origin) / 1000,
+                "dur": (end - self._start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": args,
+            }
+        )
+
+
+# Shared by everything in the process
+profiler = Profiler()
+span = profiler.span
+
+
+def start_profiling(command: str) -> None:
+    """Start the shared profiler for *command*, with detail from ``CRB_PROFILE_DETAIL``."""
+    detail = {part.strip() for part in os.environ.get("CRB_PROFILE_DETAIL", "").split(",")}
+    profiler.start(command, cpu="cpu" in detail, memory="memory" in detail)
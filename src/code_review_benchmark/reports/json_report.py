@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
 from code_review_benchmark.models.evaluation import BenchmarkReport
+from code_review_benchmark.serialization import dumps
 
 
 def generate_json_report(report: BenchmarkReport) -> str:
     """Serialize a BenchmarkReport to formatted JSON."""
-    return json.dumps(report.model_dump(), indent=2)
+    return dumps(report, pretty=True).decode()
 
 
 def generate_dashboard_json(
@@ -49,6 +49,7 @@ def generate_dashboard_json(
         # Overall score for this tool
         overall = {
             "tool": tool_score.tool,
+            "model": tool_score.model,
             "metrics": {
                 "avg_precision": tool_score.mean_precision,
                 "avg_recall": tool_score.mean_recall,
@@ -96,6 +97,23 @@ def generate_dashboard_json(
 
         dashboard_data["overall_scores"].append(overall)
 
+        # Reports without per-run results (the default) have per-challenge means
+        for summary in [] if tool_score.per_challenge else tool_score.challenge_summaries:
+            dashboard_data["results"].append(
+                {
+                    "tool": tool_score.tool,
+                    "challenge": summary.challenge_id,
+                    "metrics": {
+                        "precision": summary.precision,
+                        "recall": summary.recall,
+                        "f1_score": summary.f1,
+                        "true_positives": round(summary.matched),
+                        "false_positives": round(summary.findings - summary.matched),
+                        "false_negatives": round(summary.ground_truths - summary.matched),
+                    },
+                }
+            )
+
         # Add per-challenge results
         for challenge_result in tool_score.per_challenge:
             dashboard_data["results"].append(
@@ -155,4 +173,4 @@ def generate_dashboard_json(
             ],
         }
 
-    return json.dumps(dashboard_data, indent=2)
+    return dumps(dashboard_data).decode()
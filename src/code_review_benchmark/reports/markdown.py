@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from code_review_benchmark.models.evaluation import BenchmarkReport
+from code_review_benchmark.models.finding import NormalizedFinding
 
 
-def generate_markdown_report(report: BenchmarkReport) -> str:
-    """Generate a markdown comparison table from a BenchmarkReport."""
+def generate_markdown_report(
+    report: BenchmarkReport,
+    false_positives: dict[str, list[tuple[str, int, NormalizedFinding]]] | None = None,
+) -> str:
+    """Generate a markdown comparison table from a BenchmarkReport.
+
+    *false_positives* maps a tool to ``(challenge_id, run_index, finding)``
+    entries for unmatched findings to list in their own section.
+    """
     lines: list[str] = []
 
     lines.append("# Code Review Benchmark Results")
@@ -18,6 +26,17 @@ def generate_markdown_report(report: BenchmarkReport) -> str:
         lines.append(f"**Tool Model**: {report.tool_model}")
     lines.append(f"**Runs per pair**: {report.num_runs}")
     lines.append(f"**Challenges**: {len(report.challenges)}")
+    if report.judge_stats:
+        stats = report.judge_stats
+        lines.append(
+            f"**Judge calls**: {stats.llm_calls}/{stats.pairs} pairs "
+            f"({stats.llm_fraction:.1%}); the rest decided by heuristic score"
+            + (f" or the local judge ({stats.local_decisions})" if stats.local_decisions else "")
+        )
+    if report.spend and report.spend.exhausted:
+        lines.append(
+            f"**Partial**: spend limit reached; {report.spend.skipped} run(s) not evaluated"
+        )
     lines.append("")
 
     # Summary table
@@ -37,6 +56,22 @@ def generate_markdown_report(report: BenchmarkReport) -> str:
 
     lines.append("")
 
+    # Model sweeps: every tool's lanes pooled per model
+    swept = [tool for tool in report.tools if tool.model]
+    if swept:
+        lines.append("### By Model")
+        lines.append("")
+        lines.append("| Model | Tools | Mean F1 | Findings | Matched |")
+        lines.append("|-------|-------|---------|----------|---------|")
+        for model in sorted({tool.model for tool in swept}):
+            lanes = [tool for tool in swept if tool.model == model]
+            f1 = sum(tool.mean_f1 for tool in lanes) / len(lanes)
+            findings = sum(tool.total_findings for tool in lanes)
+            matched = sum(tool.total_matched for tool in lanes)
+            truths = sum(tool.total_ground_truths for tool in lanes)
+            lines.append(f"| {model} | {len(lanes)} | {f1:.2%} | {findings} | {matched}/{truths} |")
+        lines.append("")
+
     # Metrics breakdown by category, severity, and language
     if report.metrics_breakdown:
         lines.append("## Metrics Breakdown")
@@ -123,6 +158,15 @@ def generate_markdown_report(report: BenchmarkReport) -> str:
         lines.append("|------|-----|----------|-----------|--------|-----|")
 
         for tool in report.tools:
+            # Reports without per-run results (the default) have per-challenge means
+            for summary in [] if tool.per_challenge else tool.challenge_summaries:
+                if summary.challenge_id != challenge_id:
+                    continue
+                lines.append(
+                    f"| {tool.tool} | mean of {summary.runs} | {summary.findings:g} | "
+                    f"{summary.precision:.2%} | {summary.recall:.2%} | {summary.f1:.2%} |"
+                )
+
             for result in tool.per_challenge:
                 if result.challenge_id != challenge_id:
                     continue
@@ -141,4 +185,21 @@ def generate_markdown_report(report: BenchmarkReport) -> str:
 
         lines.append("")
 
+    if false_positives is not None:
+        lines.append("## False Positives")
+        lines.append("")
+        for tool in sorted(false_positives):
+            lines.append(f"### {tool}")
+            lines.append("")
+            lines.append("| Challenge | Run | Location | Finding |")
+            lines.append("|-----------|-----|----------|---------|")
+            for challenge_id, run_index, finding in false_positives[tool]:
+                location = finding.file or ""
+                if finding.file and finding.line_start is not None:
+                    location += f":{finding.line_start}"
+                text = (finding.title or finding.description or finding.raw_text).splitlines()
+                summary = (text[0] if text else "").replace("|", "\\|")[:120]
+                lines.append(f"| {challenge_id} | {run_index} | {location} | {summary} |")
+            lines.append("")
+
     return "\n".join(lines)
@@ -8,8 +8,49 @@ and returning the raw output in a standardized format.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
+from urllib.parse import quote, unquote
+
+# Files every run writes into its result directory
+OUTPUT_FILENAME = "output.txt"
+STDERR_FILENAME = "stderr.txt"
+
+# Separates tool and model in the name of a `crb run --models` lane
+LANE_SEPARATOR = "@"
+
+
+def lane_name(tool: str, model: str | None) -> str:
+    """Name of the (tool, model) lane, e.g. ``claude-reviewer@claude-sonnet-4-20250514``.
+
+    The model is percent-encoded, so the name is a safe directory name.
+    """
+    if model is None:
+        return tool
+    return f"{tool}{LANE_SEPARATOR}{quote(model, safe='')}"
+
+
+def split_lane(name: str) -> tuple[str, str | None]:
+    """``(tool, model)`` of a lane name; model is None for a plain tool name."""
+    tool, sep, model = name.partition(LANE_SEPARATOR)
+    return tool, unquote(model) if sep else None
+
+
+@dataclass
+class RunContext:
+    """Where a run's outputs go, passed to runners by the executor.
+
+    Runners that spawn a tool stream its stdout/stderr straight into
+    ``result_dir`` rather than holding them in memory; ``on_output`` is
+    called with the running count of output lines. ``shared`` lives as long
+    as the repo, so runners can compute things about it once.
+    """
+
+    result_dir: Path
+    on_output: Callable[[int], None] | None = None
+    # Artifacts (e.g. the PR diff) shared by every task run on the same challenge repo
+    shared: dict = field(default_factory=dict)
 
 
 @dataclass
@@ -22,6 +63,10 @@ class RunResult:
     output_files: list[Path] | None = None
     error: str = ""
     return_code: int = 0
+    metadata: dict = field(default_factory=dict)  # extra fields for meta.json
+    # True when output.txt/stderr.txt are already in the result dir; output_text
+    # is then empty and error holds only the tail of stderr
+    streamed: bool = False
 
 
 class AbstractToolRunner(ABC):
@@ -48,6 +93,7 @@ class AbstractToolRunner(ABC):
         pr_branch: str,
         main_branch: str,
         model: str | None = None,
+        context: RunContext | None = None,
     ) -> RunResult:
         """Execute the tool against the repo and return raw output.
 
@@ -56,6 +102,7 @@ class AbstractToolRunner(ABC):
             pr_branch: Name of the branch containing changes to review
             main_branch: Name of the base branch (typically 'main')
             model: Optional AI model to use (tool-specific)
+            context: Result directory to stream outputs into, if any
 
         Returns:
             RunResult containing the tool's output and execution status
@@ -18,6 +18,8 @@ _BEDROCK_MODEL_MAP = {
 
 @register_tool
 class ClaudeReviewerRunner(AbstractLLMReviewer):
+    provider = "anthropic"
+
     @property
     def name(self) -> str:
         return "claude-reviewer"
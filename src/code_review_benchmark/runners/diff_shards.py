@@ -0,0 +1,152 @@
+"""Split a large PR diff into shards that LLM reviewers review concurrently.
+
+With ``CRB_SHARD_DIFF_TOKENS`` set, a diff estimated above that many tokens
+is split into shards at file boundaries, packing consecutive files together
+up to the limit. A single file over the limit is split between hunks, each
+piece repeating the file's header. Each shard is reviewed in its own
+request with the same PR context (title and the full list of changed
+files), so review latency follows the largest shard rather than the whole
+PR. :func:`merge_reviews` then joins the shards' ``### Finding N`` blocks
+into one review, dropping findings reported by more than one shard.
+
+Sharding is off by default: it changes what the reviewer sees, so results
+with and without it are not directly comparable.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+
+from code_review_benchmark.budget import estimate_tokens
+
+# Shard requests sent at the same time for one review
+DEFAULT_CONCURRENCY = 8
+
+# Separates free-text shard reviews from the structured findings in a merged review
+UNSTRUCTURED_HEADER = "### Unstructured Reviews"
+
+_FINDING_HEADER = re.compile(r"^###\s+Finding\s+\d+[^\n]*\n?", re.MULTILINE)
+_FILE = re.compile(r"\*\*File\*\*:\s*`?([^`\n]+?)`?\s*$", re.MULTILINE)
+_LINES = re.compile(r"\*\*Lines?\*\*:\s*(\d+)(?:\s*-\s*(\d+))?")
+_TITLE = re.compile(r"\*\*Title\*\*:\s*([^\n]+)")
+
+
+def shard_token_limit() -> int | None:
+    """The ``CRB_SHARD_DIFF_TOKENS`` limit, or None when sharding is off."""
+    limit = int(os.environ.get("CRB_SHARD_DIFF_TOKENS", "0") or 0)
+    return limit if limit > 0 else None
+
+
+def shard_concurrency() -> int:
+    return max(1, int(os.environ.get("CRB_SHARD_CONCURRENCY", DEFAULT_CONCURRENCY)))
+
+
+@dataclass
+class FileDiff:
+    path: str
+    header: str  # from "diff --git" up to the first hunk
+    hunks: list[str]
+
+    @property
+    def text(self) -> str:
+        return self.header + "".join(self.hunks)
+
+
+def split_files(diff_text: str) -> list[FileDiff]:
+    """Split ``git diff`` output into per-file sections, in diff order."""
+    files: list[FileDiff] = []
+    for section in re.split(r"^(?=diff --git )", diff_text, flags=re.MULTILINE):
+        if not section.startswith("diff --git "):
+            continue
+        header, *hunks = re.split(r"^(?=@@ )", section, flags=re.MULTILINE)
+        files.append(FileDiff(_file_path(header), header, hunks))
+    return files
+
+
+def _file_path(header: str) -> str:
+    new = re.search(r"^\+\+\+ (?:b/)?(.+)$", header, re.MULTILINE)
+    if new and new.group(1) != "/dev/null":
+        return new.group(1).strip()
+    first = header.split("\n", 1)[0]
+    return first.rsplit(" b/", 1)[-1].strip()
+
+
+def shard_diff(diff_text: str, max_tokens: int) -> list[str]:
+    """Pack the diff into shards of at most *max_tokens* estimated tokens.
+
+    Files stay whole and in order where possible. A hunk larger than the
+    limit on its own becomes a shard by itself, over the limit.
+    """
+    pieces: list[str] = []
+    for file in split_files(diff_text):
+        if estimate_tokens(file.text) <= max_tokens or not file.hunks:
+            pieces.append(file.text)
+            continue
+        group = ""
+        for hunk in file.hunks:
+            if group and estimate_tokens(group + hunk) > max_tokens:
+                pieces.append(group)
+                group = ""
+            group = (group or file.header) + hunk
+        pieces.append(group)
+
+    shards: list[str] = []
+    for piece in pieces:
+        if shards and estimate_tokens(shards[-1] + piece) <= max_tokens:
+            shards[-1] += piece
+        else:
+            shards.append(piece)
+    return shards or [diff_text]
+
+
+def merge_reviews(outputs: list[str]) -> str:
+    """Combine per-shard reviews into one, renumbering the findings.
+
+    A finding is dropped if an earlier one names the same file and title
+    with overlapping (or unknown) lines. Shards that answered in free text
+    instead of the structured format follow the findings, as they are, under
+    :data:`UNSTRUCTURED_HEADER` so the parser reads them as free text.
+    """
+    kept: list[str] = []
+    seen: list[tuple[str, str, tuple[int, int] | None]] = []
+    unstructured: list[str] = []
+    for output in outputs:
+        blocks = _FINDING_HEADER.split(output or "")[1:]
+        if not blocks:
+            text = (output or "").strip()
+            if text and "no issues found" not in text.lower():
+                unstructured.append(text)
+            continue
+        for block in blocks:
+            key = _finding_key(block)
+            if any(_same_finding(key, other) for other in seen):
+                continue
+            seen.append(key)
+            kept.append(block.strip())
+
+    if kept and unstructured:
+        unstructured.insert(0, UNSTRUCTURED_HEADER)
+    parts = [f"### Finding {i}\n{block}" for i, block in enumerate(kept, 1)] + unstructured
+    return "\n\n".join(parts) if parts else "### No Issues Found"
+
+
+def _finding_key(block: str) -> tuple[str, str, tuple[int, int] | None]:
+    file = _FILE.search(block)
+    lines = _LINES.search(block)
+    title = _TITLE.search(block)
+    span = None
+    if lines:
+        start = int(lines.group(1))
+        span = (start, int(lines.group(2) or start))
+    normalized = " ".join(re.findall(r"\w+", title.group(1).lower())) if title else ""
+    return (file.group(1).strip().lower() if file else "", normalized, span)
+
+
+def _same_finding(a: tuple, b: tuple) -> bool:
+    if a[0] != b[0] or a[1] != b[1] or not a[1]:
+        return False
+    if a[2] is None or b[2] is None:
+        return True
+    return a[2][0] <= b[2][1] and b[2][0] <= a[2][1]
@@ -0,0 +1,175 @@
+"""Execute a single (challenge, tool, run) task and store its raw output.
+
+Shared by ``crb run`` and ``crb worker`` so both write the same
+``{challenge}/{tool}/run_N/`` layout. In a ``--models`` sweep each
+(tool, model) lane is written as ``{challenge}/{tool}@{model}/run_N/``.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from code_review_benchmark.blobstore import intern_output, store_for
+from code_review_benchmark.challenge_repo.builder import ChallengeRepo, build_challenge_repo
+from code_review_benchmark.layout import result_dir_for
+from code_review_benchmark.metrics import LAST_TASK, TASK_SECONDS, TASKS, TASKS_IN_FLIGHT
+from code_review_benchmark.models.challenge import Challenge
+from code_review_benchmark.profiling import span
+from code_review_benchmark.runners.base import (
+    OUTPUT_FILENAME,
+    STDERR_FILENAME,
+    AbstractToolRunner,
+    RunContext,
+    RunResult,
+    lane_name,
+)
+from code_review_benchmark.serialization import write_json
+
+
+@dataclass(frozen=True)
+class Lane:
+    """A tool run with one model: a row of the leaderboard."""
+
+    runner: AbstractToolRunner
+    model: str | None
+    name: str
+
+
+def plan_lanes(
+    runners: list[AbstractToolRunner], models: list[str] | None, model: str | None = None
+) -> tuple[list[Lane], list[str]]:
+    """The lanes to run, and the names of sweep lanes left out.
+
+    Without *models* every tool runs once with *model* under its own name.
+    With *models* every tool gets a lane per model, except LLM reviewers for
+    models they would not use (another provider's, or one overridden by
+    their ``CRB_*_MODEL`` variable).
+    """
+    from code_review_benchmark.runners.llm_reviewer_base import AbstractLLMReviewer
+
+    if not models:
+        return [Lane(runner, model, runner.name) for runner in runners], []
+    lanes: list[Lane] = []
+    skipped: list[str] = []
+    for runner in runners:
+        for candidate in models:
+            name = lane_name(runner.name, candidate)
+            if isinstance(runner, AbstractLLMReviewer):
+                if runner._resolve_model(candidate) != candidate:
+                    skipped.append(name)
+                    continue
+            lanes.append(Lane(runner, candidate, name))
+    return lanes, skipped
+
+
+def write_run_outputs(
+    result_dir: Path,
+    result: RunResult,
+    model: str | None,
+    run_index: int,
+    challenge_hash: str | None = None,
+) -> None:
+    """Write ``output.txt``, ``stderr.txt`` (unless streamed) and ``meta.json`` for a run."""
+    result_dir.mkdir(parents=True, exist_ok=True)
+    if not result.streamed:
+        (result_dir / OUTPUT_FILENAME).write_text(result.output_text)
+        (result_dir / STDERR_FILENAME).write_text(result.error)
+    write_json(
+        result_dir / "meta.json",
+        {
+            "tool": result.tool,
+            "success": result.success,
+            "return_code": result.return_code,
+            "model": model,
+            "run_index": run_index,
+            "challenge_hash": challenge_hash,
+            **result.metadata,
+        },
+    )
+
+
+def execute_task(
+    runner: AbstractToolRunner,
+    challenge: Challenge,
+    run_index: int,
+    run_dir: Path,
+    model: str | None = None,
+    on_output: Callable[[int], None] | None = None,
+    workdir: Path | None = None,
+    lane: str | None = None,
+    repo: ChallengeRepo | None = None,
+) -> RunResult:
+    """Build the challenge repo (under *workdir*), run the tool on it and store the outputs.
+
+    *on_output* receives the running line count of tools that stream output.
+    The repo is deleted in the background once the tool has finished, and
+    the output is moved into the run directory's blob store. Given a *repo*
+    built by the caller, it is used instead and reset afterwards, for the
+    caller's next task on the same challenge; if the reset fails the repo is
+    deleted and its ``reusable`` flag cleared. Outputs go under the *lane*
+    name if given, else the tool's.
+    """
+    result_dir = result_dir_for(run_dir, challenge.id, lane or runner.name, run_index)
+    started = time.monotonic()
+    status = "error"  # an exception escaped
+    TASKS_IN_FLIGHT.inc()
+    try:
+        result = _build_and_run(
+            runner, challenge, run_index, model, on_output, workdir, result_dir, repo
+        )
+        status = "ok" if result.success else "failed"
+    finally:
+        TASKS_IN_FLIGHT.dec()
+        # Sweep lanes get their own series, so models can be told apart
+        TASK_SECONDS.observe(time.monotonic() - started, tool=lane or runner.name)
+        TASKS.inc(tool=lane or runner.name, status=status)
+        LAST_TASK.set(round(time.time(), 3))
+
+    with span("write_outputs"):
+        write_run_outputs(
+            result_dir,
+            result,
+            model,
+            run_index,
+            challenge_hash=challenge.fingerprint(),
+        )
+        intern_output(result_dir, store_for(run_dir))
+    return result
+
+
+def _build_and_run(
+    runner: AbstractToolRunner,
+    challenge: Challenge,
+    run_index: int,
+    model: str | None,
+    on_output: Callable[[int], None] | None,
+    workdir: Path | None,
+    result_dir: Path,
+    shared_repo: ChallengeRepo | None,
+) -> RunResult:
+    repo = shared_repo
+    if repo is None:
+        with span("build_challenge_repo", challenge=challenge.id):
+            repo = build_challenge_repo(challenge, base_tmp=workdir)
+    try:
+        with span("runner.run", tool=runner.name, challenge=challenge.id, run=run_index):
+            return runner.run(
+                repo_path=repo.path,
+                pr_branch=repo.pr_branch,
+                main_branch=repo.main_branch,
+                model=model,
+                context=RunContext(result_dir, on_output, shared=repo.artifacts),
+            )
+    finally:
+        if shared_repo is None:
+            repo.cleanup()
+        else:
+            try:
+                repo.reset()
+            except Exception:
+                # Keep this task's result; the caller builds a fresh repo for the next one
+                repo.reusable = False
+                repo.cleanup()
@@ -12,6 +12,8 @@ DEFAULT_MODEL = "gemini-2.5-pro"
 
 @register_tool
 class GeminiReviewerRunner(AbstractLLMReviewer):
+    provider = "google"
+
     @property
     def name(self) -> str:
         return "gemini-reviewer"
@@ -3,16 +3,33 @@
 Provides the shared system prompt, diff/prompt-building logic, and a template
 method ``run()`` so that concrete subclasses only need to implement the
 API-specific ``_call_llm()`` and ``_resolve_model()`` methods.
+
+A diff over ``CRB_SHARD_DIFF_TOKENS`` is reviewed in concurrent shards
+(see :mod:`~code_review_benchmark.runners.diff_shards`).
 """
 
 from __future__ import annotations
 
 import os
 import subprocess
+import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from code_review_benchmark.runners.base import AbstractToolRunner, RunResult
+from code_review_benchmark.budget import estimate_tokens
+from code_review_benchmark.cassette import cassette
+from code_review_benchmark.metrics import LLM_ERRORS, LLM_SECONDS, TOKENS
+from code_review_benchmark.profiling import span
+from code_review_benchmark.runners.base import AbstractToolRunner, RunContext, RunResult
+from code_review_benchmark.runners.diff_shards import (
+    merge_reviews,
+    shard_concurrency,
+    shard_diff,
+    shard_token_limit,
+    split_files,
+)
+from code_review_benchmark.runners.resilience import CallStats, call_resilient
 
 CODE_REVIEW_SYSTEM_PROMPT = """\
 You are an expert code reviewer. You will receive a git diff representing changes \
@@ -51,6 +68,9 @@ If there are no significant issues, output:
 class AbstractLLMReviewer(AbstractToolRunner):
     """Intermediate base for reviewers that call an LLM with a diff."""
 
+    # API provider, for metrics labels
+    provider = "unknown"
+
     # -- helpers used by run() ------------------------------------------------
 
     @staticmethod
@@ -87,6 +107,55 @@ class AbstractLLMReviewer(AbstractToolRunner):
         prompt += f"Please review the following diff:\n\n```diff\n{diff_text}\n```"
         return prompt
 
+    @staticmethod
+    def _build_shard_prompt(
+        pr_title: str, files: list[str], shard: str, index: int, count: int
+    ) -> str:
+        changed = "\n".join(f"- {path}" for path in files)
+        prompt = f"Pull request: {pr_title}\n\n" if pr_title else ""
+        prompt += (
+            "This pull request is too large to review at once, so its diff is split into "
+            f"{count} parts reviewed separately. This is part {index} of {count}. "
+            f"Files changed by the whole pull request:\n{changed}\n\n"
+            "Report only issues in the code shown in this part.\n\n"
+        )
+        prompt += f"Please review the following diff:\n\n```diff\n{shard}\n```"
+        return prompt
+
+    @classmethod
+    def build_review_prompts(
+        cls,
+        repo_path: Path,
+        pr_branch: str,
+        main_branch: str,
+        shard_tokens: int | None = None,
+    ) -> list[str]:
+        """Build the user prompts for the PR's diff; raises ValueError if there is none.
+
+        That is one prompt, unless the diff is estimated above *shard_tokens*
+        (default ``CRB_SHARD_DIFF_TOKENS``) and splits into several shards.
+        """
+        with span("git", op="log"):
+            pr_title = cls._get_pr_title(repo_path, pr_branch)
+        with span("git", op="diff"):
+            diff_text = cls._get_diff(repo_path, pr_branch, main_branch)
+        if diff_text is None:
+            raise ValueError("Failed to get diff")
+        if not diff_text.strip():
+            raise ValueError("Empty diff")
+
+        shard_tokens = shard_tokens or shard_token_limit()
+        if shard_tokens is None or estimate_tokens(diff_text) <= shard_tokens:
+            return [cls._build_user_prompt(pr_title, diff_text)]
+        shards = shard_diff(diff_text, shard_tokens)
+        if len(shards) == 1:
+            return [cls._build_user_prompt(pr_title, diff_text)]
+        files = [file.path for file in split_files(diff_text)]
+        return [
+            cls._build_shard_prompt(pr_title, files, shard, i, len(shards))
+            for i, shard in enumerate(shards, 1)
+        ]
+
     # -- abstract hooks subclasses must provide --------------------------------
 
     @abstractmethod
@@ -111,33 +180,106 @@ class AbstractLLMReviewer(AbstractToolRunner):
         pr_branch: str,
         main_branch: str,
         model: str | None = None,
+        context: RunContext | None = None,
     ) -> RunResult:
         resolved_model = self._resolve_model(model)
 
-        pr_title = self._get_pr_title(repo_path, pr_branch)
-
-        diff_text = self._get_diff(repo_path, pr_branch, main_branch)
-        if diff_text is None:
-            return RunResult(tool=self.name, success=False, error="Failed to get diff")
-        if not diff_text.strip():
-            return RunResult(tool=self.name, success=False, error="Empty diff")
-
-        user_prompt = self._build_user_prompt(pr_title, diff_text)
+        # Every reviewer sends the same prompts for a repo; build them once per repo
+        shared = context.shared if context is not None else {}
+        key = ("review_prompts", pr_branch, main_branch, shard_token_limit())
+        prompts = shared.get(key)
+        if prompts is None:
+            try:
+                prompts = self.build_review_prompts(repo_path, pr_branch, main_branch)
+            except ValueError as exc:
+                return RunResult(tool=self.name, success=False, error=str(exc))
+            shared[key] = prompts
 
         timeout = int(os.environ.get("CRB_TOOL_TIMEOUT", "300"))
+        stats = [CallStats() for _ in prompts]
         try:
-            output_text = self._call_llm(
-                system_prompt=CODE_REVIEW_SYSTEM_PROMPT,
-                user_prompt=user_prompt,
-                model=resolved_model,
-                timeout=timeout,
-            )
+            outputs = self._review_shards(prompts, resolved_model, timeout, stats)
         except Exception as exc:
-            return RunResult(tool=self.name, success=False, error=str(exc))
+            return RunResult(
+                tool=self.name, success=False, error=str(exc), metadata=_call_meta(stats)
+            )
 
+        output_text = outputs[0] if len(outputs) == 1 else merge_reviews(outputs)
         has_review = bool(output_text and output_text.strip())
         return RunResult(
             tool=self.name,
             success=has_review,
             output_text=output_text,
+            metadata=_call_meta(stats),
         )
+
+    def _review_shards(
+        self, prompts: list[str], model: str, timeout: int, stats: list[CallStats]
+    ) -> list[str]:
+        """Review each prompt, concurrently if there are several; raises the first error."""
+        if len(prompts) == 1:
+            return [self._review(prompts[0], model, timeout, stats[0])]
+        pool = ThreadPoolExecutor(
+            max_workers=min(len(prompts), shard_concurrency()), thread_name_prefix="crb-shard"
+        )
+        try:
+            futures = [
+                pool.submit(self._review, prompt, model, timeout, shard_stats)
+                for prompt, shard_stats in zip(prompts, stats)
+            ]
+            return [future.result() for future in futures]
+        finally:
+            # After a failure the whole review fails; don't send the shards still queued
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _review(self, user_prompt: str, model: str, timeout: int, stats: CallStats) -> str:
+        """One LLM review request, with retries, metrics and ``--record``/``--replay``."""
+        labels = {"tool": self.name, "provider": self.provider, "model": model}
+        request = {
+            "caller": self.name,
+            "model": model,
+            "system": CODE_REVIEW_SYSTEM_PROMPT,
+            "user": user_prompt,
+        }
+
+        def send() -> str:
+            return self._call_llm(
+                system_prompt=CODE_REVIEW_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                model=model,
+                timeout=timeout,
+            )
+
+        def call() -> str:
+            started = time.monotonic()
+            try:
+                with span("llm_call", cat="api", tool=self.name, model=model):
+                    text = cassette.call(request, send)
+            except Exception:
+                LLM_ERRORS.inc(**labels)
+                raise
+            finally:
+                LLM_SECONDS.observe(time.monotonic() - started, **labels)
+            tokens = {"tool": self.name, "model": model}
+            TOKENS.inc(
+                estimate_tokens(CODE_REVIEW_SYSTEM_PROMPT) + estimate_tokens(user_prompt),
+                direction="input",
+                **tokens,
+            )
+            TOKENS.inc(estimate_tokens(text or ""), direction="output", **tokens)
+            return text
+
+        return call_resilient(call, key=f"{self.name}:{model}", stats=stats)
+
+
+def _call_meta(stats: list[CallStats]) -> dict:
+    """Run metadata for the review's calls; shards add up, latency is the slowest."""
+    if len(stats) == 1:
+        return stats[0].as_meta()
+    return {
+        "attempts": sum(s.attempts for s in stats),
+        "hedges": sum(s.hedges for s in stats),
+        "hedge_won": any(s.hedge_won for s in stats),
+        "latency_s": round(max(s.latency_s for s in stats), 3),
+        "shards": len(stats),
+    }
@@ -12,6 +12,8 @@ DEFAULT_MODEL = "gpt-4o"
 
 @register_tool
 class OpenAIReviewerRunner(AbstractLLMReviewer):
+    provider = "openai"
+
     @property
     def name(self) -> str:
         return "openai-reviewer"
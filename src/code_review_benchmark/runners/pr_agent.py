@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
-from code_review_benchmark.runners.base import AbstractToolRunner, RunResult
+from code_review_benchmark.runners.base import AbstractToolRunner, RunContext, RunResult
 from code_review_benchmark.runners.registry import register_tool
+from code_review_benchmark.runners.streaming import (
+    has_text,
+    output_paths,
+    run_streaming,
+    streamed_result,
+)
+
+# Seen in stderr when pr-agent failed even though it exited 0
+_FATAL_MARKERS = ("Traceback (most recent call last)", "| ERROR")
 
 
 @register_tool
@@ -37,6 +47,7 @@ class PRAgentRunner(AbstractToolRunner):
         pr_branch: str,
         main_branch: str,
         model: str | None = None,
+        context: RunContext | None = None,
     ) -> RunResult:
         env = {**os.environ}
 
@@ -66,37 +77,38 @@ class PRAgentRunner(AbstractToolRunner):
             "review",
         ]
 
-        try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=repo_path,
-                env=env,
+        with output_paths(context) as (stdout_path, stderr_path):
+            try:
+                proc = run_streaming(
+                    cmd,
+                    stdout_path,
+                    stderr_path,
+                    cwd=repo_path,
+                    env=env,
+                    timeout=300,
+                    markers=_FATAL_MARKERS,
+                    on_output=context.on_output if context else None,
+                )
+            except FileNotFoundError:
+                return RunResult(tool=self.name, success=False, error="pr-agent not found")
+            if proc.timed_out:
+                return RunResult(tool=self.name, success=False, error="Timed out after 300s")
+
+            output_files: list[Path] = []
+            review_md = repo_path / "review.md"
+            if review_md.exists():
+                shutil.copyfile(review_md, stdout_path)
+                output_files.append(review_md)
+
+            has_review = has_text(stdout_path)
+            has_fatal = bool(proc.stderr_markers)
+            success = proc.returncode == 0 and has_review and not has_fatal
+
+            return streamed_result(
+                context,
+                stdout_path,
+                proc,
+                tool=self.name,
+                success=success,
+                output_files=output_files,
             )
-        except subprocess.TimeoutExpired:
-            return RunResult(tool=self.name, success=False, error="Timed out after 300s")
-        except FileNotFoundError:
-            return RunResult(tool=self.name, success=False, error="pr-agent not found")
-
-        output_text = proc.stdout
-        output_files: list[Path] = []
-        review_md = repo_path / "review.md"
-        if review_md.exists():
-            output_text = review_md.read_text()
-            output_files.append(review_md)
-
-        has_review = bool(output_text and output_text.strip())
-        stderr = proc.stderr or ""
-        has_fatal = "Traceback (most recent call last)" in stderr or "| ERROR" in stderr
-        success = proc.returncode == 0 and has_review and not has_fatal
-
-        return RunResult(
-            tool=self.name,
-            success=success,
-            output_text=output_text,
-            output_files=output_files,
-            error=proc.stderr,
-            return_code=proc.returncode,
-        )
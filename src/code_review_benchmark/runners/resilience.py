@@ -0,0 +1,195 @@
+"""Retries and hedged requests for LLM reviewer calls.
+
+A transient provider error (429, 5xx, 529 "overloaded", timeouts, dropped
+connections) is retried with exponential backoff and full jitter instead of
+becoming a failed run. Optionally a call is *hedged*: if it has not returned
+after the p95 latency seen so far for the same tool and model, an identical
+second request is sent and whichever finishes first wins. Both requests use
+the same prompt and settings, so hedging only cuts the latency tail; it does
+not change what is measured.
+
+Configured from the environment:
+
+- ``CRB_LLM_MAX_ATTEMPTS`` — attempts per call, including the first (default 3)
+- ``CRB_LLM_RETRY_BASE`` — base backoff in seconds (default 2)
+- ``CRB_LLM_HEDGE`` — ``off`` (default), ``p95``, or a fixed delay in seconds
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Exception class names the provider SDKs use for transient failures
+_RETRYABLE_NAMES = ("RateLimit", "Timeout", "Connection", "Overloaded", "InternalServer")
+
+# Latency samples needed before the p95 is trusted for hedging
+MIN_HEDGE_SAMPLES = 10
+
+
+def is_retryable(exc: BaseException) -> bool:
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if isinstance(status, int) and status in RETRYABLE_STATUS:
+        return True
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    name = type(exc).__name__
+    return any(part in name for part in _RETRYABLE_NAMES)
+
+
+@dataclass
+class ResiliencePolicy:
+    max_attempts: int = 3
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    hedge: str = "off"  # "off", "p95" or a delay in seconds
+
+    @classmethod
+    def from_env(cls) -> ResiliencePolicy:
+        return cls(
+            max_attempts=max(1, int(os.environ.get("CRB_LLM_MAX_ATTEMPTS", "3"))),
+            base_delay=float(os.environ.get("CRB_LLM_RETRY_BASE", "2")),
+            hedge=os.environ.get("CRB_LLM_HEDGE", "off").strip().lower() or "off",
+        )
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Full-jitter delay before retry number *attempt* (1-based)."""
+        return rng.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class LatencyTracker:
+    """Recent call latencies per key, for the hedging delay."""
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.setdefault(key, [])
+            samples.append(seconds)
+            del samples[: -self.window]
+
+    def p95(self, key: str) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < MIN_HEDGE_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+
+
+# Shared by every reviewer in the process
+latency_tracker = LatencyTracker()
+
+
+@dataclass
+class CallStats:
+    attempts: int = 0
+    hedges: int = 0
+    hedge_won: bool = False
+    latency_s: float = 0.0  # from sending the first request to the winning response
+
+    def as_meta(self) -> dict:
+        return {
+            "attempts": self.attempts,
+            "hedges": self.hedges,
+            "hedge_won": self.hedge_won,
+            "latency_s": round(self.latency_s, 3),
+        }
+
+
+def call_resilient(
+    fn: Callable[[], T],
+    key: str,
+    stats: CallStats,
+    policy: ResiliencePolicy | None = None,
+    tracker: LatencyTracker | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    rng: random.Random | None = None,
+) -> T:
+    """Call *fn* with retries (and hedging, if enabled), filling in *stats*.
+
+    Raises the last exception if every attempt fails or the error is not
+    retryable; *stats* still describes the attempts made.
+    """
+    policy = policy or ResiliencePolicy.from_env()
+    tracker = tracker or latency_tracker
+    rng = rng or random.Random()
+
+    for attempt in range(1, policy.max_attempts + 1):
+        stats.attempts = attempt
+        try:
+            result, request_latency = _hedged_call(fn, _hedge_delay(policy, key, tracker), stats)
+        except Exception as exc:
+            if attempt == policy.max_attempts or not is_retryable(exc):
+                raise
+            sleep(policy.backoff(attempt, rng))
+            continue
+        # Track the winner's own latency: wall time is capped by hedging and
+        # would pull the p95 (and so the hedge delay) down over time.
+        tracker.add(key, request_latency)
+        return result
+    raise AssertionError("unreachable")
+
+
+def _hedge_delay(policy: ResiliencePolicy, key: str, tracker: LatencyTracker) -> float | None:
+    if policy.hedge in ("off", "0", "false", "no"):
+        return None
+    if policy.hedge == "p95":
+        return tracker.p95(key)
+    return float(policy.hedge)
+
+
+def _hedged_call(
+    fn: Callable[[], T], hedge_after: float | None, stats: CallStats
+) -> tuple[T, float]:
+    """Run *fn*, adding one identical request if it is still running after *hedge_after*.
+
+    Returns the result and the winning request's own latency.
+    """
+    start = time.monotonic()
+    if hedge_after is None:
+        result = fn()
+        stats.latency_s = time.monotonic() - start
+        stats.hedge_won = False
+        return result, stats.latency_s
+
+    def timed(start: float):
+        result = fn()
+        return result, time.monotonic() - start
+
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="crb-hedge")
+    try:
+        primary = pool.submit(timed, start)
+        done, _ = wait([primary], timeout=hedge_after)
+        pending = {primary}
+        hedge = None
+        if not done:
+            hedge = pool.submit(timed, time.monotonic())
+            stats.hedges += 1
+            pending.add(hedge)
+
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    result, request_latency = future.result()
+                    stats.latency_s = time.monotonic() - start
+                    stats.hedge_won = future is hedge
+                    return result, request_latency
+                error = future.exception()
+        raise error
+    finally:
+        # A losing request is abandoned; its thread finishes in the background
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -6,8 +6,18 @@ import os
 import subprocess
 from pathlib import Path
 
-from code_review_benchmark.runners.base import AbstractToolRunner, RunResult
+from code_review_benchmark.runners.base import AbstractToolRunner, RunContext, RunResult
 from code_review_benchmark.runners.registry import register_tool
+from code_review_benchmark.runners.streaming import (
+    append_files,
+    file_markers,
+    has_text,
+    output_paths,
+    run_streaming,
+    streamed_result,
+)
+
+_NO_CHANGES = "no changes found"
 
 
 @register_tool
@@ -37,6 +47,7 @@ class ShippieRunner(AbstractToolRunner):
         pr_branch: str,
         main_branch: str,
         model: str | None = None,
+        context: RunContext | None = None,
     ) -> RunResult:
         env = {**os.environ}
         if model:
@@ -72,40 +83,44 @@ class ShippieRunner(AbstractToolRunner):
             model_str = model if ":" in model else f"openai:{model}"
             cmd.extend(["--modelString", model_str])
 
-        try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=repo_path,
-                env=env,
+        with output_paths(context) as (stdout_path, stderr_path):
+            try:
+                proc = run_streaming(
+                    cmd,
+                    stdout_path,
+                    stderr_path,
+                    cwd=repo_path,
+                    env=env,
+                    timeout=300,
+                    ignore_case=(_NO_CHANGES,),
+                    on_output=context.on_output if context else None,
+                )
+            except FileNotFoundError:
+                return RunResult(tool=self.name, success=False, error="npx/shippie not found")
+            if proc.timed_out:
+                return RunResult(tool=self.name, success=False, error="Timed out after 300s")
+
+            has_review = has_text(stdout_path)
+
+            no_changes = _NO_CHANGES in proc.stdout_markers | proc.stderr_markers
+
+            # Shippie writes reviews to .shippie/review/
+            output_files: list[Path] = []
+            review_dir = repo_path / ".shippie" / "review"
+            if review_dir.exists():
+                output_files = sorted(review_dir.glob("*.md"))
+                append_files(stdout_path, output_files)
+                has_review = has_review or any(has_text(f) for f in output_files)
+                no_changes = no_changes or any(
+                    file_markers(f, ignore_case=(_NO_CHANGES,)) for f in output_files
+                )
+            success = proc.returncode == 0 and has_review and not no_changes
+
+            return streamed_result(
+                context,
+                stdout_path,
+                proc,
+                tool=self.name,
+                success=success,
+                output_files=output_files,
             )
-        except subprocess.TimeoutExpired:
-            return RunResult(tool=self.name, success=False, error="Timed out after 300s")
-        except FileNotFoundError:
-            return RunResult(tool=self.name, success=False, error="npx/shippie not found")
-
-        output_text = proc.stdout
-        output_files: list[Path] = []
-
-        # Shippie writes reviews to .shippie/review/
-        review_dir = repo_path / ".shippie" / "review"
-        if review_dir.exists():
-            for md_file in sorted(review_dir.glob("*.md")):
-                output_files.append(md_file)
-                output_text += "\n" + md_file.read_text()
-
-        combined = (output_text or "") + (proc.stderr or "")
-        has_review = bool(output_text and output_text.strip())
-        no_changes = "no changes found" in combined.lower()
-        success = proc.returncode == 0 and has_review and not no_changes
-
-        return RunResult(
-            tool=self.name,
-            success=success,
-            output_text=output_text,
-            output_files=output_files,
-            error=proc.stderr,
-            return_code=proc.returncode,
-        )
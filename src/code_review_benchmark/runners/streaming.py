@@ -0,0 +1,243 @@
+"""Run a tool subprocess with its output streamed to files.
+
+``subprocess.run(capture_output=True)`` keeps a tool's whole stdout and
+stderr in memory until it exits, which scales with log volume times the
+number of parallel runs. :func:`run_streaming` instead copies both pipes to
+files chunk by chunk, keeping only a bounded tail of each and a record of
+which marker strings (e.g. ``"Traceback"``) appeared anywhere in them.
+Markers match case-sensitively unless passed in ``ignore_case``.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Callable
+
+from code_review_benchmark.runners.base import (
+    OUTPUT_FILENAME,
+    STDERR_FILENAME,
+    RunContext,
+    RunResult,
+)
+
+TAIL_BYTES = 64 * 1024
+_CHUNK = 64 * 1024
+
+
+@dataclass
+class StreamedProcess:
+    returncode: int
+    timed_out: bool = False
+    stdout_tail: str = ""
+    stderr_tail: str = ""
+    lines: int = 0
+    # Markers found anywhere in each stream, as they were passed
+    stdout_markers: set[str] = field(default_factory=set)
+    stderr_markers: set[str] = field(default_factory=set)
+
+
+@contextmanager
+def output_paths(context: RunContext | None) -> Iterator[tuple[Path, Path]]:
+    """Yield the ``(stdout, stderr)`` files to stream into.
+
+    These are the result directory's ``output.txt``/``stderr.txt`` when run
+    by the executor, or files in a temporary directory otherwise.
+    """
+    if context is not None:
+        context.result_dir.mkdir(parents=True, exist_ok=True)
+        yield context.result_dir / OUTPUT_FILENAME, context.result_dir / STDERR_FILENAME
+        return
+    with tempfile.TemporaryDirectory(prefix="crb-output-") as tmp:
+        yield Path(tmp) / OUTPUT_FILENAME, Path(tmp) / STDERR_FILENAME
+
+
+def streamed_result(
+    context: RunContext | None,
+    stdout_path: Path,
+    proc: StreamedProcess,
+    **fields,
+) -> RunResult:
+    """Build the RunResult for a streamed run.
+
+    Without a context nobody will read the files afterwards, so the output
+    is loaded into ``output_text`` as before.
+    """
+    if context is None:
+        return RunResult(
+            output_text=stdout_path.read_text(errors="replace"),
+            error=stdout_path.with_name(STDERR_FILENAME).read_text(errors="replace"),
+            return_code=proc.returncode,
+            **fields,
+        )
+    return RunResult(error=proc.stderr_tail, return_code=proc.returncode, streamed=True, **fields)
+
+
+def run_streaming(
+    cmd: list[str],
+    stdout_path: Path,
+    stderr_path: Path,
+    *,
+    cwd: Path,
+    env: dict[str, str] | None = None,
+    timeout: float | None = None,
+    markers: tuple[str, ...] = (),
+    ignore_case: tuple[str, ...] = (),
+    on_output: Callable[[int], None] | None = None,
+) -> StreamedProcess:
+    """Run *cmd*, writing stdout/stderr to the given files as they are produced.
+
+    *markers* are looked for as they are, *ignore_case* markers in any case.
+    Raises ``FileNotFoundError`` if the command does not exist. On timeout
+    the process is killed and ``timed_out`` is set.
+    """
+    counter = _LineCounter(on_output)
+    with open(stdout_path, "wb") as out_f, open(stderr_path, "wb") as err_f:
+        # Own process group, so a timeout also kills the tool's children
+        # (e.g. node under npx), which would otherwise hold the pipes open.
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        pumps = [
+            _Pump(proc.stdout, out_f, _Markers(markers, ignore_case), counter),
+            _Pump(proc.stderr, err_f, _Markers(markers, ignore_case), counter),
+        ]
+        for pump in pumps:
+            pump.start()
+        timed_out = False
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+        for pump in pumps:
+            pump.join()
+
+    return StreamedProcess(
+        returncode=proc.returncode,
+        timed_out=timed_out,
+        stdout_tail=pumps[0].tail(),
+        stderr_tail=pumps[1].tail(),
+        lines=counter.lines,
+        stdout_markers=pumps[0].found,
+        stderr_markers=pumps[1].found,
+    )
+
+
+def append_files(target: Path, sources: list[Path], separator: bytes = b"\n") -> None:
+    """Append each of *sources* to *target*, preceded by *separator*, without loading them."""
+    with open(target, "ab") as out:
+        for source in sources:
+            out.write(separator)
+            with open(source, "rb") as f:
+                shutil.copyfileobj(f, out, _CHUNK)
+
+
+def file_markers(
+    path: Path, markers: tuple[str, ...] = (), ignore_case: tuple[str, ...] = ()
+) -> set[str]:
+    """Markers found in *path*, matched as :func:`run_streaming` does, without loading it."""
+    scanner = _Markers(markers, ignore_case)
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            scanner.feed(chunk)
+    return scanner.found
+
+
+def has_text(path: Path) -> bool:
+    """Whether *path* contains anything other than whitespace."""
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            if chunk.strip():
+                return True
+    return False
+
+
+class _LineCounter:
+    def __init__(self, callback: Callable[[int], None] | None) -> None:
+        self.lines = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def add(self, n: int) -> None:
+        if not n:
+            return
+        with self._lock:
+            self.lines += n
+            total = self.lines
+        if self._callback is not None:
+            self._callback(total)
+
+
+class _Markers:
+    """Scans a stream chunk by chunk for markers, including ones split across chunks."""
+
+    def __init__(self, markers: tuple[str, ...], ignore_case: tuple[str, ...]) -> None:
+        self._exact = [(m, m.encode()) for m in markers]
+        self._folded = [(m, m.lower().encode()) for m in ignore_case]
+        lengths = [len(b) for _, b in self._exact + self._folded]
+        self._overlap = max(lengths, default=1) - 1
+        self._carry = b""
+        self.found: set[str] = set()
+
+    def feed(self, chunk: bytes) -> None:
+        if not self._exact and not self._folded:
+            return
+        window = self._carry + chunk
+        for marker, needle in self._exact:
+            if needle in window:
+                self.found.add(marker)
+        if self._folded:
+            folded = window.lower()
+            for marker, needle in self._folded:
+                if needle in folded:
+                    self.found.add(marker)
+        self._carry = window[-self._overlap :] if self._overlap else b""
+
+
+class _Pump(threading.Thread):
+    """Copies one pipe to a file, keeping a bounded tail and scanning for markers."""
+
+    def __init__(
+        self, pipe: IO[bytes], sink: IO[bytes], markers: _Markers, counter: _LineCounter
+    ) -> None:
+        super().__init__(daemon=True)
+        self._pipe = pipe
+        self._sink = sink
+        self._markers = markers
+        self._counter = counter
+        self._tail = bytearray()
+
+    @property
+    def found(self) -> set[str]:
+        return self._markers.found
+
+    def run(self) -> None:
+        read = getattr(self._pipe, "read1", self._pipe.read)
+        while chunk := read(_CHUNK):
+            self._sink.write(chunk)
+            self._counter.add(chunk.count(b"\n"))
+            self._tail += chunk
+            del self._tail[:-TAIL_BYTES]
+            self._markers.feed(chunk)
+        self._pipe.close()
+
+    def tail(self) -> str:
+        return self._tail.decode(errors="replace")
@@ -0,0 +1,82 @@
+"""JSON serialization for result artifacts.
+
+Every artifact the benchmark writes or reads (``meta.json``,
+``evaluation.json``, ``report.json``, dashboard data) goes through this
+module. orjson is used when installed, with the stdlib ``json`` module as a
+fallback, and pydantic models are encoded with ``model_dump_json`` so they
+never round-trip through intermediate dicts.
+
+Machine artifacts are written compact; ``pretty=True`` is reserved for files
+meant to be read by people.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from code_review_benchmark.profiling import span
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def dumps(obj: Any, *, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode *obj* to UTF-8 JSON bytes.
+
+    Models are encoded directly unless *sort_keys* is set, which needs a
+    dict first so the output is stable (e.g. for hashing).
+    """
+    if isinstance(obj, BaseModel):
+        if not sort_keys:
+            return dump_model(obj, pretty=pretty)
+        obj = obj.model_dump(mode="json")
+    if orjson is not None:
+        option = 0
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+    return text.encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_model(model: BaseModel, *, pretty: bool = False) -> bytes:
+    """Encode a pydantic model using its compiled serializer."""
+    return model.model_dump_json(indent=2 if pretty else None).encode()
+
+
+def write_json(path: Path, obj: Any, *, pretty: bool = False, sort_keys: bool = False) -> None:
+    """Write *obj* (a plain value or pydantic model) to *path* as JSON."""
+    with span("write_json", cat="io"):
+        path.write_bytes(dumps(obj, pretty=pretty, sort_keys=sort_keys))
+
+
+def read_json(path: Path) -> Any:
+    """Read and decode a JSON file."""
+    with span("read_json", cat="io"):
+        return loads(path.read_bytes())
+
+
+def read_model(path: Path, model_cls: type[M]) -> M:
+    """Read a JSON file straight into a pydantic model."""
+    with span("read_json", cat="io"):
+        return model_cls.model_validate_json(path.read_bytes())
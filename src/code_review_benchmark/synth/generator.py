@@ -0,0 +1,574 @@
+"""Procedurally generate synthetic challenges and fake run directories.
+
+Synthetic challenges use the same ``challenge.yaml`` + ``before/``/``after/``
+layout as the hand-written fixtures, and the fake run directories mirror what
+``crb run`` writes (``{challenge}/{tool}/run_N/output.txt`` + ``meta.json``)
+with outputs in each tool's native format.  Everything is derived from a
+single seed so load tests of run/evaluate/report are reproducible.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+from code_review_benchmark.serialization import write_json
+
+SYNTH_TOOLS = [
+    "claude-reviewer",
+    "gemini-reviewer",
+    "openai-reviewer",
+    "pr-agent",
+    "shippie",
+]
+
+_LANGUAGES = {
+    "python": "py",
+    "typescript": "ts",
+}
+
+
+@dataclass(frozen=True)
+class _Archetype:
+    """A class of issue that can be injected into generated code."""
+
+    slug: str
+    category: str
+    severity: str
+    title: str
+    description: str
+    keywords: tuple[str, ...]
+    paraphrases: tuple[str, ...]
+    snippets: dict[str, tuple[str, ...]]
+
+
+_ARCHETYPES: tuple[_Archetype, ...] = (
+    _Archetype(
+        slug="sql-injection",
+        category="security",
+        severity="critical",
+        title="SQL injection via string interpolation",
+        description="User input is interpolated directly into a SQL query string.",
+        keywords=("sql injection", "parameterized", "query", "user input"),
+        paraphrases=(
+            "Query built from untrusted input",
+            "Unsanitized value concatenated into SQL",
+        ),
+        snippets={
+            "python": (
+                "def {name}(db, user_id):",
+                '    query = f"SELECT * FROM {table} WHERE id = {{user_id}}"',
+                "    return db.execute(query)",
+            ),
+            "typescript": (
+                "export async function {name}(db: Db, userId: string) {{",
+                "  const query = `SELECT * FROM {table} WHERE id = ${{userId}}`;",
+                "  return db.query(query);",
+                "}}",
+            ),
+        },
+    ),
+    _Archetype(
+        slug="hardcoded-secret",
+        category="security",
+        severity="high",
+        title="Hardcoded credential in source",
+        description="An API key is committed to source control instead of read from config.",
+        keywords=("hardcoded", "secret", "api key", "credential"),
+        paraphrases=(
+            "Secret key checked into the repository",
+            "Credential should come from environment",
+        ),
+        snippets={
+            "python": ('{name}_API_KEY = "sk-live-{token}"',),
+            "typescript": ('export const {name}ApiKey = "sk-live-{token}";',),
+        },
+    ),
+    _Archetype(
+        slug="swallowed-exception",
+        category="error-handling",
+        severity="medium",
+        title="Exception silently swallowed",
+        description="Errors are caught and discarded, hiding failures from callers.",
+        keywords=("exception", "swallowed", "error handling", "silently"),
+        paraphrases=(
+            "Empty catch block hides errors",
+            "Failure is ignored without logging",
+        ),
+        snippets={
+            "python": (
+                "def {name}(client):",
+                "    try:",
+                "        return client.fetch()",
+                "    except Exception:",
+                "        pass",
+            ),
+            "typescript": (
+                "export function {name}(client: Client) {{",
+                "  try {{",
+                "    return client.fetch();",
+                "  }} catch (e) {{}}",
+                "}}",
+            ),
+        },
+    ),
+    _Archetype(
+        slug="off-by-one",
+        category="bug",
+        severity="medium",
+        title="Off-by-one error in loop bound",
+        description="The loop iterates one element past the end of the collection.",
+        keywords=("off-by-one", "loop", "bound", "index"),
+        paraphrases=(
+            "Loop upper bound is inclusive",
+            "Index goes out of range on last iteration",
+        ),
+        snippets={
+            "python": (
+                "def {name}(items):",
+                "    total = 0",
+                "    for i in range(len(items) + 1):",
+                "        total += items[i]",
+                "    return total",
+            ),
+            "typescript": (
+                "export function {name}(items: number[]): number {{",
+                "  let total = 0;",
+                "  for (let i = 0; i <= items.length; i++) {{",
+                "    total += items[i];",
+                "  }}",
+                "  return total;",
+                "}}",
+            ),
+        },
+    ),
+    _Archetype(
+        slug="n-plus-one",
+        category="performance",
+        severity="high",
+        title="N+1 query inside loop",
+        description="A query is issued per item instead of fetching all rows in one batch.",
+        keywords=("n+1", "query", "loop", "batch"),
+        paraphrases=(
+            "Database call per iteration",
+            "Fetch related rows with a single join",
+        ),
+        snippets={
+            "python": (
+                "def {name}(db, orders):",
+                "    for order in orders:",
+                '        order.items = db.execute("SELECT * FROM {table} WHERE order_id = ?", '
+                "[order.id])",
+                "    return orders",
+            ),
+            "typescript": (
+                "export async function {name}(db: Db, orders: Order[]) {{",
+                "  for (const order of orders) {{",
+                "    order.items = await db.query('SELECT * FROM {table} WHERE order_id = ?', "
+                "[order.id]);",
+                "  }}",
+                "  return orders;",
+                "}}",
+            ),
+        },
+    ),
+    _Archetype(
+        slug="unbounded-cache",
+        category="performance",
+        severity="medium",
+        title="Unbounded cache growth",
+        description="Entries are added to a module-level cache but never evicted.",
+        keywords=("memory leak", "cache", "unbounded", "eviction"),
+        paraphrases=(
+            "Cache grows without limit",
+            "Missing eviction policy leaks memory",
+        ),
+        snippets={
+            "python": (
+                "_{name}_cache = {{}}",
+                "def {name}(key, loader):",
+                "    _{name}_cache[key] = loader(key)",
+                "    return _{name}_cache[key]",
+            ),
+            "typescript": (
+                "const {name}Cache = new Map<string, unknown>();",
+                "export function {name}(key: string, loader: (k: string) => unknown) {{",
+                "  {name}Cache.set(key, loader(key));",
+                "  return {name}Cache.get(key);",
+                "}}",
+            ),
+        },
+    ),
+    _Archetype(
+        slug="race-condition",
+        category="concurrency",
+        severity="high",
+        title="Race condition on shared counter",
+        description="A read-modify-write on shared state is not atomic across requests.",
+        keywords=("race condition", "atomic", "concurrent", "shared state"),
+        paraphrases=(
+            "Non-atomic increment of shared value",
+            "Concurrent updates can be lost",
+        ),
+        snippets={
+            "python": (
+                "def {name}(store, key):",
+                "    current = store.get(key)",
+                "    store.set(key, current + 1)",
+            ),
+            "typescript": (
+                "export async function {name}(store: Store, key: string) {{",
+                "  const current = await store.get(key);",
+                "  await store.set(key, current + 1);",
+                "}}",
+            ),
+        },
+    ),
+    _Archetype(
+        slug="unsafe-deserialization",
+        category="security",
+        severity="critical",
+        title="Unsafe deserialization of untrusted data",
+        description="Untrusted bytes are deserialized with a format that can execute code.",
+        keywords=("deserialization", "pickle", "untrusted", "remote code execution"),
+        paraphrases=(
+            "Loading untrusted payload allows code execution",
+            "Deserializing user data is unsafe",
+        ),
+        snippets={
+            "python": (
+                "def {name}(payload):",
+                "    import pickle",
+                "    return pickle.loads(payload)",
+            ),
+            "typescript": (
+                "export function {name}(payload: string) {{",
+                "  return eval('(' + payload + ')');",
+                "}}",
+            ),
+        },
+    ),
+)
+
+_FALSE_POSITIVES: tuple[tuple[str, str, str], ...] = (
+    ("style", "low", "Consider renaming variable for clarity"),
+    ("other", "info", "Function could use a docstring"),
+    ("performance", "low", "Minor allocation could be hoisted out of the function"),
+    ("type-safety", "medium", "Return type could be narrowed"),
+    ("bug", "low", "Magic number should be a named constant"),
+)
+
+
+@dataclass
+class SynthConfig:
+    """Knobs for synthetic challenge and run generation."""
+
+    num_challenges: int = 100
+    seed: int = 0
+    files: tuple[int, int] = (1, 3)
+    diff_lines: tuple[int, int] = (20, 80)
+    issues: tuple[int, int] = (1, 4)
+    tools: list[str] = field(default_factory=lambda: list(SYNTH_TOOLS))
+    num_runs: int = 3
+
+
+# -- challenges ---------------------------------------------------------------
+
+
+def generate_challenges(out_dir: Path, config: SynthConfig) -> list[Path]:
+    """Write ``config.num_challenges`` challenge directories under *out_dir*.
+
+    Returns the paths of the generated ``challenge.yaml`` files.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for i in range(config.num_challenges):
+        challenge_id = f"synth-{i:05d}"
+        rng = random.Random(f"{config.seed}:challenge:{challenge_id}")
+        paths.append(_write_challenge(out_dir / challenge_id, challenge_id, rng, config))
+    return paths
+
+
+def _write_challenge(
+    challenge_dir: Path, challenge_id: str, rng: random.Random, config: SynthConfig
+) -> Path:
+    language = rng.choice(sorted(_LANGUAGES))
+    ext = _LANGUAGES[language]
+    num_files = rng.randint(*config.files)
+    num_issues = rng.randint(*config.issues)
+    diff_budget = rng.randint(*config.diff_lines)
+
+    # Spread issues and added lines across files
+    file_names = [f"src/module_{j}.{ext}" for j in range(num_files)]
+    issue_files = [rng.randrange(num_files) for _ in range(num_issues)]
+
+    issues: list[dict] = []
+    categories: set[str] = set()
+    for j, rel_path in enumerate(file_names):
+        archetypes = [rng.choice(_ARCHETYPES) for f in issue_files if f == j]
+        before_lines, after_lines, injected = _generate_file(
+            rng, language, archetypes, diff_budget // num_files
+        )
+        _write_lines(challenge_dir / "before" / rel_path, before_lines)
+        _write_lines(challenge_dir / "after" / rel_path, after_lines)
+
+        for arch, (start, end) in injected:
+            categories.add(arch.category)
+            issues.append(
+                {
+                    "id": f"{arch.slug}-{len(issues) + 1}",
+                    "severity": arch.severity,
+                    "category": arch.category,
+                    "file": rel_path,
+                    "line_start": start,
+                    "line_end": end,
+                    "title": arch.title,
+                    "description": arch.description,
+                    "keywords": list(arch.keywords),
+                }
+            )
+
+    difficulty = "easy" if num_issues <= 1 else "medium" if num_issues <= 3 else "hard"
+    data = {
+        "id": challenge_id,
+        "name": f"Synthetic challenge {challenge_id}",
+        "description": f"Generated {language} challenge with {len(issues)} injected issues.",
+        "language": language,
+        "difficulty": difficulty,
+        "categories": sorted(categories),
+        "pr": {
+            "title": f"Update {len(file_names)} module(s)",
+            "description": "Synthetic pull request generated for load testing.",
+        },
+        "issues": issues,
+    }
+    yaml_path = challenge_dir / "challenge.yaml"
+    yaml_path.write_text(yaml.safe_dump(data, sort_keys=False))
+    return yaml_path
+
+
+def _generate_file(
+    rng: random.Random,
+    language: str,
+    archetypes: list[_Archetype],
+    added_lines: int,
+) -> tuple[list[str], list[str], list[tuple[_Archetype, tuple[int, int]]]]:
+    """Build before/after contents and the 1-based line ranges of injected issues."""
+    before_blocks = [_filler_function(rng, language, f"base_{k}") for k in range(rng.randint(2, 5))]
+
+    # New blocks added by the PR: filler up to the diff budget, plus issue snippets
+    new_blocks: list[tuple[_Archetype | None, list[str]]] = []
+    budget = added_lines
+    k = 0
+    while budget > 0:
+        block = _filler_function(rng, language, f"added_{k}")
+        new_blocks.append((None, block))
+        budget -= len(block) + 1
+        k += 1
+    for n, arch in enumerate(archetypes):
+        snippet = _render_snippet(rng, arch, language, f"{arch.slug.replace('-', '_')}_{n}")
+        new_blocks.insert(rng.randint(0, len(new_blocks)), (arch, snippet))
+
+    before_lines = _join_blocks(before_blocks)
+
+    # Interleave new blocks between the existing ones, tracking line numbers
+    slots = sorted(rng.randint(0, len(before_blocks)) for _ in new_blocks)
+    after_lines: list[str] = []
+    injected: list[tuple[_Archetype, tuple[int, int]]] = []
+    new_iter = iter(new_blocks)
+    for pos in range(len(before_blocks) + 1):
+        for _ in range(slots.count(pos)):
+            arch, block = next(new_iter)
+            if after_lines:
+                after_lines.append("")
+            start = len(after_lines) + 1
+            after_lines.extend(block)
+            if arch is not None:
+                injected.append((arch, (start, len(after_lines))))
+        if pos < len(before_blocks):
+            if after_lines:
+                after_lines.append("")
+            after_lines.extend(before_blocks[pos])
+
+    return before_lines, after_lines, injected
+
+
+def _filler_function(rng: random.Random, language: str, name: str) -> list[str]:
+    body = rng.randint(1, 6)
+    k = rng.randint(2, 9)
+    if language == "python":
+        lines = [f"def {name}(value):", f"    result = value * {k}"]
+        for s in range(body):
+            lines.append(f"    result = result + {rng.randint(1, 99)}  # step {s}")
+        lines.append("    return result")
+    else:
+        lines = [
+            f"export function {name}(value: number): number {{",
+            f"  let result = value * {k};",
+        ]
+        for s in range(body):
+            lines.append(f"  result = result + {rng.randint(1, 99)}; // step {s}")
+        lines.extend(["  return result;", "}"])
+    return lines
+
+
+def _render_snippet(rng: random.Random, arch: _Archetype, language: str, name: str) -> list[str]:
+    fields = {
+        "name": name,
+        "table": rng.choice(["users", "orders", "items", "accounts"]),
+        "token": "".join(rng.choice("abcdef0123456789") for _ in range(24)),
+    }
+    return [line.format(**fields) for line in arch.snippets[language]]
+
+
+def _join_blocks(blocks: list[list[str]]) -> list[str]:
+    lines: list[str] = []
+    for block in blocks:
+        if lines:
+            lines.append("")
+        lines.extend(block)
+    return lines
+
+
+def _write_lines(path: Path, lines: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+
+
+# -- run directories -----------------------------------------------------------
+
+
+def generate_run_dir(run_dir: Path, challenges_dir: Path, config: SynthConfig) -> int:
+    """Write fake ``{challenge}/{tool}/run_N/`` outputs for every generated challenge.
+
+    Returns the number of run directories written.
+    """
+    from code_review_benchmark.models.challenge import load_challenges
+
+    run_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for challenge in load_challenges(challenges_dir):
+        challenge_hash = challenge.fingerprint()
+        for tool in config.tools:
+            # Each tool has a stable "skill" so results look like a real leaderboard
+            tool_rng = random.Random(f"{config.seed}:tool:{tool}")
+            recall = tool_rng.uniform(0.4, 0.95)
+            noise = tool_rng.uniform(0.0, 2.5)
+            for run_idx in range(config.num_runs):
+                rng = random.Random(f"{config.seed}:run:{challenge.id}:{tool}:{run_idx}")
+                findings = fake_findings(rng, challenge.issues, recall, noise)
+                result_dir = run_dir / challenge.id / tool / f"run_{run_idx}"
+                result_dir.mkdir(parents=True, exist_ok=True)
+                (result_dir / "output.txt").write_text(format_output(tool, findings))
+                (result_dir / "stderr.txt").write_text("")
+                write_json(
+                    result_dir / "meta.json",
+                    {
+                        "tool": tool,
+                        "success": True,
+                        "return_code": 0,
+                        "model": None,
+                        "run_index": run_idx,
+                        "challenge_hash": challenge_hash,
+                    },
+                )
+                written += 1
+    return written
+
+
+def fake_findings(rng: random.Random, issues: list, recall: float, noise: float) -> list[dict]:
+    """Findings for *issues*: each found with probability *recall*, plus about *noise* extras."""
+    findings: list[dict] = []
+    for issue in issues:
+        if rng.random() > recall:
+            continue
+        arch = next((a for a in _ARCHETYPES if issue.title == a.title), None)
+        title = rng.choice(arch.paraphrases) if arch and rng.random() < 0.5 else issue.title
+        keywords = rng.sample(issue.keywords, k=min(len(issue.keywords), rng.randint(1, 3)))
+        jitter = rng.randint(-2, 2)
+        line_start = max(1, (issue.line_start or 1) + jitter)
+        findings.append(
+            {
+                "file": issue.file,
+                "line_start": line_start,
+                "line_end": max(line_start, (issue.line_end or line_start) + jitter),
+                "severity": issue.severity.value,
+                "category": issue.category,
+                "title": title,
+                "description": f"{issue.description} Related: {', '.join(keywords)}.",
+            }
+        )
+
+    files = sorted({i.file for i in issues}) or ["src/module_0.py"]
+    for _ in range(int(rng.random() * noise + 0.5)):
+        category, severity, title = rng.choice(_FALSE_POSITIVES)
+        line = rng.randint(1, 40)
+        findings.append(
+            {
+                "file": rng.choice(files),
+                "line_start": line,
+                "line_end": line,
+                "severity": severity,
+                "category": category,
+                "title": title,
+                "description": f"{title}. This is a minor maintainability note.",
+            }
+        )
+    rng.shuffle(findings)
+    return findings
+
+
+def format_output(tool: str, findings: list[dict]) -> str:
+    """Render fake findings in the raw output format of *tool*."""
+    if tool == "pr-agent":
+        return _format_pr_agent(findings)
+    if tool == "shippie":
+        return _format_shippie(findings)
+    return _format_llm_review(findings)
+
+
+def _format_llm_review(findings: list[dict]) -> str:
+    if not findings:
+        return "### No Issues Found\n"
+    blocks = []
+    for n, f in enumerate(findings, start=1):
+        blocks.append(
+            f"### Finding {n}\n"
+            f"- **File**: {f['file']}\n"
+            f"- **Lines**: {f['line_start']}-{f['line_end']}\n"
+            f"- **Severity**: {f['severity']}\n"
+            f"- **Category**: {f['category']}\n"
+            f"- **Title**: {f['title']}\n"
+            f"- **Description**: {f['description']}\n"
+        )
+    return "\n".join(blocks)
+
+
+def _format_pr_agent(findings: list[dict]) -> str:
+    lines = [
+        "## PR Reviewer Guide 🔍",
+        "",
+        "| Severity | Location | Issue |",
+        "|---|---|---|",
+    ]
+    for f in findings:
+        description = f"{f['title']}: {f['description']}".replace("|", "/")
+        lines.append(f"| {f['severity']} | `{f['file']}:{f['line_start']}` | {description} |")
+    return "\n".join(lines) + "\n"
+
+
+def _format_shippie(findings: list[dict]) -> str:
+    lines = ["# Shippie review", ""]
+    by_file: dict[str, list[dict]] = {}
+    for f in findings:
+        by_file.setdefault(f["file"], []).append(f)
+    for file_path, file_findings in sorted(by_file.items()):
+        lines.append(f"### `{file_path}`")
+        lines.append("")
+        for f in file_findings:
+            lines.append(f"- Line {f['line_start']}: **{f['title']}** — {f['description']}")
+        lines.append("")
+    return "\n".join(lines)
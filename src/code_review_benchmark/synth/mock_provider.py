@@ -0,0 +1,430 @@
+"""A local stand-in for the Anthropic and OpenAI APIs (``crb mock-provider``).
+
+Serves the parts of the Messages (``POST /v1/messages``) and Chat
+Completions (``POST /v1/chat/completions``) APIs that the reviewers and the
+judge use, streaming or not, so concurrency, rate limiting and retries can
+be load tested without spend. Point the SDKs at it with
+``ANTHROPIC_BASE_URL=http://HOST:PORT`` and ``OPENAI_BASE_URL=http://HOST:PORT/v1``
+(any API key works).
+
+Reviews are canned: the server recognises the challenge from the diff's
+added lines and answers with ``### Finding N`` blocks for its ground-truth
+issues, each found with probability ``recall``, plus false positives, as
+``crb synth`` does for fake run directories. Judge requests get a verdict
+from whether the finding and the issue name the same file. Everything
+random (latency, injected errors, which issues are found) is seeded from
+the request, so the same sequence of requests gets the same answers.
+
+Time to first token is drawn from a latency distribution, the text then
+arrives at ``tokens_per_second``. A request is refused with 429 when it
+would go over the RPM/TPM limits, and a configurable share of requests
+fails with 429 or 529 regardless.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from code_review_benchmark.budget import estimate_tokens
+from code_review_benchmark.models.challenge import Challenge
+from code_review_benchmark.serialization import dumps, loads
+from code_review_benchmark.synth.generator import fake_findings, format_output
+
+# Tokens per streamed event
+_STREAM_CHUNK = 16
+
+# Shortest issue line used to recognise a challenge; shorter ones are too common
+_MIN_LINE = 12
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Seconds to the first token: ``fixed:S``, ``uniform:LO,HI`` or ``lognormal:MEDIAN,SIGMA``."""
+
+    kind: str = "lognormal"
+    a: float = 1.0
+    b: float = 0.5
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyModel:
+        kind, _, params = spec.partition(":")
+        try:
+            values = [float(v) for v in params.split(",")] if params else []
+        except ValueError:
+            raise ValueError(f"bad latency parameters: {spec!r}")
+        if kind == "fixed" and len(values) == 1:
+            return cls(kind, values[0], 0.0)
+        if kind in ("uniform", "lognormal") and len(values) == 2:
+            return cls(kind, *values)
+        raise ValueError(f"expected fixed:S, uniform:LO,HI or lognormal:MEDIAN,SIGMA, got {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.a
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        return self.a * math.exp(rng.gauss(0.0, self.b))
+
+
+@dataclass
+class MockConfig:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    tokens_per_second: float = 0.0  # 0 = the whole response at once
+    rate_429: float = 0.0  # share of requests answered with 429 anyway
+    rate_529: float = 0.0
+    rpm: int = 0  # 0 = no limit
+    tpm: int = 0
+    recall: float = 0.7
+    noise: float = 1.0
+    seed: int = 0
+
+
+@dataclass
+class Reply:
+    status: int
+    text: str = ""
+    error: str = ""  # error type for non-200 replies
+    retry_after: float = 0.0
+    first_token_s: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class RateLimiter:
+    """Sliding one-minute window of requests and tokens."""
+
+    def __init__(self, rpm: int, tpm: int, clock=time.monotonic) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._window: deque[tuple[float, int]] = deque()
+        self._lock = threading.Lock()
+
+    def admit(self, tokens: int) -> float:
+        """Record a request of *tokens*; returns 0, or seconds to wait if over a limit."""
+        if not self.rpm and not self.tpm:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            while self._window and self._window[0][0] <= now - 60:
+                self._window.popleft()
+            used = sum(t for _, t in self._window)
+            if (self.rpm and len(self._window) >= self.rpm) or (
+                self.tpm and self._window and used + tokens > self.tpm
+            ):
+                return max(0.001, self._window[0][0] + 60 - now)
+            self._window.append((now, tokens))
+            return 0.0
+
+
+class MockProvider:
+    """Decides what to answer; the HTTP server just encodes it."""
+
+    def __init__(self, challenges: list[Challenge], config: MockConfig) -> None:
+        self.config = config
+        self.challenges = {c.id: c for c in challenges}
+        self.limiter = RateLimiter(config.rpm, config.tpm)
+        # Replies by status code, and tokens in and out
+        self.stats: dict[str, int] = {}
+        self._seen: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Stripped issue line -> ids of challenges whose ground truth covers it
+        self._lines: dict[str, set[str]] = {}
+        for challenge in challenges:
+            for line in _issue_lines(challenge):
+                self._lines.setdefault(line, set()).add(challenge.id)
+
+    def respond(self, model: str, system: str, user: str) -> Reply:
+        digest = hashlib.sha256(f"{model}\0{system}\0{user}".encode()).hexdigest()
+        with self._lock:
+            occurrence = self._seen.get(digest, 0)
+            self._seen[digest] = occurrence + 1
+        # Errors and latency differ between retries; the content does not
+        rng = random.Random(f"{self.config.seed}:{digest}:{occurrence}")
+        input_tokens = estimate_tokens(system) + estimate_tokens(user)
+
+        reply = self._refusal(rng, input_tokens)
+        if reply is None:
+            content_rng = random.Random(f"{self.config.seed}:{digest}")
+            if "## Ground Truth Issue" in user:
+                text = self.judge_verdict(user)
+            else:
+                text = self.review(user, content_rng)
+            reply = Reply(
+                200,
+                text,
+                first_token_s=self.config.latency.sample(rng),
+                input_tokens=input_tokens,
+                output_tokens=estimate_tokens(text),
+            )
+        self._count(str(reply.status))
+        self._count("input_tokens", reply.input_tokens)
+        self._count("output_tokens", reply.output_tokens)
+        return reply
+
+    def _refusal(self, rng: random.Random, input_tokens: int) -> Reply | None:
+        wait = self.limiter.admit(input_tokens)
+        if wait:
+            return Reply(429, error="rate_limit_error", retry_after=wait)
+        roll = rng.random()
+        if roll < self.config.rate_429:
+            return Reply(429, error="rate_limit_error", retry_after=1.0)
+        if roll < self.config.rate_429 + self.config.rate_529:
+            return Reply(529, error="overloaded_error")
+        return None
+
+    def identify(self, user: str) -> Challenge | None:
+        """The challenge whose issue lines the diff adds most of."""
+        votes: dict[str, int] = {}
+        for line in user.splitlines():
+            if line.startswith("+") and not line.startswith("+++"):
+                for challenge_id in self._lines.get(line[1:].strip(), ()):
+                    votes[challenge_id] = votes.get(challenge_id, 0) + 1
+        if not votes:
+            return None
+        return self.challenges[max(sorted(votes), key=votes.__getitem__)]
+
+    def review(self, user: str, rng: random.Random) -> str:
+        challenge = self.identify(user)
+        if challenge is None:
+            return "### No Issues Found\n"
+        # A sharded review only covers the files in its part of the diff
+        issues = [i for i in challenge.issues if f"+++ b/{i.file}" in user] or challenge.issues
+        findings = fake_findings(rng, issues, self.config.recall, self.config.noise)
+        return format_output("llm-reviewer", findings)
+
+    @staticmethod
+    def judge_verdict(user: str) -> str:
+        files = re.findall(r"\*\*File\*\*:\s*(\S+)", user)
+        matched = len(files) >= 2 and files[0] == files[1]
+        verdict = {
+            "matched": matched,
+            "confidence": 0.85 if matched else 0.15,
+            "explanation": "same file" if matched else "different file",
+        }
+        return dumps(verdict).decode()
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
+
+
+def _issue_lines(challenge: Challenge) -> set[str]:
+    lines: set[str] = set()
+    for issue in challenge.issues:
+        path = challenge.after_dir / issue.file
+        if issue.line_start is None or not path.is_file():
+            continue
+        text = path.read_text(errors="replace").splitlines()
+        for line in text[issue.line_start - 1 : issue.line_end or issue.line_start]:
+            if len(line.strip()) >= _MIN_LINE:
+                lines.add(line.strip())
+    return lines
+
+
+# -- HTTP -------------------------------------------------------------------------
+
+
+def _text(content) -> str:
+    """Text of a message ``content``: a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content or () if isinstance(block, dict))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _MockServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/stats":
+            self._send_json(200, dict(self.server.provider.stats))
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = loads(self.rfile.read(length) or b"{}")
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path.endswith("/messages"):
+            api = "anthropic"
+            system = _text(body.get("system", ""))
+            user = "\n".join(_text(m.get("content")) for m in body.get("messages", ()))
+        elif path.endswith("/chat/completions"):
+            api = "openai"
+            messages = body.get("messages", ())
+            system = "\n".join(_text(m.get("content")) for m in messages if m["role"] == "system")
+            user = "\n".join(_text(m.get("content")) for m in messages if m["role"] != "system")
+        else:
+            self._send_json(404, {"error": {"message": f"unknown endpoint {self.path}"}})
+            return
+
+        model = body.get("model", "")
+        reply = self.server.provider.respond(model, system, user)
+        if reply.status != 200:
+            self._send_error(api, reply)
+            return
+        time.sleep(reply.first_token_s)
+        if body.get("stream"):
+            self._stream(api, model, reply)
+        else:
+            tps = self.server.provider.config.tokens_per_second
+            if tps > 0:
+                time.sleep(reply.output_tokens / tps)
+            self._send_json(200, _completion(api, model, reply))
+
+    def _send_json(self, status: int, payload: dict, headers: dict | None = None) -> None:
+        data = dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, api: str, reply: Reply) -> None:
+        message = "Rate limited" if reply.status == 429 else "Overloaded"
+        if api == "anthropic":
+            payload = {"type": "error", "error": {"type": reply.error, "message": message}}
+        else:
+            payload = {"error": {"type": reply.error, "message": message, "code": reply.status}}
+        headers = {"retry-after": f"{math.ceil(reply.retry_after)}"} if reply.retry_after else {}
+        self._send_json(reply.status, payload, headers)
+
+    def _stream(self, api: str, model: str, reply: Reply) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        tps = self.server.provider.config.tokens_per_second
+        chunks = _chunks(reply.text, _STREAM_CHUNK * 4)
+        events = _stream_events(api, model, reply, chunks)
+        for event, payload in events:
+            if tps > 0 and event == "delta":
+                time.sleep(_STREAM_CHUNK / tps)
+            self._send_event(api, event, payload)
+        if api == "openai":
+            self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_event(self, api: str, event: str, payload: dict) -> None:
+        if api == "anthropic":
+            self.wfile.write(f"event: {payload['type']}\n".encode())
+        self.wfile.write(b"data: " + dumps(payload) + b"\n\n")
+        self.wfile.flush()
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)] or [""]
+
+
+def _completion(api: str, model: str, reply: Reply) -> dict:
+    if api == "anthropic":
+        return {
+            "id": f"msg_mock_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": [{"type": "text", "text": reply.text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": reply.input_tokens, "output_tokens": reply.output_tokens},
+        }
+    return {
+        "id": f"chatcmpl-mock{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": reply.text},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": reply.input_tokens,
+            "completion_tokens": reply.output_tokens,
+            "total_tokens": reply.input_tokens + reply.output_tokens,
+        },
+    }
+
+
+def _stream_events(api: str, model: str, reply: Reply, chunks: list[str]):
+    """``(kind, payload)`` server-sent events for a streamed reply."""
+    if api == "anthropic":
+        message = _completion(api, model, reply)
+        message.update(content=[], stop_reason=None)
+        message["usage"] = {"input_tokens": reply.input_tokens, "output_tokens": 0}
+        yield "start", {"type": "message_start", "message": message}
+        yield (
+            "start",
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+        )
+        for chunk in chunks:
+            delta = {"type": "text_delta", "text": chunk}
+            yield "delta", {"type": "content_block_delta", "index": 0, "delta": delta}
+        yield "stop", {"type": "content_block_stop", "index": 0}
+        yield (
+            "stop",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": reply.output_tokens},
+            },
+        )
+        yield "stop", {"type": "message_stop"}
+        return
+
+    base = {
+        "id": f"chatcmpl-mock{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+    }
+    for n, chunk in enumerate(chunks):
+        delta = {"role": "assistant", "content": chunk} if n == 0 else {"content": chunk}
+        yield "delta", {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+    yield "stop", {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+
+
+class _MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Many SDK clients connect at once at load-test concurrency
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], provider: MockProvider) -> None:
+        super().__init__(address, _Handler)
+        self.provider = provider
+
+
+def make_server(provider: MockProvider, host: str = "127.0.0.1", port: int = 0) -> _MockServer:
+    """An HTTP server for *provider*; call ``serve_forever()`` (port 0 picks a free one)."""
+    return _MockServer((host, port), provider)
+
+
+def load_provider(challenges_dir: Path, config: MockConfig) -> MockProvider:
+    from code_review_benchmark.models.challenge import load_challenges
+
+    return MockProvider(load_challenges(challenges_dir), config)
@@ -0,0 +1,108 @@
+"""Durable task queue interface for distributing benchmark runs.
+
+A run matrix is materialised as one task per (challenge, tool, run index).
+Workers *lease* a task for a limited time, extend the lease with heartbeats
+while the tool runs, and mark it done or failed. A lease that is not renewed
+in time (the worker crashed or lost its node) expires and the task goes back
+to pending, so delivery is at-least-once; task outputs are written to a fixed
+directory, so re-running a task simply overwrites them.
+
+Queue settings shared by ``crb run --queue`` and ``crb worker`` live in
+``queue.json`` inside the run directory.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+QUEUE_CONFIG_FILENAME = "queue.json"
+# The filesystem backend's directory, next to the challenge directories
+QUEUE_DIRNAME = "queue"
+
+# Task states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, LEASED, DONE, FAILED)
+
+
+@dataclass(frozen=True)
+class Task:
+    """One unit of work: a single tool run against a single challenge."""
+
+    challenge_id: str
+    tool: str
+    run_index: int
+
+    @property
+    def task_id(self) -> str:
+        return f"{self.challenge_id}/{self.tool}/run_{self.run_index}"
+
+
+@dataclass
+class Lease:
+    """A task handed to a worker until ``expires_at`` (Unix time)."""
+
+    task: Task
+    worker_id: str
+    expires_at: float
+    attempt: int = 1
+
+
+class AbstractTaskQueue(ABC):
+    """Interface every queue backend must implement."""
+
+    #: Tasks whose lease has expired this many times are marked failed.
+    max_attempts: int = 3
+
+    @abstractmethod
+    def enqueue(self, tasks: list[Task]) -> int:
+        """Add tasks that are not already known. Returns how many were added."""
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_seconds: float) -> Lease | None:
+        """Claim the next pending task, or return None if none is pending.
+
+        Expired leases are re-queued before a task is picked.
+        """
+
+    @abstractmethod
+    def heartbeat(self, lease: Lease, lease_seconds: float) -> bool:
+        """Extend *lease*. Returns False if the worker no longer holds it."""
+
+    @abstractmethod
+    def complete(self, lease: Lease) -> None:
+        """Mark the leased task as done."""
+
+    @abstractmethod
+    def fail(self, lease: Lease, error: str) -> None:
+        """Mark the leased task as failed with *error*."""
+
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """Return expired leases to pending (or failed). Returns how many moved."""
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """Number of tasks in each state."""
+
+    def is_drained(self) -> bool:
+        """True once no task is pending or leased."""
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+
+def open_queue(backend: str, run_dir: Path) -> AbstractTaskQueue:
+    """Open (creating if needed) the *backend* queue stored under *run_dir*."""
+    if backend == "sqlite":
+        from code_review_benchmark.workqueue.sqlite import SQLiteTaskQueue
+
+        return SQLiteTaskQueue(run_dir / "queue.sqlite")
+    if backend == "fs":
+        from code_review_benchmark.workqueue.filesystem import FilesystemTaskQueue
+
+        return FilesystemTaskQueue(run_dir / QUEUE_DIRNAME)
+    raise ValueError(f"Unknown queue backend: {backend}. Available: ['sqlite', 'fs']")
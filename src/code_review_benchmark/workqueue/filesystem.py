@@ -0,0 +1,159 @@
+"""Task queue on a shared filesystem, for workers spread across nodes.
+
+Each task is a small JSON file that moves between ``pending/``, ``leased/``,
+``done/`` and ``failed/`` directories. Claiming a task is an atomic
+``rename`` out of ``pending/``, which only one worker can win, so the queue
+needs nothing beyond a filesystem with atomic rename (local disks, NFS).
+
+Lease expiry uses each node's wall clock; keep worker clocks in sync (NTP)
+and leases much longer than any expected skew.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import quote
+
+from code_review_benchmark.serialization import dumps, loads
+from code_review_benchmark.workqueue.base import (
+    DONE,
+    FAILED,
+    LEASED,
+    PENDING,
+    STATES,
+    AbstractTaskQueue,
+    Lease,
+    Task,
+)
+
+
+class FilesystemTaskQueue(AbstractTaskQueue):
+    """Task queue stored as one file per task under *root*."""
+
+    #: A just-claimed task has not had its new expiry stamped yet, so every
+    #: leased file is treated as live for this long past its last write.
+    claim_grace_seconds: float = 60.0
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        for state in (*STATES, "tmp"):
+            (root / state).mkdir(parents=True, exist_ok=True)
+
+    def enqueue(self, tasks: list[Task]) -> int:
+        added = 0
+        for task in tasks:
+            name = _filename(task)
+            if any((self.root / state / name).exists() for state in STATES):
+                continue
+            self._write(
+                self.root / PENDING / name,
+                {
+                    "challenge_id": task.challenge_id,
+                    "tool": task.tool,
+                    "run_index": task.run_index,
+                    "attempts": 0,
+                },
+            )
+            added += 1
+        return added
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Lease | None:
+        self.requeue_expired()
+        for path in sorted((self.root / PENDING).iterdir()):
+            target = self.root / LEASED / path.name
+            try:
+                # Refresh mtime first so the claim grace period starts now
+                os.utime(path)
+                os.rename(path, target)
+            except FileNotFoundError:
+                continue  # another worker got there first
+
+            data = loads(target.read_bytes())
+            data["worker_id"] = worker_id
+            data["expires_at"] = time.time() + lease_seconds
+            data["attempts"] = data.get("attempts", 0) + 1
+            self._write(target, data)
+            task = Task(data["challenge_id"], data["tool"], data["run_index"])
+            return Lease(task, worker_id, data["expires_at"], data["attempts"])
+        return None
+
+    def heartbeat(self, lease: Lease, lease_seconds: float) -> bool:
+        path = self.root / LEASED / _filename(lease.task)
+        try:
+            data = loads(path.read_bytes())
+        except FileNotFoundError:
+            return False
+        if data.get("worker_id") != lease.worker_id:
+            return False
+        data["expires_at"] = time.time() + lease_seconds
+        self._write(path, data)
+        lease.expires_at = data["expires_at"]
+        return True
+
+    def complete(self, lease: Lease) -> None:
+        self._finish(lease, DONE, None)
+
+    def fail(self, lease: Lease, error: str) -> None:
+        self._finish(lease, FAILED, error)
+
+    def requeue_expired(self) -> int:
+        now = time.time()
+        moved = 0
+        for path in (self.root / LEASED).iterdir():
+            try:
+                data = loads(path.read_bytes())
+                claimed_at = path.stat().st_mtime
+            except (FileNotFoundError, ValueError):
+                continue  # moved away, or caught mid-rewrite
+            expires_at = max(data.get("expires_at") or 0.0, claimed_at + self.claim_grace_seconds)
+            if expires_at >= now:
+                continue
+            exhausted = data.get("attempts", 0) >= self.max_attempts
+            target = self.root / (FAILED if exhausted else PENDING) / path.name
+            try:
+                os.rename(path, target)
+            except FileNotFoundError:
+                continue
+            if exhausted:
+                # Failed is terminal, so rewriting it cannot race a claim. A
+                # re-queued file keeps its stale lease fields until re-leased.
+                data["error"] = "lease expired too many times"
+                self._write(target, data)
+            moved += 1
+        return moved
+
+    def counts(self) -> dict[str, int]:
+        return {
+            state: sum(1 for p in (self.root / state).iterdir() if p.suffix == ".json")
+            for state in STATES
+        }
+
+    def _finish(self, lease: Lease, state: str, error: str | None) -> None:
+        name = _filename(lease.task)
+        data = {
+            "challenge_id": lease.task.challenge_id,
+            "tool": lease.task.tool,
+            "run_index": lease.task.run_index,
+            "attempts": lease.attempt,
+            "worker_id": lease.worker_id,
+        }
+        if error is not None:
+            data["error"] = error
+        self._write(self.root / state / name, data)
+        # If the lease expired and the task was re-queued meanwhile, drop that
+        # copy too; the outputs are already on disk.
+        for other in (LEASED, PENDING):
+            (self.root / other / name).unlink(missing_ok=True)
+
+    def _write(self, path: Path, data: dict) -> None:
+        """Replace *path* atomically via a temp file on the same filesystem."""
+        tmp = self.root / "tmp" / f"{uuid.uuid4().hex}.json"
+        tmp.write_bytes(dumps(data))
+        os.replace(tmp, path)
+
+
+def _filename(task: Task) -> str:
+    return quote(task.task_id, safe="") + ".json"
@@ -0,0 +1,156 @@
+"""SQLite task queue for workers on a single machine.
+
+SQLite's file locking is not reliable over network filesystems, so use the
+``fs`` backend when workers run on several nodes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from code_review_benchmark.workqueue.base import (
+    DONE,
+    FAILED,
+    LEASED,
+    PENDING,
+    STATES,
+    AbstractTaskQueue,
+    Lease,
+    Task,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    challenge_id TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    run_index INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);
+"""
+
+
+class SQLiteTaskQueue(AbstractTaskQueue):
+    """Task queue stored in a single SQLite database file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; writes that must be atomic use explicit transactions
+        self._conn = sqlite3.connect(
+            path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        # Workers heartbeat from a background thread over the same connection
+        self._lock = threading.RLock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, tasks: list[Task]) -> int:
+        with self._transaction():
+            before = self._total()
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tasks (task_id, challenge_id, tool, run_index) "
+                "VALUES (?, ?, ?, ?)",
+                [(t.task_id, t.challenge_id, t.tool, t.run_index) for t in tasks],
+            )
+            return self._total() - before
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Lease | None:
+        now = time.time()
+        with self._transaction():
+            self._requeue_expired(now)
+            row = self._conn.execute(
+                "UPDATE tasks SET status = ?, worker_id = ?, lease_expires = ?, "
+                "attempts = attempts + 1 "
+                "WHERE task_id = (SELECT task_id FROM tasks WHERE status = ? "
+                "ORDER BY rowid LIMIT 1) "
+                "RETURNING challenge_id, tool, run_index, lease_expires, attempts",
+                (LEASED, worker_id, now + lease_seconds, PENDING),
+            ).fetchone()
+        if row is None:
+            return None
+        challenge_id, tool, run_index, expires_at, attempts = row
+        return Lease(Task(challenge_id, tool, run_index), worker_id, expires_at, attempts)
+
+    def heartbeat(self, lease: Lease, lease_seconds: float) -> bool:
+        expires_at = time.time() + lease_seconds
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE tasks SET lease_expires = ? "
+                "WHERE task_id = ? AND status = ? AND worker_id = ?",
+                (expires_at, lease.task.task_id, LEASED, lease.worker_id),
+            )
+        if cur.rowcount:
+            lease.expires_at = expires_at
+        return cur.rowcount > 0
+
+    def complete(self, lease: Lease) -> None:
+        self._finish(lease, DONE, None)
+
+    def fail(self, lease: Lease, error: str) -> None:
+        self._finish(lease, FAILED, error)
+
+    def requeue_expired(self) -> int:
+        with self._transaction():
+            return self._requeue_expired(time.time())
+
+    def counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(STATES, 0)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+        counts.update(rows)
+        return counts
+
+    def _finish(self, lease: Lease, status: str, error: str | None) -> None:
+        # Accept the result even if the lease was lost meanwhile: the outputs
+        # are on disk, and a re-queued copy would only overwrite them.
+        with self._lock:
+            self._conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, lease_expires = NULL "
+                "WHERE task_id = ? AND status != ?",
+                (status, error, lease.task.task_id, DONE),
+            )
+
+    def _requeue_expired(self, now: float) -> int:
+        failed = self._conn.execute(
+            "UPDATE tasks SET status = ?, error = 'lease expired too many times' "
+            "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+            (FAILED, LEASED, now, self.max_attempts),
+        ).rowcount
+        requeued = self._conn.execute(
+            "UPDATE tasks SET status = ?, worker_id = NULL, lease_expires = NULL "
+            "WHERE status = ? AND lease_expires < ?",
+            (PENDING, LEASED, now),
+        ).rowcount
+        return failed + requeued
+
+    def _total(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """``BEGIN IMMEDIATE`` so concurrent workers serialize on the write lock."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
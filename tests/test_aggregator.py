@@ -0,0 +1,80 @@
+"""Tests for batch and streaming aggregation."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from code_review_benchmark.evaluation.aggregator import StreamingAggregator, aggregate_results
+from code_review_benchmark.evaluation.scorer import score_challenge_run
+from code_review_benchmark.models.challenge import load_challenges
+from code_review_benchmark.models.evaluation import MatchResult
+from code_review_benchmark.synth.generator import SynthConfig, generate_challenges
+
+
+def _results(challenges, seed=7):
+    rng = random.Random(seed)
+    results = []
+    for ch in challenges:
+        for tool in ("tool-a", "tool-b"):
+            for run_idx in range(3):
+                matches = [
+                    MatchResult(ground_truth_id=issue.id, matched=rng.random() < 0.6)
+                    for issue in ch.issues
+                ]
+                results.append(
+                    score_challenge_run(ch.id, tool, run_idx, rng.randint(0, 6), matches)
+                )
+    rng.shuffle(results)
+    return results
+
+
+def _strip_timestamp(report):
+    data = report.model_dump()
+    data.pop("timestamp")
+    return data
+
+
+@pytest.mark.parametrize("keep_per_challenge", [True, False])
+def test_streaming_matches_batch(tmp_path: Path, keep_per_challenge: bool):
+    generate_challenges(tmp_path, SynthConfig(num_challenges=12, seed=3, issues=(1, 4)))
+    challenges = load_challenges(tmp_path)
+    results = _results(challenges)
+
+    batch = aggregate_results(results, challenges=challenges)
+    streaming = StreamingAggregator(challenges=challenges, keep_per_challenge=keep_per_challenge)
+    for r in results:
+        streaming.add(r)
+    report = streaming.report()
+
+    expected = _strip_timestamp(batch)
+    actual = _strip_timestamp(report)
+    if not keep_per_challenge:
+        for tool in expected["tools"]:
+            tool["per_challenge"] = []
+
+    for exp_tool, act_tool in zip(expected["tools"], actual["tools"], strict=True):
+        for key in ("mean_precision", "mean_recall", "mean_f1"):
+            assert act_tool.pop(key) == pytest.approx(exp_tool.pop(key), abs=1e-4)
+        for key in ("stddev_precision", "stddev_recall", "stddev_f1"):
+            assert act_tool.pop(key) == pytest.approx(exp_tool.pop(key), abs=1e-4)
+    assert actual == expected
+
+
+def test_reports_keep_per_challenge_means_by_default(tmp_path: Path):
+    generate_challenges(tmp_path, SynthConfig(num_challenges=4, seed=5))
+    challenges = load_challenges(tmp_path)
+    results = _results(challenges)
+    compact = StreamingAggregator(challenges=challenges)
+    for r in results:
+        compact.add(r)
+
+    tool = compact.report().tools[0]
+    runs = [r for r in results if r.tool == tool.tool and r.challenge_id == challenges[0].id]
+    summary = tool.challenge_summaries[0]
+
+    assert tool.per_challenge == []
+    assert [s.challenge_id for s in tool.challenge_summaries] == sorted(c.id for c in challenges)
+    assert summary.runs == len(runs) == 3
+    assert summary.f1 == pytest.approx(sum(r.f1 for r in runs) / 3, abs=1e-4)
+    assert summary.findings == pytest.approx(sum(r.findings for r in runs) / 3, abs=1e-4)
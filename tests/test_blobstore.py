@@ -0,0 +1,95 @@
+"""Tests for the content-addressed output store."""
+
+import shutil
+
+import pytest
+
+from code_review_benchmark.blobstore import (
+    OUTPUT_POINTER,
+    BlobStore,
+    has_output,
+    intern_output,
+    output_digest,
+    output_size,
+    read_output,
+    store_for,
+)
+from code_review_benchmark.layout import iter_run_dirs
+from code_review_benchmark.merge import MergeError, merge_run_dirs
+from code_review_benchmark.serialization import read_json
+
+
+def _run(root, name, text):
+    result_dir = root / "ch-1" / "shippie" / name
+    result_dir.mkdir(parents=True)
+    (result_dir / "output.txt").write_text(text)
+    (result_dir / "meta.json").write_text("{}")
+    return result_dir
+
+
+def test_identical_outputs_are_stored_once(tmp_path):
+    store = store_for(tmp_path)
+    a = _run(tmp_path, "run_0", "## Finding\nsame\n")
+    b = _run(tmp_path, "run_1", "## Finding\nsame\n")
+    c = _run(tmp_path, "run_2", "## Finding\ndifferent\n")
+
+    digests = [intern_output(d, store) for d in (a, b, c)]
+
+    assert digests[0] == digests[1] != digests[2]
+    assert len(list((tmp_path / "blobs").rglob("*.*"))) == 2
+    for d in (a, b, c):
+        assert not (d / "output.txt").exists()
+        assert has_output(d)
+    assert read_json(a / OUTPUT_POINTER)["size"] == output_size(a) == len("## Finding\nsame\n")
+    assert read_output(c, store) == "## Finding\ndifferent\n"
+
+
+def test_plain_output_is_still_read(tmp_path):
+    run = _run(tmp_path, "run_0", "legacy")
+    store = store_for(tmp_path)
+
+    assert read_output(run, store) == "legacy"
+    digest = output_digest(run)
+    assert intern_output(run, store) == digest
+    assert output_digest(run) == digest
+
+
+def test_gzip_blobs_are_deterministic_and_readable_by_any_store(tmp_path):
+    source = tmp_path / "out.txt"
+    source.write_text("x" * 10_000)
+    gz = BlobStore(tmp_path / "blobs", codec="gzip")
+    digest, size = gz.put_file(source)
+    path, codec = gz.find(digest)
+    first = path.read_bytes()
+    path.unlink()
+    gz.put_file(source)
+
+    assert (codec, size) == ("gzip", 10_000)
+    assert path.read_bytes() == first
+    assert BlobStore(tmp_path / "blobs").read_bytes(digest) == b"x" * 10_000
+
+
+def test_merge_links_blobs(tmp_path):
+    for name in ("a", "b"):
+        run = _run(tmp_path / name, "run_0", f"output from {name}")
+        intern_output(run, store_for(tmp_path / name))
+
+    merge_run_dirs([tmp_path / "a", tmp_path / "b"], tmp_path / "out")
+
+    runs = list(iter_run_dirs(tmp_path / "out"))
+    assert [idx for _, _, idx, _ in runs] == [0, 1]
+    store = store_for(tmp_path / "out")
+    assert sorted(read_output(path, store) for *_, path in runs) == [
+        "output from a",
+        "output from b",
+    ]
+
+
+def test_merge_rejects_missing_blob(tmp_path):
+    run = _run(tmp_path / "a", "run_0", "text")
+    intern_output(run, store_for(tmp_path / "a"))
+    shutil.rmtree(tmp_path / "a" / "blobs")
+
+    with pytest.raises(MergeError, match="missing"):
+        merge_run_dirs([tmp_path / "a"], tmp_path / "out")
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,93 @@
+"""Tests for spend estimates and limits."""
+
+import pytest
+
+from code_review_benchmark.budget import JUDGE, REVIEW, SpendGovernor, estimate_tokens, price_for
+from code_review_benchmark.evaluation import llm_judge
+from code_review_benchmark.evaluation.cascade import JudgeCascade
+from code_review_benchmark.models.challenge import GroundTruthIssue, Severity
+from code_review_benchmark.models.evaluation import MatchResult
+from code_review_benchmark.models.finding import NormalizedFinding
+
+
+def test_longest_prefix_price_and_unknown_models():
+    prices = {"gpt-4o": (2.5, 10.0), "gpt-4o-mini": (0.15, 0.6)}
+    assert price_for("gpt-4o-mini-2024-07-18", prices) == (0.15, 0.6)
+    assert price_for("gpt-4o-2024-08-06", prices) == (2.5, 10.0)
+    assert price_for("llama-3", prices) is None
+
+    governor = SpendGovernor(dry_run=True)
+    assert not governor.admit(REVIEW, "llama-3", 1000, 100)
+    assert governor.report().unpriced_models == ["llama-3"]
+    assert governor.spent == 0.0
+
+
+def test_dry_run_counts_without_admitting():
+    governor = SpendGovernor(dry_run=True)
+    for _ in range(3):
+        assert not governor.admit(JUDGE, "claude-sonnet-4-20250514", 1_000_000, 0)
+    assert governor.calls == 3
+    assert governor.spent == pytest.approx(9.0)
+    assert not governor.exhausted
+
+
+def test_limits_stop_all_later_calls():
+    governor = SpendGovernor(max_calls=2)
+    for _ in range(2):
+        assert governor.admit(REVIEW, "gpt-4o", 100, 100)
+        governor.charge(REVIEW, "gpt-4o", 100, 100)
+    assert not governor.admit(REVIEW, "gpt-4o", 100, 100)
+    assert governor.exhausted
+
+    governor = SpendGovernor(max_spend=5.0)
+    assert governor.admit(REVIEW, "gpt-4o", 1_000_000, 0)  # $2.50
+    governor.charge(REVIEW, "gpt-4o", 1_000_000, 0)
+    assert governor.admit(REVIEW, "gpt-4o", 1_000_000, 0)
+    governor.charge(REVIEW, "gpt-4o", 1_000_000, 0)
+    # Even a call that would fit stays refused once the limit was hit
+    assert not governor.admit(REVIEW, "gpt-4o", 1_000_000, 0)
+    assert not governor.admit(REVIEW, "gpt-4o", 1, 0)
+    report = governor.report(skipped=4)
+    assert report.exhausted and report.denied_calls == 2 and report.skipped == 4
+    assert report.cost_usd == pytest.approx(5.0)
+
+
+def test_judge_batch_falls_back_to_heuristics_when_over_budget(monkeypatch):
+    gts = [
+        GroundTruthIssue(
+            id=f"gt-{i}", severity=Severity.HIGH, category="bug", file="a.py", title=f"Bug {i}"
+        )
+        for i in range(3)
+    ]
+    findings = [NormalizedFinding(tool="t", file="a.py", title=f"Bug {i}") for i in range(3)]
+    heuristic = [
+        MatchResult(ground_truth_id=gt.id, finding_index=i, matched=True, match_score=0.5)
+        for i, gt in enumerate(gts)
+    ]
+    monkeypatch.setattr(
+        llm_judge,
+        "llm_judge_match",
+        lambda gt, f, model=None: MatchResult(ground_truth_id=gt.id, matched=True, match_score=1),
+    )
+
+    cascade = JudgeCascade()
+    governor = SpendGovernor(max_calls=1)
+    results = llm_judge.llm_judge_batch(
+        gts,
+        findings,
+        heuristic,
+        model="claude-sonnet-4-20250514",
+        cascade=cascade,
+        governor=governor,
+    )
+
+    assert [r.match_method for r in results] == [
+        "heuristic+llm_judge",
+        "budget_heuristic",
+        "budget_heuristic",
+    ]
+    assert cascade.stats.llm_calls == 1 and cascade.stats.over_budget == 2
+    assert governor.calls == 1
+    assert governor.lines[(JUDGE, "claude-sonnet-4-20250514")].input_tokens > estimate_tokens(
+        "Bug 0"
+    )
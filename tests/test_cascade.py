@@ -0,0 +1,74 @@
+"""Tests for the judge cascade and band calibration."""
+
+import random
+
+from code_review_benchmark.evaluation import llm_judge
+from code_review_benchmark.evaluation.cascade import (
+    JudgeBands,
+    JudgeCascade,
+    calibrate_bands,
+    load_verdicts,
+)
+from code_review_benchmark.models.challenge import GroundTruthIssue, Severity
+from code_review_benchmark.models.evaluation import MatchResult
+from code_review_benchmark.models.finding import NormalizedFinding
+
+
+def _verdicts(n=2000, seed=0):
+    # The judge agrees with the heuristic except in a noisy middle band
+    rng = random.Random(seed)
+    verdicts = []
+    for _ in range(n):
+        h = round(rng.uniform(0.1, 1.0), 3)
+        p_match = 0.02 if h < 0.35 else 0.97 if h > 0.8 else 0.5
+        verdicts.append({"heuristic_score": h, "matched": rng.random() < p_match})
+    return verdicts
+
+
+def test_calibration_meets_target_and_skips_calls():
+    verdicts = _verdicts()
+    calibration = calibrate_bands(verdicts, target_agreement=0.98)
+
+    assert calibration.agreement >= 0.98
+    assert calibration.llm_fraction < 0.7
+    assert calibration.accept_above is not None
+    assert calibration.reject_below < calibration.accept_above
+
+    # Re-check the reported agreement by applying the bands directly
+    wrong = sum(
+        (v["heuristic_score"] < calibration.reject_below and v["matched"])
+        or (v["heuristic_score"] >= calibration.accept_above and not v["matched"])
+        for v in verdicts
+    )
+    assert 1 - wrong / len(verdicts) == calibration.agreement
+
+
+def test_cascade_skips_judge_outside_band(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_judge(gt, finding, model=None):
+        calls.append(gt.id)
+        return MatchResult(ground_truth_id=gt.id, matched=True, match_score=0.9)
+
+    monkeypatch.setattr(llm_judge, "llm_judge_match", fake_judge)
+    gts = [
+        GroundTruthIssue(id=f"gt-{i}", severity=Severity.HIGH, category="x", file="a.py", title="t")
+        for i in range(3)
+    ]
+    findings = [NormalizedFinding(tool="t", title=f"f{i}") for i in range(3)]
+    heuristic = [
+        MatchResult(ground_truth_id="gt-0", finding_index=0, match_score=0.2),
+        MatchResult(ground_truth_id="gt-1", finding_index=1, match_score=0.5),
+        MatchResult(ground_truth_id="gt-2", finding_index=2, match_score=0.95),
+    ]
+    cascade = JudgeCascade(
+        bands=JudgeBands(0.3, 0.9), verdicts_path=tmp_path / "judge_verdicts.jsonl"
+    )
+
+    results = llm_judge.llm_judge_batch(gts, findings, heuristic, cascade=cascade)
+
+    assert calls == ["gt-1"]
+    assert [r.matched for r in results] == [False, True, True]
+    assert [r.match_method for r in results][::2] == ["cascade_reject", "cascade_accept"]
+    assert cascade.stats.llm_calls == 1 and cascade.stats.pairs == 3
+    assert [v["heuristic_score"] for v in load_verdicts([tmp_path])] == [0.5]
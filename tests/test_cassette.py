@@ -0,0 +1,94 @@
+"""Tests for recording and replaying LLM calls."""
+
+import pytest
+
+from code_review_benchmark.cassette import (
+    REPLAY,
+    CassetteMiss,
+    cassette,
+    request_key,
+    start_cassette,
+)
+from code_review_benchmark.evaluation import llm_judge
+
+
+@pytest.fixture(autouse=True)
+def _close_cassette():
+    yield
+    cassette.close()
+
+
+def _request(user: str) -> dict:
+    return {"caller": "test-reviewer", "model": "m", "system": "s", "user": user}
+
+
+def test_replay_serves_recorded_occurrences_in_order(tmp_path):
+    path = tmp_path / "calls.jsonl"
+    responses = iter(["first", "second", "other"])
+    start_cassette(record=str(path), replay=None)
+    assert cassette.call(_request("a"), lambda: next(responses)) == "first"
+    assert cassette.call(_request("a"), lambda: next(responses)) == "second"
+    assert cassette.call(_request("b"), lambda: next(responses)) == "other"
+    assert cassette.summary() == f"Recorded 3 LLM response(s) to {path}"
+    cassette.close()
+
+    def offline():
+        raise AssertionError("replay must not call the provider")
+
+    start_cassette(record=None, replay=str(path))
+    replayed = [cassette.call(_request(user), offline) for user in ("b", "a", "a", "a")]
+
+    # Identical requests get their occurrences in order, then start over
+    assert replayed == ["other", "first", "second", "first"]
+    with pytest.raises(CassetteMiss):
+        cassette.call(_request("never recorded"), offline)
+
+
+def test_replay_latency_waits_for_the_recorded_duration(tmp_path, monkeypatch):
+    path = tmp_path / "calls.jsonl"
+    key = request_key(_request("a"))
+    path.write_text(f'{{"key": "{key}", "occurrence": 0, "latency_s": 1.5, "response": "ok"}}\n')
+    sleeps = []
+    monkeypatch.setattr("code_review_benchmark.cassette.time.sleep", sleeps.append)
+
+    cassette.start(path, REPLAY, latency=True)
+
+    assert cassette.call(_request("a"), lambda: "live") == "ok"
+    assert sleeps == [1.5]
+
+
+def test_conflicting_options_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        start_cassette(record="a.jsonl", replay="b.jsonl")
+    with pytest.raises(ValueError):
+        start_cassette(record=None, replay=str(tmp_path / "missing.jsonl"))
+    with pytest.raises(ValueError):
+        start_cassette(record="a.jsonl", replay=None, latency=True)
+    assert not cassette.active
+
+
+def test_judge_replays_without_a_client(tmp_path, monkeypatch):
+    path = tmp_path / "judge.jsonl"
+
+    class Response:
+        content = [type("Block", (), {"text": '{"matched": true, "confidence": 0.9}'})()]
+
+    class Client:
+        class messages:
+            @staticmethod
+            def create(**kwargs):
+                return Response()
+
+    monkeypatch.setattr(llm_judge, "_get_client", lambda: (Client(), False))
+    start_cassette(record=str(path), replay=None)
+    recorded = llm_judge._call_judge("judge-model", "system", "does it match?")
+    cassette.close()
+
+    def no_client():
+        raise AssertionError("replay must not create a client")
+
+    monkeypatch.setattr(llm_judge, "_get_client", no_client)
+    start_cassette(record=None, replay=str(path))
+
+    assert llm_judge._call_judge("judge-model", "system", "does it match?") == recorded
+    assert recorded["matched"] is True
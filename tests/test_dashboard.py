@@ -0,0 +1,90 @@
+"""Tests for the sharded dashboard export in scripts/update_dashboard.py."""
+
+import importlib.util
+from pathlib import Path
+
+from code_review_benchmark.serialization import loads, read_json
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "update_dashboard.py"
+_spec = importlib.util.spec_from_file_location("update_dashboard", _SCRIPT)
+update_dashboard = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(update_dashboard)
+
+
+def _run(challenge_id: str, f1: float) -> dict:
+    return {
+        "challenge_id": challenge_id,
+        "precision": f1,
+        "recall": f1,
+        "f1": f1,
+        "findings": 2,
+        "matches": [{"matched": True}, {"matched": False}],
+    }
+
+
+def _dashboard(f1: float = 0.5) -> dict:
+    report = {
+        "timestamp": "2026-01-01T00:00:00",
+        "challenges": ["c1", "c2"],
+        "tools": [
+            {
+                "tool": "pr-agent",
+                "mean_precision": f1,
+                "mean_recall": f1,
+                "mean_f1": f1,
+                "per_challenge": [_run("c1", f1), _run("c1", f1), _run("c2", 1.0)],
+            },
+            {
+                "tool": "shippie",
+                "mean_precision": 0.2,
+                "mean_recall": 0.2,
+                "mean_f1": 0.2,
+                "per_challenge": [_run("c1", 0.2), _run("c2", 0.2)],
+            },
+        ],
+    }
+    return update_dashboard.transform_report(report, {})
+
+
+def test_build_shards_indexes_content_hashed_shards():
+    index, shards = update_dashboard.build_shards(_dashboard())
+
+    tool_paths = index["shards"]["tools"]
+    assert set(tool_paths) == {"PR-Agent", "Shippie"}
+    named = {f"shards/{name}" for name in shards}
+    assert set(tool_paths.values()) | {index["shards"]["challenges"]} <= named
+    assert index["metadata"]["ground_truth_issues_count"] == 0
+
+    challenges = loads(shards[index["shards"]["challenges"].removeprefix("shards/")])
+    c1 = next(c for c in challenges["challenges"] if c["id"] == "c1")
+    assert c1["best_tool"] == "PR-Agent"
+    assert c1["avg_f1"] == 0.35
+    assert c1["shard"] in named
+
+    _, again = update_dashboard.build_shards(_dashboard())
+    assert again == shards
+    _, changed = update_dashboard.build_shards(_dashboard(f1=0.6))
+    assert set(changed) != set(shards)
+
+
+def test_write_repairs_truncated_shards_and_prunes_after_the_index(tmp_path: Path):
+    data_dir = tmp_path / "data"
+    index_path = update_dashboard.write_sharded_dashboard(_dashboard(), data_dir)
+    shards_dir = data_dir / "shards"
+    old = {p.name for p in shards_dir.iterdir()}
+    assert old and all(f"{name}.gz" in old for name in old if name.endswith(".json"))
+
+    index = read_json(index_path)
+    truncated = data_dir / index["shards"]["tools"]["Shippie"]
+    full = truncated.read_bytes()
+    truncated.write_bytes(full[:10])
+
+    update_dashboard.write_sharded_dashboard(_dashboard(f1=0.6), data_dir)
+
+    assert truncated.read_bytes() == full
+    index = read_json(index_path)
+    current = {p.name for p in shards_dir.iterdir()}
+    assert not [name for name in current if name.endswith(".tmp")]
+    assert old - current  # the previous pr-agent and challenge shards are gone
+    for path in [*index["shards"]["tools"].values(), index["shards"]["challenges"]]:
+        assert (data_dir / path).exists()
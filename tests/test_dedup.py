@@ -0,0 +1,68 @@
+"""Tests for near-duplicate finding collapse."""
+
+from code_review_benchmark.evaluation.dedup import (
+    SUGGESTED_THRESHOLD,
+    collapse_duplicates,
+    minhash,
+    similarity,
+)
+from code_review_benchmark.models.finding import NormalizedFinding
+
+
+def _finding(title: str, file: str | None = "app/db.py", line: int | None = 42, **kw):
+    return NormalizedFinding(
+        tool="pr-agent", file=file, line_start=line, title=title, description=kw.get("desc", "")
+    )
+
+
+SQL = "SQL injection in user lookup"
+SQL_DESC = "The username is interpolated into the query string without escaping."
+
+
+def test_similarity_tracks_text_overlap():
+    a = minhash({"abc", "bcd", "cde", "def"})
+    assert similarity(a, a) == 1.0
+    assert similarity(a, minhash({"xyz", "yzw"})) < 0.2
+    assert similarity(a, ()) == 0.0
+
+
+def test_table_and_block_copies_collapse_into_the_first():
+    findings = [
+        _finding(SQL, desc=SQL_DESC),
+        _finding("Missing await on save()", file="app/models.py", line=10),
+        _finding("SQL Injection in user lookup!", line=44, desc=SQL_DESC),
+        _finding(SQL, line=None, desc=SQL_DESC + " Use parameters."),
+        _finding(SQL, line=1, desc=SQL_DESC),
+        _finding(SQL, line=3, desc=SQL_DESC),
+    ]
+
+    unique = collapse_duplicates(findings, SUGGESTED_THRESHOLD)
+
+    assert [f.title for f in unique] == [SQL, "Missing await on save()", SQL]
+    assert unique[0].merged_from == [0, 2, 3]
+    assert unique[2].merged_from == [4, 5]
+    assert unique[1].merged_from == []
+    assert findings[0].merged_from == []  # inputs are not modified
+
+
+def test_same_text_elsewhere_is_kept():
+    findings = [
+        _finding(SQL, desc=SQL_DESC),
+        _finding(SQL, file="app/admin.py", desc=SQL_DESC),
+        _finding(SQL, line=300, desc=SQL_DESC),
+    ]
+
+    assert collapse_duplicates(findings, SUGGESTED_THRESHOLD) == findings
+    assert len(collapse_duplicates(findings[:1] * 3, threshold=0)) == 3
+
+
+def test_many_findings_stay_linear():
+    findings = [
+        _finding(f"Unused variable tmp_{i} in handler_{i}", line=i * 50) for i in range(500)
+    ]
+    findings += findings[:10]
+
+    unique = collapse_duplicates(findings, SUGGESTED_THRESHOLD)
+
+    assert len(unique) == 500
+    assert unique[3].merged_from == [3, 503]
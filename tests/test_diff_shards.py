@@ -0,0 +1,141 @@
+"""Tests for sharded review of large diffs."""
+
+import threading
+from pathlib import Path
+
+from code_review_benchmark.parsers.llm_reviewer import LLMReviewerParser
+from code_review_benchmark.runners.base import RunResult
+from code_review_benchmark.runners.diff_shards import merge_reviews, shard_diff, split_files
+from code_review_benchmark.runners.llm_reviewer_base import AbstractLLMReviewer
+
+
+def _file_diff(path: str, hunks: int, lines_per_hunk: int = 10) -> str:
+    text = f"diff --git a/{path} b/{path}\nindex 1111111..2222222 100644\n"
+    text += f"--- a/{path}\n+++ b/{path}\n"
+    for h in range(hunks):
+        text += f"@@ -{h * 100 + 1},3 +{h * 100 + 1},4 @@\n"
+        text += "".join(f"+    value_{h}_{i} = compute({i})\n" for i in range(lines_per_hunk))
+    return text
+
+
+DIFF = _file_diff("app/a.py", 1) + _file_diff("app/b.py", 6) + _file_diff("app/c.py", 1)
+
+
+def _finding(n: int, file: str, lines: str, title: str) -> str:
+    return (
+        f"### Finding {n}\n- **File**: {file}\n- **Lines**: {lines}\n"
+        f"- **Severity**: high\n- **Category**: bug\n- **Title**: {title}\n"
+        f"- **Description**: {title} in {file}.\n"
+    )
+
+
+def test_split_files_keeps_paths_and_hunks():
+    files = split_files(DIFF)
+
+    assert [f.path for f in files] == ["app/a.py", "app/b.py", "app/c.py"]
+    assert len(files[1].hunks) == 6
+    assert "".join(f.text for f in files) == DIFF
+
+
+def test_shards_respect_the_limit_and_cover_the_diff():
+    shards = shard_diff(DIFF, max_tokens=300)
+
+    assert len(shards) > 2
+    assert all(len(shard) / 4 <= 300 for shard in shards)
+    # The oversized file is split between hunks, each piece with its header
+    b_pieces = [s for s in shards if "+++ b/app/b.py" in s]
+    assert len(b_pieces) > 1
+    hunks = [line for s in shards for line in s.splitlines() if line.startswith("@@")]
+    assert len(hunks) == 8
+    assert shard_diff(DIFF, max_tokens=100_000) == [DIFF]
+
+
+def test_merge_renumbers_and_drops_duplicates():
+    first = _finding(1, "app/b.py", "10-14", "SQL injection") + _finding(
+        2, "app/a.py", "3", "Missing await"
+    )
+    second = _finding(1, "app/b.py", "12", "SQL  injection!") + _finding(
+        2, "app/b.py", "120", "SQL injection"
+    )
+
+    merged = merge_reviews([first, "### No Issues Found", second])
+
+    titles = [line for line in merged.splitlines() if line.startswith("### Finding")]
+    assert titles == ["### Finding 1", "### Finding 2", "### Finding 3"]
+    assert merged.count("SQL injection") == 4
+    assert "injection!" not in merged
+    assert "- **Lines**: 12\n" not in merged
+    assert merge_reviews(["### No Issues Found", ""]) == "### No Issues Found"
+
+
+def test_merge_keeps_free_text_shards_after_the_findings():
+    structured = _finding(1, "app/b.py", "10", "SQL injection")
+    freetext = "The retry loop in app/a.py never backs off."
+
+    merged = merge_reviews([freetext, structured, "### No Issues Found"])
+
+    assert merged.startswith("### Finding 1\n")
+    assert merged.endswith("\n\n" + freetext)
+    assert "No Issues Found" not in merged
+    findings = LLMReviewerParser("fake-reviewer").parse(
+        RunResult(tool="fake-reviewer", success=True, output_text=merged)
+    )
+    assert [(f.file, f.title) for f in findings] == [
+        ("app/b.py", "SQL injection"),
+        ("app/a.py", freetext),
+    ]
+
+
+class _FakeReviewer(AbstractLLMReviewer):
+    name = "fake-reviewer"
+    version_command = ["true"]
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return True
+
+    def _resolve_model(self, model):
+        return "fake-model"
+
+    def _call_llm(self, system_prompt, user_prompt, model, timeout):
+        with self._lock:
+            self.prompts.append(user_prompt)
+            self.threads.add(threading.current_thread().name)
+        file = "app/b.py" if "+++ b/app/b.py" in user_prompt else "app/a.py"
+        return _finding(1, file, "1", "Shared problem")
+
+
+def test_sharded_run_reviews_each_shard_with_pr_context(monkeypatch):
+    monkeypatch.setenv("CRB_SHARD_DIFF_TOKENS", "300")
+    monkeypatch.setattr(_FakeReviewer, "_get_pr_title", staticmethod(lambda *a: "Big change"))
+    monkeypatch.setattr(_FakeReviewer, "_get_diff", staticmethod(lambda *a: DIFF))
+    reviewer = _FakeReviewer()
+
+    result = reviewer.run(Path("."), "pr", "main")
+
+    assert result.success
+    count = len(reviewer.prompts)
+    assert count == result.metadata["shards"] > 2
+    assert all("Pull request: Big change" in p for p in reviewer.prompts)
+    assert all("- app/c.py" in p for p in reviewer.prompts)
+    assert any(name.startswith("crb-shard") for name in reviewer.threads)
+    # Every shard reported the same finding for its file; one per file is kept
+    findings = LLMReviewerParser("fake-reviewer").parse(result)
+    assert sorted(f.file for f in findings) == ["app/a.py", "app/b.py"]
+
+
+def test_small_diffs_are_not_sharded(monkeypatch):
+    monkeypatch.setenv("CRB_SHARD_DIFF_TOKENS", "100000")
+    monkeypatch.setattr(_FakeReviewer, "_get_pr_title", staticmethod(lambda *a: ""))
+    monkeypatch.setattr(_FakeReviewer, "_get_diff", staticmethod(lambda *a: DIFF))
+    reviewer = _FakeReviewer()
+
+    result = reviewer.run(Path("."), "pr", "main")
+
+    assert len(reviewer.prompts) == 1
+    assert "shards" not in result.metadata
+    assert "too large" not in reviewer.prompts[0]
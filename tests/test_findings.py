@@ -0,0 +1,68 @@
+"""Tests for stored per-run findings."""
+
+import os
+
+from code_review_benchmark.findings import (
+    FINDINGS_FILENAME,
+    false_positives,
+    read_findings,
+    write_findings,
+)
+from code_review_benchmark.models.evaluation import ChallengeToolResult, MatchResult
+from code_review_benchmark.models.finding import NormalizedFinding
+from code_review_benchmark.serialization import write_json
+
+FINDINGS = [
+    NormalizedFinding(tool="shippie", file="a.py", line_start=3, title="SQL injection"),
+    NormalizedFinding(tool="shippie", title="Rename variable", keywords=["naming"]),
+]
+
+
+def test_round_trip_and_keys(tmp_path):
+    write_findings(tmp_path, FINDINGS, "1", "abc")
+
+    assert read_findings(tmp_path, "1", "abc") == FINDINGS
+    assert read_findings(tmp_path) == FINDINGS
+    assert read_findings(tmp_path, "2", "abc") is None
+    assert read_findings(tmp_path, "1", "def") is None
+    assert read_findings(tmp_path / "missing") is None
+
+
+def test_truncated_file_is_ignored(tmp_path):
+    write_findings(tmp_path, FINDINGS, "1", "abc")
+    path = tmp_path / FINDINGS_FILENAME
+    path.write_bytes(path.read_bytes()[:-20])
+
+    assert read_findings(tmp_path) is None
+
+
+def test_write_does_not_modify_hard_links(tmp_path):
+    source = tmp_path / "source"
+    merged = tmp_path / "merged"
+    source.mkdir()
+    merged.mkdir()
+    write_findings(source, FINDINGS, "1", "abc")
+    os.link(source / FINDINGS_FILENAME, merged / FINDINGS_FILENAME)
+
+    write_findings(merged, FINDINGS[:1], "2", "abc")
+
+    assert read_findings(source, "1") == FINDINGS
+    assert read_findings(merged, "2") == FINDINGS[:1]
+
+
+def test_false_positives(tmp_path):
+    write_findings(tmp_path, FINDINGS, "1", "abc")
+    write_json(
+        tmp_path / "evaluation.json",
+        ChallengeToolResult(
+            challenge_id="ch",
+            tool="shippie",
+            findings=2,
+            matches=[
+                MatchResult(ground_truth_id="gt-1", finding_index=0, matched=True),
+                MatchResult(ground_truth_id="gt-2", finding_index=1, matched=False),
+            ],
+        ),
+    )
+
+    assert false_positives(tmp_path) == [(1, FINDINGS[1])]
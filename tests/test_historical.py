@@ -0,0 +1,109 @@
+"""Tests for the metrics history kept by scripts/process_historical.py."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from code_review_benchmark.serialization import loads, read_json
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "process_historical.py"
+_spec = importlib.util.spec_from_file_location("process_historical", _SCRIPT)
+historical = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(historical)
+
+
+def _report(timestamp: str = "2026-03-02T10:00:00+00:00", f1: float = 0.5) -> dict:
+    return {
+        "timestamp": timestamp,
+        "tools": [
+            {
+                "tool": "pr-agent",
+                "mean_f1": f1,
+                "mean_precision": f1,
+                "mean_recall": f1,
+                "challenge_summaries": [
+                    {"challenge_id": "c1", "runs": 3, "f1": f1, "precision": 1.0, "recall": f1},
+                    {"challenge_id": "c2", "runs": 2, "f1": f1, "precision": f1, "recall": 1.0},
+                ],
+            }
+        ],
+    }
+
+
+def _stored(data_dir: Path) -> list[dict]:
+    store = data_dir / "history" / "metrics.jsonl"
+    return [loads(line) for line in store.read_bytes().splitlines()]
+
+
+def test_extract_records_has_overall_and_per_challenge_points():
+    records = historical.extract_records(_report(), "2026-03-02T10:00:00+00:00")
+
+    assert [(r["challenge"], r["runs"]) for r in records] == [("*", 5), ("c1", 3), ("c2", 2)]
+    assert all(r["date"] == "2026-03-02" and r["tool"] == "pr-agent" for r in records)
+
+    # Reports from before challenge_summaries are grouped from their per-run rows
+    old = {
+        "tool": "pr-agent",
+        "per_challenge": [
+            {"challenge_id": "c1", "f1": 0.2, "precision": 0.2, "recall": 0.2},
+            {"challenge_id": "c1", "f1": 0.4, "precision": 0.4, "recall": 0.4},
+        ],
+    }
+    records = historical.extract_records({"tools": [old]}, "2026-03-02T10:00:00+00:00")
+    assert records[1]["f1_score"] == pytest.approx(0.3)
+    assert records[1]["runs"] == 2
+
+
+def test_update_rollups_sums_buckets_and_keeps_a_trend_window():
+    state: dict = {}
+    dates = ["2026-03-02", "2026-03-03", "2026-04-01", "2026-04-02", "2026-04-06"]
+    for i, date in enumerate(dates):
+        records = historical.extract_records(_report(f1=0.1 * (i + 1)), f"{date}T00:00:00")
+        historical.update_rollups(state, records)
+
+    march = state["rollups"]["monthly"]["2026-03"]["pr-agent"]
+    assert march["count"] == 2
+    assert march["f1_score"] == pytest.approx(0.3)
+    assert state["rollups"]["quarterly"]["2026-Q2"]["pr-agent"]["count"] == 3
+    window = state["trend_windows"]["pr-agent"]
+    assert [round(p["f1_score"], 1) for p in window] == [0.2, 0.3, 0.4, 0.5]
+    assert historical.calculate_trends(state["trend_windows"])["pr-agent"]["direction"] == (
+        "improving"
+    )
+
+
+def test_reprocessing_a_report_records_it_once(tmp_path: Path):
+    report = _report()
+
+    assert historical.record_report(report, tmp_path) == 3
+    assert historical.record_report(report, tmp_path) is None
+
+    assert len(_stored(tmp_path)) == 3
+    state = read_json(tmp_path / "history" / "rollups.json")
+    assert state["total_runs"] == 1
+
+
+def test_an_interrupted_append_is_completed_not_repeated(tmp_path: Path):
+    first = _report("2026-03-02T10:00:00+00:00")
+    second = _report("2026-03-09T10:00:00+00:00", f1=0.7)
+    historical.record_report(first, tmp_path)
+
+    # Stopped after two of the second report's records, the last one half written
+    store = tmp_path / "history" / "metrics.jsonl"
+    records = historical.extract_records(second, second["timestamp"])
+    historical.append_records(store, records[:2])
+    with open(store, "ab") as f:
+        f.write(b'{"timestamp": "2026-03-0')
+
+    assert historical.record_report(second, tmp_path) == 1
+
+    stored = _stored(tmp_path)
+    assert [(r["timestamp"][:10], r["challenge"]) for r in stored[3:]] == [
+        ("2026-03-09", "*"),
+        ("2026-03-09", "c1"),
+        ("2026-03-09", "c2"),
+    ]
+    state = read_json(tmp_path / "history" / "rollups.json")
+    assert state["total_runs"] == 2
+    assert state["rollups"]["monthly"]["2026-03"]["pr-agent"]["count"] == 2
@@ -0,0 +1,174 @@
+"""Tests for multi-model sweep lanes."""
+
+from pathlib import Path
+
+from git import Repo
+
+from code_review_benchmark.challenge_repo.builder import build_challenge_repo
+from code_review_benchmark.challenge_repo.workspace import reaper
+from code_review_benchmark.evaluation.aggregator import StreamingAggregator
+from code_review_benchmark.metrics import TASKS
+from code_review_benchmark.models.challenge import Challenge
+from code_review_benchmark.models.evaluation import ChallengeToolResult
+from code_review_benchmark.runners.base import (
+    AbstractToolRunner,
+    RunContext,
+    RunResult,
+    lane_name,
+    split_lane,
+)
+from code_review_benchmark.runners.claude_reviewer import ClaudeReviewerRunner
+from code_review_benchmark.runners.executor import execute_task, plan_lanes
+from code_review_benchmark.runners.openai_reviewer import OpenAIReviewerRunner
+
+
+def test_lane_names_round_trip():
+    assert lane_name("claude-reviewer", None) == "claude-reviewer"
+    assert split_lane("claude-reviewer") == ("claude-reviewer", None)
+
+    name = lane_name("pr-agent", "openrouter/meta-llama/llama-3@8b")
+    assert "/" not in name
+    assert split_lane(name) == ("pr-agent", "openrouter/meta-llama/llama-3@8b")
+
+
+def test_plan_lanes_skips_models_a_reviewer_would_not_use(monkeypatch):
+    monkeypatch.delenv("CRB_CLAUDE_MODEL", raising=False)
+    monkeypatch.delenv("CRB_OPENAI_MODEL", raising=False)
+    runners = [ClaudeReviewerRunner(), OpenAIReviewerRunner()]
+
+    lanes, skipped = plan_lanes(runners, ["claude-sonnet-4-20250514", "gpt-4o"])
+
+    assert [lane.name for lane in lanes] == [
+        "claude-reviewer@claude-sonnet-4-20250514",
+        "openai-reviewer@gpt-4o",
+    ]
+    assert skipped == ["claude-reviewer@gpt-4o", "openai-reviewer@claude-sonnet-4-20250514"]
+    plain, _ = plan_lanes(runners, None, "gpt-4o")
+    assert [(lane.name, lane.model) for lane in plain] == [
+        ("claude-reviewer", "gpt-4o"),
+        ("openai-reviewer", "gpt-4o"),
+    ]
+
+
+class _ScribblingRunner(AbstractToolRunner):
+    """Leaves a stray file behind and counts how often it computed its diff."""
+
+    name = "scribbler"
+    version_command = ["true"]
+
+    def __init__(self) -> None:
+        self.seen: list[tuple[bool, str]] = []
+        self.diffs = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def run(self, repo_path, pr_branch, main_branch, model=None, context: RunContext = None):
+        stray = repo_path / "stray.txt"
+        self.seen.append((stray.exists(), (repo_path / "hello.txt").read_text()))
+        stray.write_text(model or "")
+        if "diff" not in context.shared:
+            self.diffs += 1
+            context.shared["diff"] = "computed once"
+        return RunResult(tool=self.name, success=True, output_text=f"reviewed with {model}")
+
+
+def _challenge(tmp_path: Path) -> Challenge:
+    for side in ("before", "after"):
+        (tmp_path / side).mkdir(parents=True)
+        (tmp_path / side / "hello.txt").write_text(f"hello {side}")
+    (tmp_path / "challenge.yaml").write_text(
+        "id: test\nname: Test\nlanguage: python\ndifficulty: easy\ncategories: []\n"
+        "pr:\n  title: Test PR\nissues: []\n"
+    )
+    return Challenge.from_yaml(tmp_path / "challenge.yaml")
+
+
+def test_lanes_share_a_reset_repo(tmp_path: Path):
+    challenge = _challenge(tmp_path / "challenge")
+    run_dir = tmp_path / "run"
+    runner = _ScribblingRunner()
+    repo = build_challenge_repo(challenge, base_tmp=tmp_path)
+    try:
+        for model in ("model-a", "model/b"):
+            lane = lane_name(runner.name, model)
+            execute_task(runner, challenge, 0, run_dir, model, lane=lane, repo=repo)
+        assert repo.path.exists()
+    finally:
+        repo.cleanup(wait=True)
+
+    assert runner.seen == [(False, "hello after"), (False, "hello after")]
+    assert runner.diffs == 1
+    assert TASKS.value(tool="scribbler@model%2Fb", status="ok") >= 1
+    lanes = sorted(p.name for p in (run_dir / "test").iterdir())
+    assert lanes == ["scribbler@model%2Fb", "scribbler@model-a"]
+
+
+def test_scores_carry_the_lane_model():
+    aggregator = StreamingAggregator()
+    for tool in ("scribbler@model-a", "scribbler"):
+        aggregator.add(
+            ChallengeToolResult(
+                challenge_id="test",
+                tool=tool,
+                run_index=0,
+                findings=1,
+                precision=1.0,
+                recall=1.0,
+                f1=1.0,
+            )
+        )
+
+    models = {score.tool: score.model for score in aggregator.report().tools}
+    assert models == {"scribbler@model-a": "model-a", "scribbler": None}
+
+
+class _MeddlingRunner(_ScribblingRunner):
+    """Also moves main, adds refs and changes the git config."""
+
+    def run(self, repo_path, pr_branch, main_branch, model=None, context: RunContext = None):
+        repo = Repo(repo_path)
+        repo.git.branch("-f", main_branch, pr_branch)
+        repo.git.tag("left-behind")
+        repo.git.checkout("-b", "scratch")
+        repo.config_writer().set_value("user", "name", "Tool").release()
+        return super().run(repo_path, pr_branch, main_branch, model, context)
+
+
+def test_reset_restores_branches_refs_and_config(tmp_path: Path):
+    challenge = _challenge(tmp_path / "challenge")
+    repo = build_challenge_repo(challenge, base_tmp=tmp_path)
+    main = repo.main_commit
+    try:
+        execute_task(_MeddlingRunner(), challenge, 0, tmp_path / "run", repo=repo)
+        git = Repo(repo.path)
+        assert repo.reusable
+        assert git.active_branch.name == "challenge"
+        assert git.heads["main"].commit.hexsha == main
+        assert sorted(h.name for h in git.heads) == ["challenge", "main"]
+        assert not git.tags
+        assert git.config_reader().get_value("user", "name") == "CRB"
+    finally:
+        repo.cleanup(wait=True)
+
+
+class _LockingRunner(_ScribblingRunner):
+    """Leaves an index.lock behind, as a tool killed mid-commit would."""
+
+    def run(self, repo_path, pr_branch, main_branch, model=None, context: RunContext = None):
+        (repo_path / ".git" / "index.lock").write_text("")
+        return super().run(repo_path, pr_branch, main_branch, model, context)
+
+
+def test_failed_reset_keeps_the_result_and_discards_the_repo(tmp_path: Path):
+    challenge = _challenge(tmp_path / "challenge")
+    run_dir = tmp_path / "run"
+    repo = build_challenge_repo(challenge, base_tmp=tmp_path)
+
+    result = execute_task(_LockingRunner(), challenge, 0, run_dir, "m", repo=repo)
+    reaper.drain()
+
+    assert result.success
+    assert (run_dir / "test" / "scribbler" / "run_0" / "meta.json").exists()
+    assert not repo.reusable
+    assert not repo.path.exists()
@@ -0,0 +1,69 @@
+"""Tests for the character n-gram TF-IDF matcher tier."""
+
+from code_review_benchmark.evaluation.lexical import LexicalIndex, char_ngrams, lexical_scores
+from code_review_benchmark.evaluation.matcher import heuristic_match
+from code_review_benchmark.models.challenge import GroundTruthIssue, Severity
+from code_review_benchmark.models.finding import NormalizedFinding
+
+
+def _gt():
+    return GroundTruthIssue(
+        id="cache-1",
+        severity=Severity.MEDIUM,
+        category="performance",
+        file="src/cache.py",
+        line_start=20,
+        title="Unbounded cache growth",
+        description="Entries are added to a module-level cache but never evicted.",
+        keywords=["memory leak", "eviction"],
+    )
+
+
+def _finding(title, description, line=20):
+    return NormalizedFinding(
+        tool="test", file="src/cache.py", line_start=line, title=title, description=description
+    )
+
+
+def test_char_ngrams_stay_within_words():
+    grams = char_ngrams("Cache grows", ngram_range=(3, 3))
+    assert grams[" ca"] == 1
+    assert grams["ws "] == 1
+    assert "e g" not in grams
+
+
+def test_scores_are_bounded_and_identity_is_one():
+    index = LexicalIndex(["unbounded cache growth", "sql injection"])
+    [row] = index.score(["unbounded cache growth"])
+    assert abs(row[0] - 1.0) < 1e-9
+    assert 0.0 <= row[1] < 0.1
+
+
+def test_paraphrase_outscores_unrelated_finding():
+    paraphrase = _finding("Cache is never bounded", "Cached entries grow forever; evict old ones.")
+    unrelated = _finding("Rename variable", "Consider renaming this variable for clarity.")
+    [[para, other]] = lexical_scores([_gt()], [paraphrase, unrelated])
+    assert para > 2 * other
+
+
+def test_lexical_weight_breaks_ties_in_heuristic_match():
+    # Same file and line, neither uses the curated keywords
+    unrelated = _finding("Rename variable", "Consider renaming this variable for clarity.")
+    paraphrase = _finding("Cache is never bounded", "Cached entries grow forever; evict old ones.")
+    findings = [unrelated, paraphrase]
+
+    assert heuristic_match([_gt()], findings)[0].finding_index == 0  # first wins the tie
+    [result] = heuristic_match(
+        [_gt()],
+        findings,
+        file_weight=0.28,
+        line_weight=0.14,
+        keyword_weight=0.28,
+        lexical_weight=0.3,
+    )
+    assert result.finding_index == 1
+
+
+def test_empty_inputs():
+    assert lexical_scores([_gt()], []) == [[]]
+    assert lexical_scores([], [_finding("a", "b")]) == []
@@ -0,0 +1,112 @@
+"""Tests for the distilled local judge."""
+
+import random
+
+from code_review_benchmark.evaluation import llm_judge
+from code_review_benchmark.evaluation.cascade import JudgeBands, JudgeCascade
+from code_review_benchmark.evaluation.local_judge import (
+    FEATURES,
+    LocalJudge,
+    pair_features,
+    train_local_judge,
+)
+from code_review_benchmark.models.challenge import GroundTruthIssue, Severity
+from code_review_benchmark.models.evaluation import MatchResult
+from code_review_benchmark.models.finding import NormalizedFinding
+
+
+def _verdicts(n=600, seed=0):
+    # The LLM says "match" when file and text agree; heuristic alone is noisy
+    rng = random.Random(seed)
+    verdicts = []
+    for _ in range(n):
+        features = {name: rng.random() for name in FEATURES}
+        signal = features["file"] + features["lexical"] - 1.0
+        matched = signal + rng.gauss(0, 0.1) > 0
+        verdicts.append(
+            {"heuristic_score": features["heuristic"], "matched": matched, "features": features}
+        )
+    return verdicts
+
+
+def test_training_reports_holdout_agreement():
+    verdicts = _verdicts() + [{"heuristic_score": 0.5, "matched": True}]
+    result = train_local_judge(verdicts, holdout=0.25, target_agreement=0.98)
+
+    assert result.skipped == 1
+    assert result.holdout_samples == 150
+    metrics = result.judge.metrics
+    assert metrics["evaluated_on"] == "holdout"
+    assert metrics["accuracy"] > 0.85
+    assert metrics["agreement"] >= 0.98
+    assert 0.3 < metrics["offline_fraction"] < 1.0
+    assert 0.5 <= result.judge.threshold < 1.0
+
+
+def test_model_round_trips(tmp_path):
+    judge = train_local_judge(_verdicts()).judge
+    path = tmp_path / "local_judge.json"
+    judge.save(path)
+    loaded = LocalJudge.load(path)
+
+    features = dict.fromkeys(FEATURES, 0.9)
+    assert loaded.probability(features) == judge.probability(features)
+    assert loaded.decide(features) == (True, judge.probability(features))
+
+
+def test_confident_pairs_skip_the_llm(monkeypatch):
+    gt = GroundTruthIssue(
+        id="gt-1",
+        severity=Severity.HIGH,
+        category="security",
+        file="src/db.py",
+        line_start=10,
+        title="SQL injection",
+        keywords=["sql"],
+    )
+    finding = NormalizedFinding(tool="t", file="src/db.py", line_start=10, title="SQL injection")
+    heuristic = [MatchResult(ground_truth_id="gt-1", finding_index=0, match_score=0.6)]
+
+    judge = LocalJudge(
+        weights=[1.0] + [0.0] * (len(FEATURES) - 1),
+        bias=0.0,
+        means=[0.0] * len(FEATURES),
+        scales=[0.1] * len(FEATURES),
+        threshold=0.99,
+    )
+    calls = []
+    monkeypatch.setattr(
+        llm_judge,
+        "llm_judge_match",
+        lambda gt, f, model=None: (
+            calls.append(gt.id) or MatchResult(ground_truth_id=gt.id, matched=True, match_score=0.9)
+        ),
+    )
+
+    cascade = JudgeCascade(bands=JudgeBands(0.1, None), local_judge=judge)
+    [result] = llm_judge.llm_judge_batch([gt], [finding], heuristic, cascade=cascade)
+    assert result.match_method == "heuristic+local_judge"
+    assert result.matched
+    assert not calls
+    assert cascade.stats.local_decisions == 1 and cascade.stats.llm_calls == 0
+
+    # Unsure: escalated to the LLM
+    judge.threshold = 1.0
+    [result] = llm_judge.llm_judge_batch([gt], [finding], heuristic, cascade=cascade)
+    assert result.match_method == "heuristic+llm_judge"
+    assert calls == ["gt-1"]
+
+
+def test_pair_features_cover_path_and_severity():
+    gt = GroundTruthIssue(
+        id="gt", severity=Severity.HIGH, category="security", file="src/a/db.py", title="x"
+    )
+    finding = NormalizedFinding(
+        tool="t", file="lib/db.py", severity=Severity.MEDIUM, category="Security"
+    )
+    features = pair_features(gt, finding, heuristic_score=0.5, lexical=0.2)
+    assert set(features) == set(FEATURES)
+    assert features["same_basename"] == 1.0
+    assert features["same_directory"] == 0.0
+    assert features["category"] == 1.0
+    assert features["severity"] == 0.75
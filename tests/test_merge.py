@@ -0,0 +1,58 @@
+"""Tests for merging run directories."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from code_review_benchmark.layout import iter_run_dirs
+from code_review_benchmark.merge import MergeError, merge_run_dirs
+from code_review_benchmark.models.challenge import load_challenges
+from code_review_benchmark.serialization import read_json
+from code_review_benchmark.synth.generator import (
+    SynthConfig,
+    generate_challenges,
+    generate_run_dir,
+)
+from code_review_benchmark.workqueue.base import Task, open_queue
+
+
+@pytest.fixture
+def synth(tmp_path: Path):
+    config = SynthConfig(num_challenges=2, seed=5, tools=["shippie"], num_runs=2)
+    generate_challenges(tmp_path / "challenges", config)
+    generate_run_dir(tmp_path / "a", tmp_path / "challenges", config)
+    shutil.copytree(tmp_path / "a", tmp_path / "b")
+    return tmp_path, {ch.id: ch for ch in load_challenges(tmp_path / "challenges")}
+
+
+def test_queue_and_blob_dirs_are_not_challenges(synth):
+    tmp_path, _ = synth
+    src_a = tmp_path / "a"
+    runs = list(iter_run_dirs(src_a))
+    open_queue("fs", src_a).enqueue([Task(runs[0][0], runs[0][1], 0)])
+    (src_a / "blobs").mkdir(exist_ok=True)
+
+    assert list(iter_run_dirs(src_a)) == runs
+
+
+def test_merge_reindexes_collisions(synth):
+    root, challenges = synth
+    result = merge_run_dirs([root / "a", root / "b"], root / "out", challenges=challenges)
+
+    assert len(result.runs) == 8
+    assert result.reindexed == 4
+    runs = list(iter_run_dirs(root / "out"))
+    assert sorted({idx for _, _, idx, _ in runs}) == [0, 1, 2, 3]
+    for _, _, idx, path in runs:
+        assert read_json(path / "meta.json")["run_index"] == idx
+
+
+def test_merge_rejects_changed_challenge(synth):
+    root, challenges = synth
+    ch = next(iter(challenges.values()))
+    (ch.after_dir / "extra.txt").write_text("changed")
+
+    with pytest.raises(MergeError, match="hash"):
+        merge_run_dirs([root / "a"], root / "out", challenges=challenges)
+    assert not (root / "out").exists()
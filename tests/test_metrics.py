@@ -0,0 +1,59 @@
+"""Tests for the Prometheus textfile metrics."""
+
+from code_review_benchmark.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    TextfileExporter,
+)
+
+
+def test_render_counter_gauge_and_escaping():
+    registry = Registry()
+    tasks = registry.add(Counter("crb_tasks_total", "Tasks.", ("tool", "status")))
+    in_flight = registry.add(Gauge("crb_in_flight", "Running."))
+    tasks.inc(tool="shippie", status="ok")
+    tasks.inc(2, tool='we"ird', status="ok")
+    in_flight.inc()
+    in_flight.dec()
+
+    text = registry.render()
+
+    assert "# TYPE crb_tasks_total counter" in text
+    assert 'crb_tasks_total{tool="shippie",status="ok"} 1' in text
+    assert 'crb_tasks_total{tool="we\\"ird",status="ok"} 2' in text
+    assert "crb_in_flight 0" in text
+    assert text.endswith("\n")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    latency = registry.add(Histogram("crb_seconds", "Latency.", ("tool",), buckets=(1, 10)))
+    for value in (0.5, 3, 3, 100):
+        latency.observe(value, tool="a")
+
+    lines = registry.render().splitlines()
+
+    assert 'crb_seconds_bucket{tool="a",le="1"} 1' in lines
+    assert 'crb_seconds_bucket{tool="a",le="10"} 3' in lines
+    assert 'crb_seconds_bucket{tool="a",le="+Inf"} 4' in lines
+    assert 'crb_seconds_sum{tool="a"} 106.5' in lines
+    assert 'crb_seconds_count{tool="a"} 4' in lines
+    assert latency.count(tool="a") == 4
+
+
+def test_exporter_writes_on_start_and_close(tmp_path):
+    registry = Registry()
+    counter = registry.add(Counter("crb_done_total", "Done."))
+    path = tmp_path / "textfile" / "crb.prom"
+    exporter = TextfileExporter(path, interval=3600, source=registry).start()
+    assert "crb_done_total" in path.read_text()
+    assert "crb_done_total 1" not in path.read_text()
+
+    counter.inc()
+    exporter.close()
+    exporter.close()
+
+    assert "crb_done_total 1" in path.read_text()
+    assert [p.name for p in path.parent.iterdir()] == ["crb.prom"]
@@ -0,0 +1,129 @@
+"""Tests for the mock Anthropic/OpenAI provider."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from code_review_benchmark.models.challenge import load_challenges
+from code_review_benchmark.synth.generator import SynthConfig, generate_challenges
+from code_review_benchmark.synth.mock_provider import (
+    LatencyModel,
+    MockConfig,
+    MockProvider,
+    make_server,
+)
+
+
+@pytest.fixture
+def challenges(tmp_path):
+    generate_challenges(tmp_path, SynthConfig(num_challenges=4, seed=3))
+    return load_challenges(tmp_path)
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(provider):
+        server = make_server(provider)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _diff_prompt(challenge) -> str:
+    lines = []
+    for issue in challenge.issues:
+        lines.append(f"+++ b/{issue.file}")
+        text = (challenge.after_dir / issue.file).read_text().splitlines()
+        lines.extend(f"+{line}" for line in text)
+    return "Please review the following diff:\n\n```diff\n" + "\n".join(lines) + "\n```"
+
+
+def _post(url: str, body: dict):
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read().decode()
+
+
+def _fast(**overrides) -> MockConfig:
+    return MockConfig(latency=LatencyModel("fixed", 0.0), **overrides)
+
+
+def test_review_reports_the_recognised_challenge(challenges, serve):
+    url = serve(MockProvider(challenges, _fast(recall=1.0, noise=0.0)))
+    target = challenges[2]
+
+    body = json.loads(
+        _post(
+            f"{url}/v1/messages",
+            {
+                "model": "claude-test",
+                "max_tokens": 4096,
+                "system": "review",
+                "messages": [{"role": "user", "content": _diff_prompt(target)}],
+            },
+        )
+    )
+
+    text = body["content"][0]["text"]
+    assert body["type"] == "message" and body["usage"]["output_tokens"] > 0
+    assert text.count("### Finding") == len(target.issues)
+    for issue in target.issues:
+        assert f"**File**: {issue.file}" in text
+
+
+def test_judge_and_unknown_prompts(challenges):
+    provider = MockProvider(challenges, _fast())
+    same = "## Ground Truth Issue\n- **File**: a.py (lines 1-2)\n## Tool Finding\n- **File**: a.py"
+    other = same.removesuffix("a.py") + "b.py"
+
+    assert json.loads(provider.respond("j", "", same).text)["matched"] is True
+    assert json.loads(provider.respond("j", "", other).text)["matched"] is False
+    assert provider.respond("m", "", "+nothing we know").text == "### No Issues Found\n"
+
+
+def test_rate_limits_and_injected_errors(challenges, serve):
+    limited = serve(MockProvider(challenges, _fast(rpm=1)))
+    overloaded = serve(MockProvider(challenges, _fast(rate_529=1.0)))
+    chat = {"model": "gpt-test", "messages": [{"role": "user", "content": "hi"}]}
+
+    _post(f"{limited}/v1/chat/completions", chat)
+    with pytest.raises(urllib.error.HTTPError) as refused:
+        _post(f"{limited}/v1/chat/completions", chat)
+    assert refused.value.code == 429
+    assert int(refused.value.headers["retry-after"]) > 0
+
+    with pytest.raises(urllib.error.HTTPError) as failed:
+        _post(f"{overloaded}/v1/messages", {"model": "c", "messages": chat["messages"]})
+    assert failed.value.code == 529
+    assert json.loads(failed.value.read())["error"]["type"] == "overloaded_error"
+
+
+def test_streamed_reply_matches_the_plain_one(challenges, serve):
+    url = serve(MockProvider(challenges, _fast(tokens_per_second=100_000)))
+    chat = {
+        "model": "gpt-test",
+        "messages": [
+            {"role": "system", "content": "review"},
+            {"role": "user", "content": _diff_prompt(challenges[0])},
+        ],
+    }
+
+    plain = json.loads(_post(f"{url}/v1/chat/completions", chat))
+    stream = _post(f"{url}/v1/chat/completions", {**chat, "stream": True})
+
+    events = [line[6:] for line in stream.splitlines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    streamed = "".join(json.loads(e)["choices"][0]["delta"].get("content", "") for e in events[:-1])
+    assert streamed == plain["choices"][0]["message"]["content"]
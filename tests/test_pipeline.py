@@ -0,0 +1,148 @@
+"""Tests for per-run evaluation and the background evaluation stage."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from code_review_benchmark.evaluation import pipeline
+from code_review_benchmark.evaluation.aggregator import StreamingAggregator
+from code_review_benchmark.evaluation.cascade import JudgeCascade
+from code_review_benchmark.evaluation.pipeline import EvaluationStage, RunEvaluator
+from code_review_benchmark.findings import read_findings
+from code_review_benchmark.layout import iter_run_dirs
+from code_review_benchmark.models.challenge import load_challenges
+from code_review_benchmark.synth.generator import (
+    SynthConfig,
+    generate_challenges,
+    generate_run_dir,
+)
+
+
+@pytest.fixture
+def synth(tmp_path: Path):
+    config = SynthConfig(num_challenges=3, seed=9, num_runs=2)
+    generate_challenges(tmp_path / "challenges", config)
+    generate_run_dir(tmp_path / "run", tmp_path / "challenges", config)
+    return tmp_path / "run", {ch.id: ch for ch in load_challenges(tmp_path / "challenges")}
+
+
+def _evaluator(run_path, challenges):
+    return RunEvaluator(
+        run_path=run_path,
+        challenges=challenges,
+        cascade=JudgeCascade(),
+        aggregator=StreamingAggregator(challenges=list(challenges.values())),
+        skip_llm=True,
+    )
+
+
+def _scores(report):
+    return [(t.tool, t.mean_f1, t.total_findings, t.total_matched) for t in report.tools]
+
+
+def test_stage_matches_sequential_evaluation(synth):
+    run_path, challenges = synth
+    runs = list(iter_run_dirs(run_path))
+
+    sequential = _evaluator(run_path, challenges)
+    for cid, tool, _, path in runs:
+        sequential.evaluate(challenges[cid], tool, path)
+
+    results = []
+    stage = EvaluationStage(
+        _evaluator(run_path, challenges), backlog=2, on_result=results.append
+    ).start()
+    for cid, tool, _, path in runs:
+        stage.submit(challenges[cid], tool, path)
+    stage.close()
+
+    assert len(results) == len(runs)
+    assert _scores(stage.evaluator.report("", "")) == _scores(sequential.report("", ""))
+    assert all((path / "evaluation.json").exists() for *_, path in runs)
+
+
+def test_submit_blocks_when_backlog_is_full():
+    release = threading.Event()
+
+    class SlowEvaluator:
+        def evaluate(self, challenge, tool, run_dir):
+            release.wait()
+
+    stage = EvaluationStage(SlowEvaluator(), backlog=1).start()
+    stage.submit(None, "t", Path("a"))  # taken by the worker, which then waits
+    stage.submit(None, "t", Path("b"))  # fills the backlog
+    third = threading.Thread(target=stage.submit, args=(None, "t", Path("c")))
+    third.start()
+    third.join(timeout=0.2)
+    assert third.is_alive()
+
+    release.set()
+    third.join(timeout=5)
+    stage.close()
+    assert not third.is_alive()
+
+
+def test_stage_continues_after_an_error(synth):
+    run_path, challenges = synth
+    (cid, tool, _, path), *_ = iter_run_dirs(run_path)
+    errors = []
+    stage = EvaluationStage(
+        _evaluator(run_path, challenges), on_error=lambda p, e: errors.append(p)
+    ).start()
+
+    stage.submit(challenges[cid], "no-such-tool", path)
+    stage.submit(challenges[cid], tool, path)
+    stage.close()
+
+    assert errors == [path]
+    assert stage.errors == 1
+    assert (path / "evaluation.json").exists()
+
+
+def test_repeated_findings_are_collapsed_before_matching(synth):
+    run_path, challenges = synth
+    cid, tool, _, path = next(run for run in iter_run_dirs(run_path) if run[1] == "claude-reviewer")
+    output = path / "output.txt"
+    single = _evaluator(run_path, challenges).evaluate(challenges[cid], tool, path).scored
+    if single.findings == 0:
+        pytest.skip("run has no findings to repeat")
+    output.write_text(output.read_text() * 2)
+
+    raw = _evaluator(run_path, challenges)
+    collapsing = _evaluator(run_path, challenges)
+    collapsing.dedup_threshold = 0.6
+
+    assert raw.evaluate(challenges[cid], tool, path).scored.findings == 2 * single.findings
+    scored = collapsing.evaluate(challenges[cid], tool, path).scored
+    assert scored.findings == single.findings
+    assert scored.precision == single.precision
+    assert collapsing.collapsed == single.findings
+    assert read_findings(path)[0].merged_from[1] == single.findings
+    assert raw.report("judge", "").dedup_threshold == 0
+    assert collapsing.report("judge", "").dedup_threshold == 0.6
+
+
+def test_memo_keeps_recent_pairs_across_rounds(synth, monkeypatch):
+    run_path, challenges = synth
+    runs = list(iter_run_dirs(run_path))
+    # Give every run of each pair the same output, so all but the first are reused
+    for cid, tool, _, path in runs:
+        first = run_path / cid / tool / "run_0" / "output.txt"
+        (path / "output.txt").write_bytes(first.read_bytes())
+    pairs = list(dict.fromkeys((cid, tool) for cid, tool, *_ in runs))
+    monkeypatch.setattr(pipeline, "MEMO_PAIRS", 2)
+
+    # A first round over every pair, then a second over a few still unsettled,
+    # as `crb run --runs auto` hands them over
+    evaluator = _evaluator(run_path, challenges)
+    for cid, tool, idx, path in runs:
+        if idx == 0:
+            evaluator.evaluate(challenges[cid], tool, path)
+    assert list(evaluator._memo) == pairs[-2:]
+    for cid, tool in [*pairs[-2:], pairs[0]]:
+        evaluator.evaluate(challenges[cid], tool, run_path / cid / tool / "run_1")
+
+    # The pairs still remembered from the first round reuse its results
+    assert len(pairs) > 3
+    assert evaluator.reused == 2
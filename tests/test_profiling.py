@@ -0,0 +1,63 @@
+"""Tests for phase spans and the Chrome trace export."""
+
+from code_review_benchmark.profiling import Profiler
+from code_review_benchmark.serialization import read_json
+
+
+def test_disabled_spans_are_shared_no_ops():
+    profiler = Profiler()
+
+    assert profiler.span("a") is profiler.span("b", tool="x")
+    with profiler.span("a"):
+        pass
+    assert profiler.events == []
+    assert profiler.finish() == []
+
+
+def test_trace_events_nest(tmp_path):
+    profiler = Profiler()
+    profiler.start("evaluate")
+    profiler.output_dir = tmp_path
+    with profiler.span("parse", tool="shippie"):
+        with profiler.span("read_json", cat="io"):
+            pass
+
+    written = profiler.finish()
+
+    assert written == [tmp_path / "profile-evaluate.trace.json"]
+    trace = read_json(written[0])
+    events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert set(events) == {"evaluate", "parse", "read_json"}
+    outer, inner = events["parse"], events["read_json"]
+    assert outer["args"] == {"tool": "shippie"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert any(e["ph"] == "M" for e in trace["traceEvents"])
+    assert trace["otherData"]["phases"]["parse"]["calls"] == 1
+    assert not profiler.enabled
+
+
+def test_memory_peaks_and_cpu_stats(tmp_path):
+    profiler = Profiler()
+    profiler.start("run", cpu=True, memory=True)
+    profiler.output_dir = tmp_path
+    with profiler.span("outer"):
+        with profiler.span("allocate"):
+            block = bytearray(4 << 20)
+        del block
+
+    written = profiler.finish()
+
+    assert (tmp_path / "profile-run.pstats") in written
+    phases = read_json(tmp_path / "profile-run.trace.json")["otherData"]["phases"]
+    assert phases["allocate"]["peak_kib"] >= 4096
+    # The child's peak counts towards its parent's
+    assert phases["outer"]["peak_kib"] >= phases["allocate"]["peak_kib"]
+
+
+def test_no_output_dir_writes_nothing(tmp_path):
+    profiler = Profiler()
+    profiler.start("evaluate")
+
+    assert profiler.finish() == []
+    assert list(tmp_path.iterdir()) == []
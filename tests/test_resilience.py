@@ -0,0 +1,108 @@
+"""Tests for LLM call retries and hedging."""
+
+import threading
+import time
+
+import pytest
+
+from code_review_benchmark.runners.base import RunResult
+from code_review_benchmark.runners.executor import write_run_outputs
+from code_review_benchmark.runners.resilience import (
+    MIN_HEDGE_SAMPLES,
+    CallStats,
+    LatencyTracker,
+    ResiliencePolicy,
+    call_resilient,
+    is_retryable,
+)
+from code_review_benchmark.serialization import read_json
+
+
+class Overloaded(Exception):
+    status_code = 529
+
+
+class BadRequest(Exception):
+    status_code = 400
+
+
+def test_retryable_classification():
+    assert is_retryable(Overloaded())
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(BadRequest())
+    assert not is_retryable(ValueError("bad"))
+
+
+def test_transient_errors_are_retried_with_backoff():
+    outcomes = [Overloaded(), Overloaded(), "review"]
+    sleeps = []
+
+    def call():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    stats = CallStats()
+    policy = ResiliencePolicy(max_attempts=3, base_delay=1.0)
+    assert call_resilient(call, "k", stats, policy, LatencyTracker(), sleeps.append) == "review"
+    assert stats.attempts == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+
+
+def test_permanent_errors_are_not_retried():
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise BadRequest()
+
+    stats = CallStats()
+    with pytest.raises(BadRequest):
+        call_resilient(call, "k", stats, ResiliencePolicy(max_attempts=5), sleep=lambda s: None)
+    assert len(calls) == 1 and stats.attempts == 1
+
+
+def test_hedge_wins_when_first_request_stalls():
+    release = threading.Event()
+    started = []
+
+    def call():
+        started.append(1)
+        if len(started) == 1:
+            release.wait(5)  # the stalled first request
+            return "slow"
+        return "fast"
+
+    stats = CallStats()
+    policy = ResiliencePolicy(hedge="0.05")
+    try:
+        result = call_resilient(call, "k", stats, policy, LatencyTracker())
+    finally:
+        release.set()
+    assert result == "fast"
+    assert stats.hedges == 1 and stats.hedge_won
+    assert 0.05 <= stats.latency_s < 2
+
+
+def test_p95_hedge_needs_samples():
+    tracker = LatencyTracker()
+    for i in range(MIN_HEDGE_SAMPLES - 1):
+        tracker.add("k", 1.0)
+    assert tracker.p95("k") is None
+    for i in range(100):
+        tracker.add("k", float(i))
+    assert 90 <= tracker.p95("k") <= 99
+
+    stats = CallStats()
+    start = time.monotonic()
+    assert call_resilient(lambda: "ok", "k", stats, ResiliencePolicy(hedge="p95"), tracker) == "ok"
+    assert stats.hedges == 0 and time.monotonic() - start < 1
+
+
+def test_call_stats_reach_meta_json(tmp_path):
+    result = RunResult(tool="t", success=True, output_text="x", metadata=CallStats(2).as_meta())
+    write_run_outputs(tmp_path, result, model="m", run_index=0)
+    meta = read_json(tmp_path / "meta.json")
+    assert meta["attempts"] == 2 and meta["hedges"] == 0 and meta["tool"] == "t"
@@ -0,0 +1,69 @@
+"""Tests for adaptive run counts (`crb run --runs auto`)."""
+
+import math
+
+import pytest
+
+from code_review_benchmark.evaluation.aggregator import StreamingAggregator, aggregate_results
+from code_review_benchmark.evaluation.sequential import SequentialRuns, ci_half_width
+from code_review_benchmark.models.evaluation import ChallengeToolResult
+
+
+def _scored(challenge_id: str, tool: str, f1: float, run_index: int = 0) -> ChallengeToolResult:
+    return ChallengeToolResult(
+        challenge_id=challenge_id, tool=tool, run_index=run_index, f1=f1, precision=f1, recall=f1
+    )
+
+
+def test_ci_half_width():
+    assert ci_half_width([0.5]) == math.inf
+    assert ci_half_width([0.7, 0.7, 0.7]) == 0.0
+    # t(0.975, 3) * stdev / sqrt(4)
+    assert ci_half_width([0.2, 0.4, 0.6, 0.8]) == pytest.approx(3.182 * 0.2582 / 2, rel=1e-3)
+
+
+def test_stable_pairs_stop_and_noisy_ones_get_more_runs():
+    sequential = SequentialRuns(target=0.05, min_runs=2, max_runs=10)
+    stable, noisy = ("c1", "tool"), ("c2", "tool")
+
+    first = sequential.schedule([stable, noisy])
+    assert first == {stable: range(0, 2), noisy: range(0, 2)}
+    for f1 in (0.8, 0.8):
+        sequential.record(_scored("c1", "tool", f1))
+    for f1 in (0.4, 0.9):
+        sequential.record(_scored("c2", "tool", f1))
+
+    second = sequential.schedule([stable, noisy])
+    # Far from the target: jumps straight to the cap instead of one run at a time
+    assert second == {noisy: range(2, 10)}
+    for f1 in (0.5, 0.8, 0.6, 0.9, 0.4, 0.7, 0.5, 0.8):
+        sequential.record(_scored("c2", "tool", f1))
+
+    assert sequential.schedule([stable, noisy]) == {}
+    assert sequential.unsettled() == [noisy]
+    assert "12 run(s) over 2 pair(s); 1 settled before 10 runs" in sequential.summary()
+
+
+def test_unscored_pairs_are_not_extended():
+    sequential = SequentialRuns(target=0.05)
+    sequential.schedule(["pair"])
+
+    assert sequential.schedule(["pair"]) == {}
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        SequentialRuns(target=0)
+    with pytest.raises(ValueError):
+        SequentialRuns(min_runs=3, max_runs=2)
+
+
+def test_reports_record_runs_per_pair():
+    results = [_scored("c1", "tool", 0.5, i) for i in range(2)]
+    results += [_scored("c2", "tool", 0.5, i) for i in range(5)]
+    streaming = StreamingAggregator()
+    for result in results:
+        streaming.add(result)
+
+    for report in (streaming.report(), aggregate_results(results)):
+        assert report.tools[0].runs_per_challenge == {"c1": 2, "c2": 5}
@@ -0,0 +1,35 @@
+"""Tests for the JSON serialization layer."""
+
+from code_review_benchmark import serialization
+from code_review_benchmark.evaluation.scorer import score_challenge_run
+from code_review_benchmark.models.evaluation import ChallengeToolResult, MatchResult
+
+
+def test_model_round_trip(tmp_path):
+    scored = score_challenge_run(
+        "c1", "tool", 0, 1, [MatchResult(ground_truth_id="a", matched=True, match_score=1.0)]
+    )
+    path = tmp_path / "evaluation.json"
+    serialization.write_json(path, scored)
+    assert b"\n" not in path.read_bytes()
+    assert serialization.read_model(path, ChallengeToolResult) == scored
+
+
+def test_stdlib_fallback_matches(monkeypatch):
+    data = {"b": [1, 2.5, None], "a": "ü"}
+    fast = serialization.dumps(data, sort_keys=True)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.dumps(data, sort_keys=True) == fast
+    assert serialization.loads(fast) == data
+    assert serialization.dumps(data, pretty=True).count(b"\n") > 1
+
+
+def test_sort_keys_applies_to_models(monkeypatch):
+    scored = score_challenge_run("c1", "tool", 0, 1, [MatchResult(ground_truth_id="a")])
+    encoded = serialization.dumps(scored, sort_keys=True)
+
+    keys = list(serialization.loads(encoded))
+    assert keys == sorted(keys)
+    assert serialization.loads(encoded) == serialization.loads(serialization.dumps(scored))
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.dumps(scored, sort_keys=True) == encoded
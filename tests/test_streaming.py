@@ -0,0 +1,110 @@
+"""Tests for streaming tool output to disk."""
+
+import sys
+
+from code_review_benchmark.runners.base import RunContext
+from code_review_benchmark.runners.executor import write_run_outputs
+from code_review_benchmark.runners.streaming import (
+    TAIL_BYTES,
+    append_files,
+    file_markers,
+    has_text,
+    output_paths,
+    run_streaming,
+    streamed_result,
+)
+
+_NOISY = """
+import sys
+for i in range(20000):
+    print(f"line {i} " + "x" * 40)
+sys.stderr.write("warn\\nTraceback (most recent call last)\\n")
+"""
+
+
+def test_output_is_streamed_with_bounded_tails(tmp_path):
+    counts = []
+    proc = run_streaming(
+        [sys.executable, "-c", _NOISY],
+        tmp_path / "out.txt",
+        tmp_path / "err.txt",
+        cwd=tmp_path,
+        markers=("Traceback (most recent call last)", "| ERROR"),
+        ignore_case=("no changes found",),
+        on_output=counts.append,
+    )
+
+    assert proc.returncode == 0 and not proc.timed_out
+    text = (tmp_path / "out.txt").read_text()
+    assert text.count("\n") == 20000 and text.startswith("line 0 ")
+    assert len(proc.stdout_tail) <= TAIL_BYTES
+    assert proc.stdout_tail.endswith("line 19999 " + "x" * 40 + "\n")
+    assert proc.lines == 20002 and counts[-1] == 20002
+    assert proc.stderr_markers == {"Traceback (most recent call last)"}
+    assert not proc.stdout_markers
+
+
+def test_timeout_kills_the_process_group(tmp_path):
+    script = (
+        "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', "
+        "'import time; time.sleep(30)']); print('started', flush=True); time.sleep(30)"
+    )
+    proc = run_streaming(
+        [sys.executable, "-c", script],
+        tmp_path / "out.txt",
+        tmp_path / "err.txt",
+        cwd=tmp_path,
+        timeout=1,
+    )
+    assert proc.timed_out
+    assert (tmp_path / "out.txt").read_text() == "started\n"
+
+
+def test_standalone_runs_keep_output_in_memory(tmp_path):
+    with output_paths(None) as (out, err):
+        proc = run_streaming([sys.executable, "-c", "print('review')"], out, err, cwd=tmp_path)
+        result = streamed_result(None, out, proc, tool="t", success=True)
+    assert result.output_text == "review\n" and not result.streamed
+
+
+def test_streamed_outputs_are_not_overwritten(tmp_path):
+    context = RunContext(tmp_path / "run_0")
+    with output_paths(context) as (out, err):
+        proc = run_streaming([sys.executable, "-c", "print('review')"], out, err, cwd=tmp_path)
+        extra = tmp_path / "review.md"
+        extra.write_text("## Finding\n")
+        append_files(out, [extra])
+        result = streamed_result(context, out, proc, tool="t", success=has_text(out))
+
+    assert result.streamed and result.output_text == ""
+    write_run_outputs(context.result_dir, result, model=None, run_index=0)
+    assert (context.result_dir / "output.txt").read_text() == "review\n\n## Finding\n"
+    assert (context.result_dir / "meta.json").exists()
+
+
+def test_has_text(tmp_path):
+    blank = tmp_path / "blank"
+    blank.write_text("  \n\n")
+    assert not has_text(blank)
+    blank.write_text("  \nx")
+    assert has_text(blank)
+
+
+def test_markers_match_case_sensitively_unless_asked(tmp_path):
+    script = "print('| Error handling | missing try |'); print('No Changes', 'Found')"
+    proc = run_streaming(
+        [sys.executable, "-c", script],
+        tmp_path / "out.txt",
+        tmp_path / "err.txt",
+        cwd=tmp_path,
+        markers=("| ERROR",),
+        ignore_case=("no changes found",),
+    )
+
+    assert proc.stdout_markers == {"no changes found"}
+    review = tmp_path / "review.md"
+    review.write_text("x" * 65_530 + "NO CHANGES FOUND\n| ERROR")
+    assert file_markers(review, ("| ERROR", "| Error"), ("no changes found",)) == {
+        "| ERROR",
+        "no changes found",
+    }
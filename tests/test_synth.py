@@ -0,0 +1,68 @@
+"""Tests for synthetic challenge generation."""
+
+from pathlib import Path
+
+from code_review_benchmark.models.challenge import load_challenges
+from code_review_benchmark.parsers.llm_reviewer import LLMReviewerParser
+from code_review_benchmark.parsers.pr_agent import PRAgentParser
+from code_review_benchmark.parsers.shippie import ShippieParser
+from code_review_benchmark.runners.base import RunResult
+from code_review_benchmark.synth.generator import (
+    SynthConfig,
+    format_output,
+    generate_challenges,
+    generate_run_dir,
+)
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    return {str(p.relative_to(root)): p.read_text() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_generation_is_deterministic(tmp_path: Path):
+    config = SynthConfig(num_challenges=5, seed=42, num_runs=2)
+    for name in ("a", "b"):
+        generate_challenges(tmp_path / name / "challenges", config)
+        generate_run_dir(tmp_path / name / "run", tmp_path / name / "challenges", config)
+
+    assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+
+
+def test_ground_truth_lines_point_at_injected_code(tmp_path: Path):
+    config = SynthConfig(num_challenges=10, seed=1, issues=(2, 4))
+    generate_challenges(tmp_path, config)
+
+    challenges = load_challenges(tmp_path)
+    assert len(challenges) == 10
+    for ch in challenges:
+        assert 2 <= len(ch.issues) <= 4
+        for issue in ch.issues:
+            after = (ch.after_dir / issue.file).read_text().splitlines()
+            assert 1 <= issue.line_start <= issue.line_end <= len(after)
+            assert after[issue.line_start - 1].strip()
+
+
+def test_outputs_round_trip_through_parsers():
+    findings = [
+        {
+            "file": "src/module_0.ts",
+            "line_start": 4,
+            "line_end": 6,
+            "severity": "high",
+            "category": "security",
+            "title": "SQL injection via string interpolation",
+            "description": "User input is interpolated into SQL.",
+        }
+    ]
+    parsers = {
+        "claude-reviewer": LLMReviewerParser("claude-reviewer"),
+        "pr-agent": PRAgentParser(),
+        "shippie": ShippieParser(),
+    }
+    for tool, parser in parsers.items():
+        parsed = parser.parse(
+            RunResult(tool=tool, success=True, output_text=format_output(tool, findings))
+        )
+        assert len(parsed) == 1, tool
+        assert parsed[0].file == "src/module_0.ts"
+        assert parsed[0].line_start == 4
@@ -0,0 +1,54 @@
+"""Tests for the durable task queue backends."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from code_review_benchmark.workqueue.base import DONE, FAILED, PENDING, Task, open_queue
+
+
+@pytest.fixture(params=["sqlite", "fs"])
+def task_queue(request, tmp_path: Path):
+    q = open_queue(request.param, tmp_path)
+    if request.param == "fs":
+        q.claim_grace_seconds = 0.0
+    return q
+
+
+def _tasks(n: int) -> list[Task]:
+    return [Task(f"ch-{i}", "tool", 0) for i in range(n)]
+
+
+def test_enqueue_is_idempotent(task_queue):
+    assert task_queue.enqueue(_tasks(3)) == 3
+    assert task_queue.enqueue(_tasks(4)) == 1
+    assert task_queue.counts()[PENDING] == 4
+
+
+def test_lease_complete_and_drain(task_queue):
+    task_queue.enqueue(_tasks(2))
+    seen = set()
+    while (lease := task_queue.lease("w1", 60)) is not None:
+        assert task_queue.heartbeat(lease, 60)
+        task_queue.complete(lease)
+        seen.add(lease.task)
+    assert seen == set(_tasks(2))
+    assert task_queue.counts()[DONE] == 2
+    assert task_queue.is_drained()
+
+
+def test_expired_lease_is_requeued_then_failed(task_queue):
+    task_queue.max_attempts = 2
+    task_queue.enqueue(_tasks(1))
+
+    first = task_queue.lease("crashed", 0.01)
+    time.sleep(0.05)
+    second = task_queue.lease("w2", 0.01)
+    assert second is not None and second.task == first.task and second.attempt == 2
+    assert not task_queue.heartbeat(first, 60)
+
+    time.sleep(0.05)
+    assert task_queue.lease("w3", 60) is None
+    assert task_queue.counts()[FAILED] == 1
+    assert task_queue.is_drained()
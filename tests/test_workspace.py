@@ -0,0 +1,58 @@
+"""Tests for scratch workspace placement, background deletion and orphan sweeping."""
+
+import os
+import subprocess
+import sys
+import time
+
+from code_review_benchmark.challenge_repo.workspace import (
+    ORPHAN_AGE_SECONDS,
+    Reaper,
+    resolve_workdir,
+    sweep_orphans,
+    workspace_prefix,
+)
+
+
+def _dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_resolve_workdir(tmp_path):
+    assert resolve_workdir("tmp") is None
+    custom = tmp_path / "scratch"
+    assert resolve_workdir(str(custom)) == custom and custom.is_dir()
+    # No tmpfs has this much room, so auto falls back to the system temp dir
+    assert resolve_workdir("auto", min_free=1 << 60) is None
+
+
+def test_sweep_removes_only_orphans(tmp_path):
+    mine = tmp_path / f"{workspace_prefix('ch-1')}abc"
+    dead = tmp_path / f"crb-{_dead_pid()}-ch-1-def"
+    old_style = tmp_path / "crb-ch-2-old"
+    fresh_style = tmp_path / "crb-ch-3-new"
+    unrelated = tmp_path / "other-dir"
+    for d in (mine, dead, old_style, fresh_style, unrelated):
+        d.mkdir()
+    stale = time.time() - ORPHAN_AGE_SECONDS - 10
+    os.utime(old_style, (stale, stale))
+
+    assert sweep_orphans(tmp_path) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [mine.name, fresh_style.name, unrelated.name]
+    )
+
+
+def test_reaper_deletes_in_background(tmp_path):
+    reaper = Reaper()
+    dirs = []
+    for i in range(5):
+        d = tmp_path / f"crb-{i}"
+        (d / "sub").mkdir(parents=True)
+        (d / "sub" / "f").write_text("x")
+        dirs.append(d)
+        reaper.discard(d)
+    reaper.drain()
+    assert not any(d.exists() for d in dirs)